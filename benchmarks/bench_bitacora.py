@@ -0,0 +1,93 @@
+"""
+Compara reproducir un archivo de reservas desde CSV contra hacerlo desde la bitácora
+binaria: lectura más pagos exactos en lote. También mide la reproducción completa
+(redondeo y forma de pago) de la bitácora: de a una sesión con
+flujo.liquidar_reservas contra Bitacora.liquidar, que pasa los bloques al lote.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_bitacora [sesiones]
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.bitacora import Bitacora, convertir_csv
+from split_paddle.flujo import COLUMNAS_CSV, leer_reservas_csv, liquidar_reservas
+from split_paddle.lote import calcular_pagos_en_lote, columnas_desde_sesiones
+from split_paddle.registros import a_json
+
+
+def escribir_csv(sesiones, ruta):
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(COLUMNAS_CSV)
+        for numero, sesion in enumerate(sesiones):
+            for jugador in sesion["jugadores"]:
+                escritor.writerow(
+                    [
+                        numero,
+                        sesion["hora_inicio"],
+                        sesion["hora_fin"],
+                        sesion["monto_total"],
+                        jugador["nombre"],
+                        jugador["llegada"],
+                        jugador["salida"],
+                    ]
+                )
+
+
+def medir(cantidad):
+    sesiones = generar_sesiones(cantidad)
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_csv = os.path.join(directorio, "reservas.csv")
+        ruta_bitacora = os.path.join(directorio, "reservas.bit")
+        escribir_csv(sesiones, ruta_csv)
+        with open(ruta_csv, encoding="utf-8", newline="") as archivo:
+            convertir_csv(archivo, ruta_bitacora)
+
+        t0 = time.perf_counter()
+        with open(ruta_csv, encoding="utf-8", newline="") as archivo:
+            pagos_csv, _ = calcular_pagos_en_lote(
+                *columnas_desde_sesiones(list(leer_reservas_csv(archivo)))
+            )
+        desde_csv = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with Bitacora(ruta_bitacora) as bitacora:
+            jugadores, pagos_bitacora, _ = bitacora.liquidar_en_lote()
+            del jugadores
+        desde_bitacora = time.perf_counter() - t0
+
+        with Bitacora(ruta_bitacora) as bitacora:
+            t0 = time.perf_counter()
+            de_a_una = list(liquidar_reservas(bitacora.sesiones()))
+            reproducir_de_a_una = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            en_lote = list(bitacora.liquidar())
+            reproducir_en_lote = time.perf_counter() - t0
+
+        assert pagos_csv.tolist() == pagos_bitacora.tolist()
+        assert json.dumps(de_a_una, default=a_json) == json.dumps(
+            en_lote, default=a_json
+        )
+        print(
+            f"{cantidad:>8} sesiones  CSV {desde_csv:7.3f}s "
+            f"({os.path.getsize(ruta_csv) / 1e6:5.1f} MB)  "
+            f"bitácora {desde_bitacora:7.3f}s "
+            f"({os.path.getsize(ruta_bitacora) / 1e6:5.1f} MB)  "
+            f"x{desde_csv / desde_bitacora:6.1f}"
+        )
+        print(
+            f"{'':>8} reproducir  de a una {reproducir_de_a_una:7.3f}s  "
+            f"en lote {reproducir_en_lote:7.3f}s  "
+            f"x{reproducir_de_a_una / reproducir_en_lote:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    for cantidad in [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]:
+        medir(cantidad)
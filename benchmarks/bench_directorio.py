@@ -0,0 +1,100 @@
+"""
+Arma un directorio sintético de jugadores y mide cuánto tarda en cargarse y cada
+búsqueda de Directorio.sugerir (prefijos y nombres con un error de tipeo), contra
+recorrer la lista entera como hacía nombres_sugeridos.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_directorio [jugadores]
+"""
+
+import random
+import sys
+import time
+from difflib import get_close_matches
+
+from split_paddle.directorio import Directorio, normalizar
+
+SILABAS = (
+    "ba be bi ca co cu da de di fa fe ga go gu la le li lo ma me mi mo na ne ni no "
+    "pa pe ra re ri ro sa se so ta te to va ve za zo"
+).split()
+FINALES = ["s", "z", "n", "l", "r", "", "", "", ""]
+
+
+def palabra(rng, silabas):
+    return ("".join(rng.choices(SILABAS, k=silabas)) + rng.choice(FINALES)).title()
+
+
+def generar_nombres(cantidad, semilla=1):
+    """
+    Nombres con uno o dos nombres de pila (de unos 300) y uno o dos apellidos (de
+    unos 3000), como en un club: las palabras se repiten mucho.
+    """
+    rng = random.Random(semilla)
+    pilas = sorted({palabra(rng, rng.randint(2, 3)) for _ in range(300)})
+    apellidos = sorted({palabra(rng, rng.randint(2, 4)) for _ in range(3000)})
+    nombres = set()
+    while len(nombres) < cantidad:
+        partes = [rng.choice(pilas)]
+        if rng.random() < 0.3:
+            partes.append(rng.choice(pilas))
+        partes.append(rng.choice(apellidos))
+        if rng.random() < 0.5:
+            partes.append(rng.choice(apellidos))
+        nombres.add(" ".join(partes))
+    return sorted(nombres)
+
+
+def con_error(rng, nombre):
+    i = rng.randrange(len(nombre))
+    cambio = rng.randrange(3)
+    if cambio == 0:
+        return nombre[:i] + nombre[i + 1 :]
+    if cambio == 1:
+        return nombre[:i] + rng.choice("aeioulrsn") + nombre[i + 1 :]
+    return nombre[:i] + nombre[i : i + 2][::-1] + nombre[i + 2 :]
+
+
+def medir(directorio, consultas):
+    tiempos = []
+    for consulta in consultas:
+        inicio = time.perf_counter()
+        directorio.sugerir(consulta)
+        tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2], tiempos[int(len(tiempos) * 0.95)]
+
+
+def principal(jugadores):
+    nombres = generar_nombres(jugadores)
+    inicio = time.perf_counter()
+    directorio = Directorio(nombres)
+    segundos = time.perf_counter() - inicio
+    print(f"{jugadores} jugadores: directorio armado en {segundos:.2f}s")
+
+    rng = random.Random(2)
+    prefijos = [rng.choice(nombres)[: rng.randint(2, 8)] for _ in range(500)]
+    con_errores = [con_error(rng, rng.choice(nombres)) for _ in range(500)]
+    for titulo, consultas in (("prefijo", prefijos), ("con error", con_errores)):
+        mediana, p95 = medir(directorio, consultas)
+        print(
+            f"sugerir ({titulo}): mediana {mediana * 1e6:.0f} µs, p95 {p95 * 1e6:.0f} µs"
+        )
+
+    aciertos = 0
+    for _ in range(500):
+        nombre = rng.choice(nombres)
+        aciertos += nombre in directorio.sugerir(con_error(rng, nombre))
+    print(
+        f"con un error de tipeo, el jugador está entre los sugeridos: {aciertos / 5:.0f}%"
+    )
+
+    normalizados = [normalizar(nombre) for nombre in nombres]
+    inicio = time.perf_counter()
+    for consulta in con_errores[:5]:
+        get_close_matches(normalizar(consulta), normalizados, n=5)
+    antes = (time.perf_counter() - inicio) / 5
+    print(f"recorriendo la lista (difflib): {antes * 1000:.0f} ms por búsqueda")
+
+
+if __name__ == "__main__":
+    principal(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,89 @@
+"""
+Mide cuántos eventos de molinete por segundo procesa la cuenta en vivo, directo
+sobre CuentaEnVivo y a través de la cola de asyncio de Tablero, y cuánto tarda una
+foto de todos los saldos.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_en_vivo [eventos] [jugadores]
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from split_paddle.en_vivo import ENTRADA, SALIDA, CuentaEnVivo, Tablero
+
+TARIFA = [(0, 8000), (19, 12000), (23, 8000)]
+
+
+def generar_eventos(eventos, jugadores, semilla=0):
+    """
+    Entradas y salidas en orden de hora a lo largo del día (de 8 a 24): cada evento
+    hace entrar a alguien que está afuera o salir a alguien que está adentro.
+    """
+    rng = random.Random(semilla)
+    afuera = [f"J{i}" for i in range(jugadores)]
+    adentro = []
+    resultado = []
+    for i in range(eventos):
+        hora = 8 + 16 * i / eventos
+        if adentro and (not afuera or rng.random() < 0.5):
+            k = rng.randrange(len(adentro))
+            adentro[k], adentro[-1] = adentro[-1], adentro[k]
+            nombre = adentro.pop()
+            afuera.append(nombre)
+            resultado.append((SALIDA, nombre, hora))
+        else:
+            k = rng.randrange(len(afuera))
+            afuera[k], afuera[-1] = afuera[-1], afuera[k]
+            nombre = afuera.pop()
+            adentro.append(nombre)
+            resultado.append((ENTRADA, nombre, hora))
+    return resultado
+
+
+async def por_tablero(eventos):
+    tablero = Tablero(CuentaEnVivo(8, 24, tarifa=TARIFA))
+    tarea = asyncio.create_task(tablero.correr())
+    for evento in eventos:
+        tablero.publicar(*evento)
+    tablero.terminar()
+    await tarea
+    return tablero
+
+
+def principal(cantidad, jugadores):
+    eventos = generar_eventos(cantidad, jugadores)
+
+    cuenta = CuentaEnVivo(8, 24, tarifa=TARIFA)
+    inicio = time.perf_counter()
+    for evento in eventos:
+        cuenta.registrar(*evento)
+    directo = time.perf_counter() - inicio
+    print(
+        f"{cantidad} eventos directo: {directo:.2f}s "
+        f"({cantidad / directo:,.0f} eventos/s)"
+    )
+
+    inicio = time.perf_counter()
+    for _ in range(100):
+        foto = cuenta.foto()
+    print(
+        f"Foto de {len(foto)} jugadores: "
+        f"{(time.perf_counter() - inicio) * 10:.2f} ms"
+    )
+
+    inicio = time.perf_counter()
+    asyncio.run(por_tablero(eventos))
+    cola = time.perf_counter() - inicio
+    print(
+        f"{cantidad} eventos por la cola de asyncio: {cola:.2f}s "
+        f"({cantidad / cola:,.0f} eventos/s)"
+    )
+
+
+if __name__ == "__main__":
+    principal(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 2_000,
+    )
@@ -0,0 +1,79 @@
+"""
+Llena un historial con años de sesiones sintéticas y mide cuánto tarda grabarlas y
+cuánto tardan las consultas por jugador y mes.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_historial [años]
+"""
+
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.historial import Historial
+from split_paddle.paralelo import liquidar_sesion
+
+SESIONES_POR_DIA = 20
+NOMBRES = ["Dario", "Gustavo", "Federico", "Hugo", "Mariano", "Yel", "Diego"]
+
+
+def principal(anios):
+    dias = 365 * anios
+    # Se liquida antes de medir: cada modelo con cada nombre conocido como primer
+    # jugador, para tener a quién buscar.
+    modelos = []
+    for i, sesion in enumerate(generar_sesiones(SESIONES_POR_DIA * 7)):
+        nombre = NOMBRES[i % len(NOMBRES)]
+        jugadores = [dict(sesion["jugadores"][0], nombre=nombre)]
+        sesion = dict(sesion, jugadores=jugadores + sesion["jugadores"][1:])
+        modelos.append((sesion, *liquidar_sesion(sesion)[:2]))
+    hoy = datetime.date(2026, 1, 1)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "historial.db")
+        with Historial(ruta) as historial:
+            inicio = time.perf_counter()
+            for dia in range(dias):
+                fecha = hoy - datetime.timedelta(days=dia)
+                for k in range(SESIONES_POR_DIA):
+                    sesion, redondeados, detallados = modelos[
+                        (dia * SESIONES_POR_DIA + k + dia) % len(modelos)
+                    ]
+                    historial.guardar(sesion, redondeados, detallados, fecha)
+            historial.confirmar()
+            grabar = time.perf_counter() - inicio
+            sesiones = dias * SESIONES_POR_DIA
+            print(
+                f"{sesiones} sesiones ({anios} años) grabadas en {grabar:.2f}s "
+                f"({sesiones / grabar:,.0f} sesiones/s), "
+                f"{os.path.getsize(ruta) / 1e6:.1f} MB"
+            )
+
+            consultas = 200
+            inicio = time.perf_counter()
+            for c in range(consultas):
+                mes = hoy - datetime.timedelta(days=30 * (c % (12 * anios)))
+                total = historial.total_del_mes(
+                    NOMBRES[c % len(NOMBRES)], mes.year, mes.month
+                )
+            por_consulta = (time.perf_counter() - inicio) / consultas
+            print(
+                f"total_del_mes: {por_consulta * 1000:.3f} ms por consulta (último: {total:,.2f})"
+            )
+
+            inicio = time.perf_counter()
+            for c in range(consultas):
+                mes = hoy - datetime.timedelta(days=30 * (c % (12 * anios)))
+                historial.pagos_de(
+                    NOMBRES[c % len(NOMBRES)],
+                    mes.replace(day=1),
+                    mes.replace(day=28),
+                )
+            por_consulta = (time.perf_counter() - inicio) / consultas
+            print(f"pagos_de (un mes): {por_consulta * 1000:.3f} ms por consulta")
+
+
+if __name__ == "__main__":
+    principal(int(sys.argv[1]) if len(sys.argv) > 1 else 3)
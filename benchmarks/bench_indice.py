@@ -0,0 +1,95 @@
+"""
+Arma el índice de tramos con meses de sesiones sintéticas y mide cuánto tarda
+armarlo, guardarlo, cargarlo y responder consultas, contra recorrer todos los tramos.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_indice [tramos] [consultas]
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+from split_paddle.indice import IndiceTramos
+
+
+def generar_tramos(cantidad, semilla=0):
+    """
+    Tramos de 30 minutos a 3 horas entre las 8 y las 24, en 6 canchas, repartidos en
+    un año.
+    """
+    rng = random.Random(semilla)
+    inicio = datetime.date(2026, 1, 1)
+    tramos = []
+    for i in range(cantidad):
+        llegada = rng.randint(32, 90) / 4
+        tramos.append(
+            (
+                inicio + datetime.timedelta(days=rng.randint(0, 364)),
+                str(rng.randint(1, 6)),
+                str(i // 4),
+                f"J{rng.randint(0, 5000)}",
+                llegada,
+                min(llegada + rng.randint(2, 12) / 4, 24),
+            )
+        )
+    return tramos
+
+
+def principal(cantidad, consultas):
+    tramos = generar_tramos(cantidad)
+    inicio = time.perf_counter()
+    indice = IndiceTramos.construir(tramos)
+    print(f"{len(indice)} tramos: armado en {time.perf_counter() - inicio:.2f}s")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "tramos.npz")
+        inicio = time.perf_counter()
+        indice.guardar(ruta)
+        guardar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        indice = IndiceTramos.cargar(ruta)
+        cargar = time.perf_counter() - inicio
+        print(
+            f"Guardado en {guardar:.2f}s ({os.path.getsize(ruta) / 1e6:.1f} MB), "
+            f"cargado en {cargar:.2f}s"
+        )
+
+    rng = random.Random(1)
+    preguntas = [
+        (
+            tramos[rng.randrange(len(tramos))][0],
+            rng.randint(32, 90) / 4,
+            str(rng.randint(1, 6)),
+        )
+        for _ in range(consultas)
+    ]
+    inicio = time.perf_counter()
+    encontrados = sum(
+        len(indice.entre(fecha, hora, hora + 0.5, cancha))
+        for fecha, hora, cancha in preguntas
+    )
+    segundos = time.perf_counter() - inicio
+    print(
+        f"{consultas} consultas de media hora: {segundos * 1e6 / consultas:.0f} µs "
+        f"cada una ({encontrados / consultas:.1f} tramos por consulta)"
+    )
+
+    inicio = time.perf_counter()
+    for fecha, hora, cancha in preguntas[:20]:
+        [
+            t
+            for t in tramos
+            if t[0] == fecha and t[1] == cancha and t[4] < hora + 0.5 and t[5] > hora
+        ]
+    recorrer = (time.perf_counter() - inicio) / 20
+    print(f"Recorriendo todos los tramos: {recorrer * 1e6:.0f} µs por consulta")
+
+
+if __name__ == "__main__":
+    principal(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
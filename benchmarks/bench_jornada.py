@@ -0,0 +1,60 @@
+"""
+Mide la liquidación de una jornada con 8 canchas y cientos de jugadores que pasan de
+una cancha a otra.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_jornada [jugadores ...]
+"""
+
+import random
+import sys
+import time
+
+from split_paddle.jornada import liquidar_jornada
+
+CANCHAS = 8
+REPETICIONES = 5
+
+
+def generar_jornada(jugadores, semilla=0):
+    """
+    Canchas de 17 a 23 y, por jugador, de 1 a 3 tramos seguidos en canchas al azar,
+    en cuartos de hora.
+    """
+    rng = random.Random(semilla)
+    canchas = {
+        c: {"hora_inicio": 17, "hora_fin": 23, "monto_total": 60000}
+        for c in range(CANCHAS)
+    }
+    tramos = []
+    for i in range(jugadores):
+        hora = 17 + rng.randint(0, 12) * 0.25
+        for _ in range(rng.randint(1, 3)):
+            salida = min(hora + rng.randint(2, 8) * 0.25, 23)
+            tramos.append(
+                {
+                    "nombre": f"J{i}",
+                    "cancha": rng.randrange(CANCHAS),
+                    "llegada": hora,
+                    "salida": salida,
+                }
+            )
+            hora = salida
+    return canchas, tramos
+
+
+def medir(jugadores):
+    canchas, tramos = generar_jornada(jugadores)
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        t0 = time.perf_counter()
+        liquidar_jornada(canchas, tramos)
+        mejor = min(mejor, time.perf_counter() - t0)
+    print(
+        f"{jugadores:>6} jugadores  {len(tramos):>6} tramos  "
+        f"{mejor * 1000:8.2f} ms  ({mejor / len(tramos) * 1e6:5.2f} µs por tramo)"
+    )
+
+
+if __name__ == "__main__":
+    for cantidad in [int(a) for a in sys.argv[1:]] or [100, 400, 1_600, 6_400]:
+        medir(cantidad)
@@ -0,0 +1,71 @@
+"""
+Llena una libreta con una temporada sintética (miles de jugadores, cientos de miles
+de movimientos) y mide cuánto tarda registrar y proponer las transferencias.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_libreta [jugadores] [sesiones]
+"""
+
+import random
+import sys
+import time
+
+from split_paddle.libreta import Libreta
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+from split_paddle.paralelo import liquidar_sesion
+
+
+def generar_liquidaciones(jugadores, sesiones, semilla=0):
+    """
+    Sesiones de 4 a 8 jugadores al azar, la mitad en efectivo, ya liquidadas.
+    """
+    rng = random.Random(semilla)
+    nombres = [f"J{i}" for i in range(jugadores)]
+    liquidaciones = []
+    for _ in range(sesiones):
+        elegidos = rng.sample(nombres, rng.randint(4, 8))
+        sesion = {
+            "hora_inicio": 18,
+            "hora_fin": 20,
+            "monto_total": rng.randint(8000, 20000),
+            "jugadores": [
+                {
+                    "nombre": nombre,
+                    "llegada": 18 + rng.randint(0, 3) * 0.25,
+                    "salida": 20,
+                    "forma_pago": (
+                        PAGO_EFECTIVO if rng.random() < 0.5 else PAGO_BILLETERA
+                    ),
+                }
+                for nombre in elegidos
+            ],
+        }
+        liquidaciones.append((sesion, *liquidar_sesion(sesion)[:2]))
+    return liquidaciones
+
+
+def principal(jugadores, sesiones):
+    liquidaciones = generar_liquidaciones(jugadores, sesiones)
+    libreta = Libreta()
+    inicio = time.perf_counter()
+    for liquidacion in liquidaciones:
+        libreta.registrar_sesion(*liquidacion)
+    registrar = time.perf_counter() - inicio
+    print(
+        f"{sesiones} sesiones, {libreta.movimientos} movimientos: "
+        f"{registrar:.2f}s ({libreta.movimientos / registrar:,.0f} movimientos/s)"
+    )
+
+    inicio = time.perf_counter()
+    transferencias = libreta.transferencias()
+    proponer = time.perf_counter() - inicio
+    print(
+        f"{len(libreta.saldos())} saldos abiertos -> {len(transferencias)} "
+        f"transferencias en {proponer * 1000:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    principal(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 3_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50_000,
+    )
@@ -0,0 +1,65 @@
+"""
+Compara el cálculo escalar sesión por sesión contra el cálculo en lote con NumPy.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_lote [sesiones ...]
+"""
+
+import random
+import sys
+import time
+
+from split_paddle.lote import calcular_pagos_en_lote, columnas_desde_sesiones
+from split_paddle.pagos import calcular_pagos_por_intervalos
+
+
+def generar_sesiones(cantidad, semilla=0):
+    """
+    Genera sesiones de 1 a 3 horas con 4 a 12 jugadores en cuartos de hora.
+    """
+    rng = random.Random(semilla)
+    sesiones = []
+    for _ in range(cantidad):
+        inicio = rng.choice([17, 18, 19, 20])
+        fin = inicio + rng.choice([1, 1.5, 2, 3])
+        jugadores = [
+            {"nombre": f"J{i}", "llegada": inicio, "salida": fin} for i in range(4)
+        ]
+        for i in range(4, rng.randint(4, 12)):
+            llegada = inicio + rng.randint(0, int((fin - inicio) * 4)) * 0.25
+            salida = llegada + rng.randint(0, int((fin - llegada) * 4)) * 0.25
+            jugadores.append({"nombre": f"J{i}", "llegada": llegada, "salida": salida})
+        sesiones.append(
+            {
+                "hora_inicio": inicio,
+                "hora_fin": fin,
+                "monto_total": 10000,
+                "jugadores": jugadores,
+            }
+        )
+    return sesiones
+
+
+def medir(cantidad):
+    sesiones = generar_sesiones(cantidad)
+    columnas = columnas_desde_sesiones(sesiones)
+
+    t0 = time.perf_counter()
+    for s in sesiones:
+        calcular_pagos_por_intervalos(
+            s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+        )
+    escalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    calcular_pagos_en_lote(*columnas)
+    en_lote = time.perf_counter() - t0
+
+    print(
+        f"{cantidad:>8} sesiones  escalar {escalar:8.3f}s  "
+        f"lote {en_lote:8.3f}s  x{escalar / en_lote:6.1f}"
+    )
+
+
+if __name__ == "__main__":
+    for cantidad in [int(a) for a in sys.argv[1:]] or [10_000, 100_000]:
+        medir(cantidad)
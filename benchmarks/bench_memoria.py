@@ -0,0 +1,83 @@
+"""
+Compara cuánta memoria ocupa una sesión según cómo se guardan jugadores y pagos:
+dicts, registros con __slots__ o columnas (TablaJugadores).
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_memoria [sesiones]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.pagos import calcular_pagos_por_intervalos
+from split_paddle.registros import Jugador, TablaJugadores
+
+
+def medir(nombre, construir, cantidad):
+    tracemalloc.start()
+    datos = construir()
+    usado, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<28} {usado / cantidad:8.0f} bytes por sesión")
+    return datos
+
+
+def pagos_como_dicts(sesiones):
+    resultado = []
+    for s in sesiones:
+        _, detalle = calcular_pagos_por_intervalos(
+            s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+        )
+        resultado.append([p.a_dict() for p in detalle])
+    return resultado
+
+
+def pagos_como_registros(sesiones):
+    resultado = []
+    for s in sesiones:
+        _, detalle = calcular_pagos_por_intervalos(
+            s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+        )
+        resultado.append(detalle)
+    return resultado
+
+
+def principal(cantidad):
+    sesiones = generar_sesiones(cantidad)
+    # Los nombres se comparten entre sesiones para medir solo la estructura.
+    medir(
+        "jugadores en dicts",
+        lambda: [
+            [
+                {"nombre": j["nombre"], "llegada": j["llegada"], "salida": j["salida"]}
+                for j in s["jugadores"]
+            ]
+            for s in sesiones
+        ],
+        cantidad,
+    )
+    medir(
+        "jugadores en Jugador",
+        lambda: [
+            [Jugador(j["nombre"], j["llegada"], j["salida"]) for j in s["jugadores"]]
+            for s in sesiones
+        ],
+        cantidad,
+    )
+
+    def tabla():
+        t = TablaJugadores()
+        for i, s in enumerate(sesiones):
+            for j in s["jugadores"]:
+                t.agregar(i, j["nombre"], j["llegada"], j["salida"])
+        return t
+
+    medir("jugadores en TablaJugadores", tabla, cantidad)
+    jugadores = [[Jugador(**j) for j in s["jugadores"]] for s in sesiones]
+    sesiones_registros = [dict(s, jugadores=js) for s, js in zip(sesiones, jugadores)]
+    medir("pagos en dicts", lambda: pagos_como_dicts(sesiones_registros), cantidad)
+    medir("pagos en Pago", lambda: pagos_como_registros(sesiones_registros), cantidad)
+
+
+if __name__ == "__main__":
+    principal(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
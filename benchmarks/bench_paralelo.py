@@ -0,0 +1,29 @@
+"""
+Mide cómo escala liquidar_sesiones con la cantidad de procesos.
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_paralelo [sesiones]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.paralelo import liquidar_sesiones
+
+
+def medir(cantidad):
+    sesiones = generar_sesiones(cantidad)
+    base = None
+    procesos = 1
+    while procesos <= (os.cpu_count() or 1):
+        t0 = time.perf_counter()
+        liquidar_sesiones(sesiones, procesos=procesos, tamano_bloque=1024)
+        segundos = time.perf_counter() - t0
+        base = base or segundos
+        print(f"{procesos:>3} procesos  {segundos:8.3f}s  x{base / segundos:5.2f}")
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    medir(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
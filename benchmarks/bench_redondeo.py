@@ -0,0 +1,80 @@
+"""
+Redondea el efectivo de muchas sesiones sintéticas con dinero.redondear_efectivo y
+compara el mayor desvío contra redondear todo el efectivo hacia abajo (lo de antes).
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_redondeo [sesiones] [denominacion]
+"""
+
+import random
+import sys
+import time
+
+from split_paddle.dinero import redondear_efectivo, repartir_proporcional
+
+
+def generar_sesiones(sesiones, semilla=0):
+    """
+    Sesiones de 2 a 12 jugadores con su parte exacta en centavos y la forma de pago
+    (True si paga en efectivo, dos de cada tres).
+    """
+    rng = random.Random(semilla)
+    resultado = []
+    for _ in range(sesiones):
+        jugadores = rng.randint(2, 12)
+        centavos = repartir_proporcional(
+            rng.randint(8000, 40000) * 100,
+            [rng.randint(30, 120) for _ in range(jugadores)],
+        )
+        resultado.append((centavos, [rng.random() < 2 / 3 for _ in centavos]))
+    return resultado
+
+
+def hacia_abajo(centavos, es_efectivo, denominacion):
+    pagos = [c - c % denominacion if e else c for c, e in zip(centavos, es_efectivo)]
+    billetera = [i for i, e in enumerate(es_efectivo) if not e]
+    if billetera:
+        extras = repartir_proporcional(
+            sum(centavos) - sum(pagos), [centavos[i] for i in billetera]
+        )
+        for i, extra in zip(billetera, extras):
+            pagos[i] += extra
+    return pagos
+
+
+def desvio_maximo(centavos, pagos):
+    return max(abs(p - c) for p, c in zip(pagos, centavos))
+
+
+def principal(sesiones, denominacion):
+    casos = generar_sesiones(sesiones)
+    inicio = time.perf_counter()
+    resultados = [redondear_efectivo(c, e, denominacion) for c, e in casos]
+    segundos = time.perf_counter() - inicio
+    print(
+        f"{sesiones} sesiones: {segundos:.2f}s "
+        f"({sesiones / segundos:,.0f} sesiones/s, billete de ${denominacion // 100})"
+    )
+
+    mejor = sum(desvio_maximo(c, p) for (c, _), (p, _) in zip(casos, resultados))
+    antes = sum(desvio_maximo(c, hacia_abajo(c, e, denominacion)) for c, e in casos)
+    perdido = sum(
+        sum(c) - sum(hacia_abajo(c, e, denominacion))
+        for c, e in casos
+        if not any(not x for x in e)
+    )
+    vuelto = sum(v for _, v in resultados)
+    print(
+        f"Mayor desvío promedio: ${mejor / sesiones / 100:.2f} "
+        f"(hacia abajo: ${antes / sesiones / 100:.2f})"
+    )
+    print(
+        f"Sesiones sin billetera: se perdían ${perdido / 100:,.2f}; "
+        f"ahora hay que dar ${vuelto / 100:,.2f} de vuelto"
+    )
+
+
+if __name__ == "__main__":
+    principal(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) * 100 if len(sys.argv) > 2 else 10_000,
+    )
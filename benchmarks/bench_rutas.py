@@ -0,0 +1,184 @@
+"""
+Mide las rutas principales con sesiones sintéticas: parsear_hora,
+calcular_pagos_por_intervalos con 4, 12, 100 y 1000 jugadores,
+ajustar_pagos_y_redondear y el HTML de las tarjetas de pago.
+
+Guarda los tiempos (microsegundos por llamada, el mejor de varias repeticiones) en
+JSON y los compara con una línea base: si alguna ruta es más lenta que la base por
+encima del umbral, termina con código 1.
+
+Ejecutar desde la raíz del repo con:
+    python -m benchmarks.bench_rutas [--salida resultados.json] [--umbral 0.5]
+    python -m benchmarks.bench_rutas --guardar-linea-base
+"""
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+from split_paddle.horas import FORMATO_RELOJ, parsear_hora
+from split_paddle.pagos import (
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    ajustar_pagos_y_redondear,
+    calcular_pagos_por_intervalos,
+)
+from split_paddle.registros import Pago
+from split_paddle.tarjetas import html_tarjetas
+
+LINEA_BASE = Path(__file__).with_name("linea_base.json")
+# En una máquina compartida la misma ruta varía hasta un 30 % entre corridas.
+UMBRAL = 0.5
+REPETICIONES = 5
+RONDAS = 3
+CANTIDADES_JUGADORES = [4, 12, 100, 1000]
+
+
+def generar_sesion(cantidad_jugadores, semilla=0):
+    """
+    Una sesión de 2 horas: 4 jugadores de principio a fin y el resto entrando y
+    saliendo en cuartos de hora. La mitad paga en efectivo.
+    """
+    rng = random.Random(semilla)
+    inicio, fin = 18, 20
+    jugadores = []
+    for i in range(cantidad_jugadores):
+        if i < 4:
+            llegada, salida = inicio, fin
+        else:
+            llegada = inicio + rng.randint(0, 7) * 0.25
+            salida = llegada + rng.randint(1, int((fin - llegada) * 4)) * 0.25
+        jugadores.append(
+            {
+                "nombre": f"J{i}",
+                "llegada": llegada,
+                "salida": salida,
+                "forma_pago": PAGO_EFECTIVO if i % 2 else PAGO_BILLETERA,
+            }
+        )
+    return {
+        "hora_inicio": inicio,
+        "hora_fin": fin,
+        "monto_total": 10000,
+        "jugadores": jugadores,
+    }
+
+
+def _por_llamada(funcion, repeticiones=REPETICIONES):
+    """
+    Microsegundos por llamada: el mejor de varias repeticiones, cada una lo bastante
+    larga (timeit.autorange) para que el reloj no domine.
+    """
+    temporizador = timeit.Timer(funcion)
+    veces, _ = temporizador.autorange()
+    mejor = min(temporizador.repeat(repeat=repeticiones, number=veces))
+    return mejor / veces * 1e6
+
+
+def rutas():
+    """
+    Devuelve {nombre de la ruta: función sin argumentos a medir}.
+    """
+    horas_texto = [f"{h}.{m:02d}" for h in range(17, 23) for m in (0, 15, 30, 45)]
+
+    def parsear():
+        for texto in horas_texto:
+            parsear_hora(texto, FORMATO_RELOJ)
+
+    casos = {"parsear_hora_x24": parsear}
+    for cantidad in CANTIDADES_JUGADORES:
+        s = generar_sesion(cantidad)
+        casos[f"calcular_{cantidad}_jugadores"] = lambda s=s: (
+            calcular_pagos_por_intervalos(
+                s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+            )
+        )
+
+    s = generar_sesion(12)
+    formas = {j["nombre"]: j["forma_pago"] for j in s["jugadores"]}
+    _, detallados = calcular_pagos_por_intervalos(
+        s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+    )
+
+    def copiar():
+        return [Pago(p.nombre, p.pago, p.tiempo) for p in detallados]
+
+    # ajustar_pagos_y_redondear cambia los pagos en el lugar: cada llamada trabaja
+    # sobre pagos recién armados, así siempre hay restos de efectivo para redondear
+    # (armarlos entra en el tiempo medido).
+    casos["ajustar_12_jugadores"] = lambda: ajustar_pagos_y_redondear(
+        copiar(), formas, s["monto_total"]
+    )
+    # Las tarjetas se dibujan con los pagos ya ajustados, como en la página, sobre
+    # una copia propia que no depende de las otras rutas.
+    ajustados = copiar()
+    ajustar_pagos_y_redondear(ajustados, formas, s["monto_total"])
+    casos["tarjetas_12_jugadores"] = lambda: html_tarjetas(ajustados)
+    return casos
+
+
+def medir(rondas=RONDAS):
+    """
+    Mide todas las rutas varias rondas seguidas y se queda con el mejor tiempo de
+    cada una: así una interrupción de la máquina no cae siempre sobre la misma ruta.
+    """
+    casos = rutas()
+    mejores = {}
+    for _ in range(rondas):
+        for nombre, funcion in casos.items():
+            us = _por_llamada(funcion)
+            mejores[nombre] = min(us, mejores.get(nombre, us))
+    return {nombre: round(us, 3) for nombre, us in mejores.items()}
+
+
+def comparar(resultados, linea_base, umbral=UMBRAL):
+    """
+    Devuelve [(ruta, base, actual)] de las rutas que empeoraron más que el umbral
+    (0.5 = 50 % más lentas). Las rutas que no están en la base no se comparan.
+    """
+    regresiones = []
+    for ruta, actual in resultados.items():
+        base = linea_base.get(ruta)
+        if base is not None and actual > base * (1 + umbral):
+            regresiones.append((ruta, base, actual))
+    return regresiones
+
+
+def principal(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--salida", help="archivo JSON donde guardar los tiempos")
+    parser.add_argument("--linea-base", default=str(LINEA_BASE))
+    parser.add_argument("--umbral", type=float, default=UMBRAL)
+    parser.add_argument(
+        "--guardar-linea-base",
+        action="store_true",
+        help="reemplaza la línea base con esta medición",
+    )
+    args = parser.parse_args(argv)
+
+    resultados = medir()
+    for ruta, us in resultados.items():
+        print(f"{ruta:<28} {us:12.3f} µs")
+    if args.salida:
+        Path(args.salida).write_text(json.dumps(resultados, indent=2) + "\n")
+
+    linea_base = Path(args.linea_base)
+    if args.guardar_linea_base:
+        linea_base.write_text(json.dumps(resultados, indent=2) + "\n")
+        print(f"Línea base guardada en {linea_base}")
+        return 0
+    if not linea_base.exists():
+        print(f"No hay línea base en {linea_base}; usa --guardar-linea-base.")
+        return 0
+
+    regresiones = comparar(resultados, json.loads(linea_base.read_text()), args.umbral)
+    for ruta, base, actual in regresiones:
+        print(f"REGRESIÓN {ruta}: {base:.3f} → {actual:.3f} µs (x{actual / base:.2f})")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(principal())
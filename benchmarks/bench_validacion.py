@@ -0,0 +1,51 @@
+"""
+Valida un lote grande de sesiones sintéticas con validacion.validar_sesiones y
+compara la búsqueda de nombres repetidos contra la de antes (nombres.count dentro de
+una lista por comprensión, O(n²)).
+
+Ejecutar desde la raíz del repo con: python -m benchmarks.bench_validacion [sesiones] [nombres]
+"""
+
+import sys
+import time
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.validacion import validar_jugadores, validar_sesiones
+
+
+def repetidos_como_antes(jugadores):
+    nombres = [j["nombre"].strip().lower() for j in jugadores if j["nombre"]]
+    return set([n for n in nombres if nombres.count(n) > 1])
+
+
+def principal(sesiones, nombres):
+    lote = generar_sesiones(sesiones)
+    inicio = time.perf_counter()
+    validas, problemas = validar_sesiones(lote)
+    segundos = time.perf_counter() - inicio
+    print(
+        f"{sesiones} sesiones: {segundos:.2f}s ({sesiones / segundos:,.0f} "
+        f"sesiones/s), {len(validas)} válidas, {len(problemas)} problemas"
+    )
+
+    jugadores = [
+        {"nombre": f"J{i % (nombres // 2)}", "llegada": 18, "salida": 20}
+        for i in range(nombres)
+    ]
+    inicio = time.perf_counter()
+    validar_jugadores(jugadores, 18, 20)
+    nuevo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    repetidos_como_antes(jugadores)
+    antes = time.perf_counter() - inicio
+    print(
+        f"{nombres} jugadores con repetidos: {nuevo * 1000:.1f} ms "
+        f"(con nombres.count: {antes * 1000:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    principal(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
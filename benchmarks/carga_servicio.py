@@ -0,0 +1,140 @@
+"""
+Prueba de carga del servicio HTTP: muchos clientes concurrentes, cada uno con su
+conexión keep-alive, mandan sesiones a POST /liquidar. Muestra el throughput, la
+latencia p50/p99 vista por los clientes y las métricas del servidor (cuántos lotes
+armó).
+
+Ejecutar desde la raíz del repo con:
+    python -m benchmarks.carga_servicio --iniciar [--clientes 200] [--pedidos 20]
+    python -m benchmarks.carga_servicio --host 10.0.0.5 --puerto 8000
+
+Con --iniciar el servicio se levanta en otro proceso en un puerto libre.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_lote import generar_sesiones
+from split_paddle.servicio import percentil
+
+
+async def _pedido(lector, escritor, metodo, ruta, cuerpo=b""):
+    escritor.write(
+        f"{metodo} {ruta} HTTP/1.1\r\nHost: carga\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n\r\n".encode("latin-1") + cuerpo
+    )
+    await escritor.drain()
+    estado = await lector.readline()
+    largo = 0
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b""):
+            break
+        clave, _, valor = linea.decode("latin-1").partition(":")
+        if clave.lower() == "content-length":
+            largo = int(valor)
+    return int(estado.split()[1]), await lector.readexactly(largo)
+
+
+async def _cliente(host, puerto, cuerpos, latencias, errores):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        for cuerpo in cuerpos:
+            inicio = time.perf_counter()
+            codigo, _ = await _pedido(lector, escritor, "POST", "/liquidar", cuerpo)
+            latencias.append(time.perf_counter() - inicio)
+            if codigo != 200:
+                errores.append(codigo)
+    finally:
+        escritor.close()
+
+
+async def correr(host, puerto, clientes, pedidos):
+    sesiones = generar_sesiones(clientes * pedidos)
+    cuerpos = [json.dumps(s).encode() for s in sesiones]
+    latencias, errores = [], []
+    inicio = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _cliente(host, puerto, cuerpos[c::clientes], latencias, errores)
+            for c in range(clientes)
+        )
+    )
+    total = time.perf_counter() - inicio
+
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    _, cuerpo = await _pedido(lector, escritor, "GET", "/metricas")
+    escritor.close()
+    metricas = json.loads(cuerpo)
+
+    print(f"{clientes} clientes x {pedidos} pedidos = {len(latencias)} en {total:.2f}s")
+    print(
+        f"throughput {len(latencias) / total:10.0f} pedidos/s   errores {len(errores)}"
+    )
+    print(
+        f"cliente  p50 {percentil(latencias, 50) * 1000:8.2f} ms   "
+        f"p99 {percentil(latencias, 99) * 1000:8.2f} ms"
+    )
+    print(
+        f"servidor p50 {metricas['p50_ms']:8.2f} ms   p99 {metricas['p99_ms']:8.2f} ms"
+        f"   {metricas['pedidos']} pedidos en {metricas['lotes']} lotes"
+    )
+
+
+def _puerto_libre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _esperar_servicio(host, puerto, intentos=50):
+    for _ in range(intentos):
+        try:
+            _, escritor = await asyncio.open_connection(host, puerto)
+            escritor.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"El servicio no responde en {host}:{puerto}.")
+
+
+def principal(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8000)
+    parser.add_argument("--clientes", type=int, default=200)
+    parser.add_argument("--pedidos", type=int, default=20, help="por cliente")
+    parser.add_argument("--iniciar", action="store_true", help="levantar el servicio")
+    args = parser.parse_args(argv)
+
+    proceso = None
+    if args.iniciar:
+        args.puerto = _puerto_libre()
+        proceso = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "split_paddle.servicio",
+                "--host",
+                args.host,
+                "--puerto",
+                str(args.puerto),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        asyncio.run(_esperar_servicio(args.host, args.puerto))
+        asyncio.run(correr(args.host, args.puerto, args.clientes, args.pedidos))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+
+
+if __name__ == "__main__":
+    principal()
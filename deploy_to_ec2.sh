@@ -18,7 +18,7 @@ ssh -i "$KEY_PATH" "$EC2_ADDRESS" "mkdir -p ~/split_paddle"
 
 # Copiar archivos al servidor
 echo "Copiando archivos..."
-scp -i "$KEY_PATH" split_paddle.py "$EC2_ADDRESS:~/split_paddle/"
+scp -i "$KEY_PATH" -r split_paddle "$EC2_ADDRESS:~/split_paddle/"
 scp -i "$KEY_PATH" setup_ec2.sh "$EC2_ADDRESS:~/"
 
 # Ejecutar script de configuración
@@ -28,4 +28,4 @@ ssh -i "$KEY_PATH" "$EC2_ADDRESS" "chmod +x ~/setup_ec2.sh && ~/setup_ec2.sh"
 echo "¡Despliegue completado!"
 echo "Para conectarte y ejecutar la aplicación:"
 echo "  1. ssh -i $KEY_PATH $EC2_ADDRESS"
-echo "  2. cd ~/split_paddle && python3 split_paddle.py"
\ No newline at end of file
+echo "  2. cd ~/split_paddle && python3 -m split_paddle"
\ No newline at end of file
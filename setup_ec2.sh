@@ -1,5 +1,5 @@
 #!/bin/bash
-# Script para configurar una instancia EC2 para ejecutar split_paddle.py
+# Script para configurar una instancia EC2 para ejecutar el paquete split_paddle
 
 # Actualizar el sistema
 echo "Actualizando el sistema..."
@@ -13,13 +13,5 @@ sudo yum install python3 -y || sudo apt install python3 -y
 echo "Creando directorio para la aplicación..."
 mkdir -p ~/split_paddle
 
-# Copiar el archivo principal
-echo "Copiando archivos de la aplicación..."
-cp split_paddle.py ~/split_paddle/
-
-# Dar permisos de ejecución
-echo "Configurando permisos..."
-chmod +x ~/split_paddle/split_paddle.py
-
 echo "¡Configuración completada!"
-echo "Para ejecutar la aplicación: cd ~/split_paddle && python3 split_paddle.py"
\ No newline at end of file
+echo "Para ejecutar la aplicación: cd ~/split_paddle && python3 -m split_paddle"
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Núcleo de Split Paddle: reparte el costo de una cancha según el tiempo jugado.
+
+Solo usa la biblioteca estándar, así que importarlo es barato. Lo que necesita algo
+más se importa desde su módulo: split_paddle.lote, split_paddle.bitacora y
+split_paddle.indice (numpy) y split_paddle.web (Streamlit).
+"""
+
+from .horas import FORMATO_DECIMAL, FORMATO_RELOJ, parsear_hora
+from .pagos import (
+    DENOMINACION,
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    ajustar_pagos_y_redondear,
+    calcular_pagos_por_intervalos,
+    recorrer_intervalos,
+)
+from .registros import Intervalo, Jugador, Pago
+
+__all__ = [
+    "DENOMINACION",
+    "FORMATO_DECIMAL",
+    "FORMATO_RELOJ",
+    "PAGO_BILLETERA",
+    "PAGO_EFECTIVO",
+    "Intervalo",
+    "Jugador",
+    "Pago",
+    "ajustar_pagos_y_redondear",
+    "calcular_pagos_por_intervalos",
+    "parsear_hora",
+    "recorrer_intervalos",
+]
@@ -0,0 +1,513 @@
+"""
+Bitácora binaria de sesiones: registros de ancho fijo, solo se agregan al final.
+
+El archivo empieza con una cabecera de 16 bytes (MAGICO, versión y tamaño de
+registro) y sigue con registros de 48 bytes, little-endian:
+
+    tipo        u1   0 = sesión, 1 = jugador
+    forma_pago  u1   0 = sin dato, 1 = Efectivo, 2 = Billetera
+    jugadores   u2   en las sesiones, cuántos registros de jugador le siguen (0 en los
+                     jugadores; en la versión 1 era relleno)
+    sesion      u4   número de registro de la sesión (en los jugadores, la suya)
+    inicio      f8   hora de inicio de la cancha / llegada
+    fin         f8   hora de fin de la cancha / salida
+    monto       f8   monto total (0 en los jugadores)
+    nombre      16s  id de la reserva / nombre del jugador, UTF-8
+
+Se lee con mmap y numpy.frombuffer sin copiar nada: Bitacora.registros es una vista
+sobre el archivo, y Bitacora.liquidar le pasa las columnas de cada bloque de
+registros directo a lote.calcular_pagos_en_lote. Un registro cortado al final (un corte de luz a mitad de una
+escritura) se ignora, y una sesión a la que le faltan jugadores se informa como error
+en vez de liquidarse con los que quedaron.
+
+Uso: python3 -m split_paddle.bitacora convertir reservas.csv reservas.bit
+     python3 -m split_paddle.bitacora reproducir reservas.bit [--salida res.jsonl]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+from .dinero import pesos_por_tramo, repartir_proporcional
+from .flujo import escribir_resultados_jsonl, leer_reservas_csv
+from .lote import calcular_pagos_en_lote
+from .pagos import PAGO_BILLETERA, PAGO_EFECTIVO, ajustar_pagos_y_redondear
+from .registros import Pago
+
+MAGICO = b"SPBITAC\x00"
+VERSION = 2
+SESION = 0
+JUGADOR = 1
+# Cuántos registros leen por vez Bitacora.sesiones y Bitacora.liquidar (~3 MB).
+BLOQUE_LECTURA = 65536
+
+_CABECERA = struct.Struct("<8sII")
+_REGISTRO = struct.Struct("<BBHIddd16s")
+DTYPE_REGISTRO = np.dtype(
+    [
+        ("tipo", "u1"),
+        ("forma_pago", "u1"),
+        ("jugadores", "<u2"),
+        ("sesion", "<u4"),
+        ("inicio", "<f8"),
+        ("fin", "<f8"),
+        ("monto", "<f8"),
+        ("nombre", "S16"),
+    ]
+)
+_FORMAS_PAGO = {None: 0, PAGO_EFECTIVO: 1, PAGO_BILLETERA: 2}
+_FORMAS_PAGO_POR_CODIGO = {codigo: forma for forma, codigo in _FORMAS_PAGO.items()}
+
+
+class EscritorBitacora:
+    """
+    Agrega sesiones al final de una bitácora (la crea si no existe). Cada sesión se
+    escribe junto con sus jugadores en una sola escritura.
+    """
+
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "ab")
+        try:
+            self._proximo = self._preparar(ruta)
+        except BaseException:
+            # Si no es una bitácora no queda el archivo abierto.
+            self._archivo.close()
+            raise
+
+    def _preparar(self, ruta):
+        """
+        Escribe la cabecera si el archivo está vacío o la valida si no, descarta un
+        registro cortado al final y devuelve el número del próximo registro.
+        """
+        tamano = self._archivo.seek(0, os.SEEK_END)
+        if tamano == 0:
+            self._archivo.write(
+                _CABECERA.pack(MAGICO, VERSION, DTYPE_REGISTRO.itemsize)
+            )
+            tamano = _CABECERA.size
+        else:
+            _validar_cabecera(ruta)
+        resto = (tamano - _CABECERA.size) % _REGISTRO.size
+        if resto:
+            # Quedó un registro a medias: se descarta para no correr los siguientes.
+            # Si era de una sesión, a esa sesión le falta un jugador y al leerla se
+            # informa como incompleta.
+            tamano -= resto
+            self._archivo.truncate(tamano)
+        return (tamano - _CABECERA.size) // _REGISTRO.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def agregar(self, sesion):
+        """
+        Agrega una sesión (dict con hora_inicio, hora_fin, monto_total, jugadores y
+        opcionalmente id) y devuelve su número de registro. Lanza ValueError si un
+        nombre o id no entra en 16 bytes, si la forma de pago es desconocida o si hay
+        más de 65535 jugadores, sin escribir nada.
+        """
+        numero = self._proximo
+        if len(sesion["jugadores"]) > 0xFFFF:
+            raise ValueError("Una sesión no puede tener más de 65535 jugadores.")
+        bloque = [
+            _REGISTRO.pack(
+                SESION,
+                0,
+                len(sesion["jugadores"]),
+                numero,
+                sesion["hora_inicio"],
+                sesion["hora_fin"],
+                sesion["monto_total"],
+                _texto_fijo(
+                    "" if sesion.get("id") is None else str(sesion["id"]), "El id"
+                ),
+            )
+        ]
+        for jugador in sesion["jugadores"]:
+            forma_pago = jugador.get("forma_pago")
+            if forma_pago not in _FORMAS_PAGO:
+                raise ValueError(f"Forma de pago desconocida: {forma_pago!r}.")
+            bloque.append(
+                _REGISTRO.pack(
+                    JUGADOR,
+                    _FORMAS_PAGO[forma_pago],
+                    0,
+                    numero,
+                    jugador["llegada"],
+                    jugador["salida"],
+                    0.0,
+                    _texto_fijo(jugador["nombre"], "El nombre"),
+                )
+            )
+        self._archivo.write(b"".join(bloque))
+        self._proximo += len(bloque)
+        return numero
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class Bitacora:
+    """
+    Bitácora abierta para leer. registros es un array estructurado de numpy
+    (DTYPE_REGISTRO) que apunta directo al archivo mapeado en memoria.
+    Antes de cerrar hay que soltar las vistas que se hayan tomado de registros.
+    """
+
+    def __init__(self, ruta):
+        self.version = _validar_cabecera(ruta)
+        with open(ruta, "rb") as archivo:
+            tamano = os.fstat(archivo.fileno()).st_size
+            cantidad = (tamano - _CABECERA.size) // DTYPE_REGISTRO.itemsize
+            self._mapa = (
+                mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+                if cantidad
+                else None
+            )
+        if self._mapa is None:
+            self.registros = np.zeros(0, dtype=DTYPE_REGISTRO)
+        else:
+            self.registros = np.frombuffer(
+                self._mapa, dtype=DTYPE_REGISTRO, count=cantidad, offset=_CABECERA.size
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def __len__(self):
+        return int(np.count_nonzero(self.registros["tipo"] == SESION))
+
+    def cerrar(self):
+        self.registros = None
+        if self._mapa is not None:
+            self._mapa.close()
+
+    def liquidar_en_lote(self):
+        """
+        Pagos exactos de todos los jugadores de la bitácora, de una vez, con
+        lote.calcular_pagos_en_lote. Devuelve (jugadores, pagos, tiempos): jugadores
+        son los registros de jugador (una vista, en el orden del archivo) y pagos y
+        tiempos van alineados con ellos. Los registros sin nombre y los jugadores de
+        sesiones incompletas no se liquidan.
+        """
+        registros = self.registros
+        es_sesion = registros["tipo"] == SESION
+        es_jugador = registros["tipo"] == JUGADOR
+        sesiones = registros[es_sesion]
+        liquidar = es_jugador & (registros["nombre"] != b"")
+        if self.version >= 2 and len(registros):
+            numeros = registros["sesion"]
+            vistos = np.bincount(numeros[es_jugador], minlength=len(registros))
+            completa = np.ones(len(registros), dtype=bool)
+            indices = np.flatnonzero(es_sesion)
+            completa[indices] = vistos[indices] == sesiones["jugadores"]
+            liquidar &= completa[np.minimum(numeros, len(registros) - 1)]
+        jugadores = registros[liquidar]
+        pagos, tiempos = calcular_pagos_en_lote(
+            np.flatnonzero(es_sesion),
+            sesiones["inicio"],
+            sesiones["fin"],
+            sesiones["monto"],
+            jugadores["sesion"],
+            jugadores["inicio"],
+            jugadores["fin"],
+        )
+        return jugadores, pagos, tiempos
+
+    def liquidar(self, bloque=BLOQUE_LECTURA):
+        """
+        Liquida todas las sesiones completas (con redondeo y forma de pago) y genera un
+        resultado por sesión, igual que flujo.liquidar_reservas sobre sesiones().
+
+        Los registros se leen de a unos `bloque`, cortados donde empieza una sesión, y
+        las columnas de cada bloque van de una a lote.calcular_pagos_en_lote sin
+        pasar por dicts. En Python queda solo lo que es entero y por sesión: el
+        reparto en pesos y el ajuste por forma de pago.
+        """
+        if bloque < 1:
+            raise ValueError("El bloque debe tener al menos un registro.")
+        for parte in self._bloques_de_sesiones(bloque):
+            yield from self._liquidar_bloque(parte)
+
+    def _bloques_de_sesiones(self, bloque):
+        """
+        Vistas de unos `bloque` registros; cada una termina donde empieza una sesión,
+        así ninguna sesión queda repartida entre dos.
+        """
+        tipos = self.registros["tipo"]
+        desde = 0
+        while desde < len(tipos):
+            hasta = desde + bloque
+            while hasta < len(tipos):
+                siguientes = np.flatnonzero(tipos[hasta : hasta + bloque] == SESION)
+                if len(siguientes):
+                    hasta += int(siguientes[0])
+                    break
+                hasta += bloque
+            yield self.registros[desde:hasta]
+            desde = hasta
+
+    def _liquidar_bloque(self, parte):
+        es_sesion = parte["tipo"] == SESION
+        cabeceras = parte[es_sesion]
+        if not len(cabeceras):
+            return
+        # Sesión de cada registro (su posición en el bloque; -1 antes de la primera).
+        duena = np.cumsum(es_sesion) - 1
+        es_jugador = (parte["tipo"] == JUGADOR) & (duena >= 0)
+        vistos = np.bincount(duena[es_jugador], minlength=len(cabeceras))
+        completa = (
+            vistos == cabeceras["jugadores"]
+            if self.version >= 2
+            else np.ones(len(cabeceras), dtype=bool)
+        )
+        con_nombre = es_jugador & (parte["nombre"] != b"")
+        finita = (
+            np.isfinite(cabeceras["inicio"])
+            & np.isfinite(cabeceras["fin"])
+            & np.isfinite(cabeceras["monto"])
+        )
+        # Una llegada o salida infinita se recorta al horario; NaN no se puede.
+        finita[
+            duena[con_nombre & (np.isnan(parte["inicio"]) | np.isnan(parte["fin"]))]
+        ] = False
+        liquidable = completa & finita
+        liquidar = con_nombre & liquidable[np.maximum(duena, 0)]
+        jugadores = parte[liquidar]
+        sesion_jugador = duena[liquidar]
+
+        # Las sesiones que no se liquidan van sin jugadores y en cero.
+        inicios = np.where(liquidable, cabeceras["inicio"], 0.0)
+        fines = np.where(liquidable, cabeceras["fin"], 0.0)
+        pagos, tiempos = calcular_pagos_en_lote(
+            np.arange(len(cabeceras)),
+            inicios,
+            fines,
+            np.where(liquidable, cabeceras["monto"], 0.0),
+            sesion_jugador,
+            jugadores["inicio"],
+            jugadores["fin"],
+        )
+        # Mismo recorte que calcular_pagos_por_intervalos, para los pesos en minutos.
+        inicio_j = inicios[sesion_jugador]
+        fin_j = fines[sesion_jugador]
+        llegadas = np.minimum(np.maximum(jugadores["inicio"], inicio_j), fin_j)
+        salidas = np.minimum(np.maximum(jugadores["fin"], llegadas), fin_j)
+        # np.rint redondea al par como round, así que da lo mismo que hora_a_minutos.
+        tramos = list(
+            zip(
+                np.rint(llegadas * 60).astype(np.int64).tolist(),
+                np.rint(salidas * 60).astype(np.int64).tolist(),
+            )
+        )
+        nombres = [nombre.decode() for nombre in jugadores["nombre"].tolist()]
+        formas = [_FORMAS_PAGO_POR_CODIGO[c] for c in jugadores["forma_pago"].tolist()]
+        pagos = pagos.tolist()
+        tiempos = tiempos.tolist()
+        cortes = np.searchsorted(sesion_jugador, np.arange(len(cabeceras) + 1)).tolist()
+
+        ids = cabeceras["nombre"].tolist()
+        numeros = cabeceras["sesion"].tolist()
+        montos = cabeceras["monto"].tolist()
+        esperados = cabeceras["jugadores"].tolist()
+        vistos = vistos.tolist()
+        completa = completa.tolist()
+        finita = finita.tolist()
+        for s in range(len(cabeceras)):
+            id_sesion = ids[s].decode() or str(numeros[s])
+            if not completa[s]:
+                yield _incompleta(id_sesion, vistos[s], esperados[s])
+                continue
+            if not finita[s]:
+                yield {
+                    "id": id_sesion,
+                    "error": "Reserva inválida: hay horas o montos que no son números.",
+                }
+                continue
+            a, b = cortes[s], cortes[s + 1]
+            try:
+                pagos_enteros = repartir_proporcional(
+                    round(montos[s]), pesos_por_tramo(tramos[a:b])
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                yield {"id": id_sesion, "error": f"Reserva inválida: {e!r}"}
+                continue
+            pagos_detallados = [
+                Pago(nombres[k], pagos[k], tiempos[k]) for k in range(a, b)
+            ]
+            pagos_redondeados = [
+                Pago(nombres[k], pago_entero, tiempos[k])
+                for k, pago_entero in zip(range(a, b), pagos_enteros)
+            ]
+            # Como paralelo.ajustar_formas_de_pago (la bitácora no guarda billete).
+            forma_pago_dict = {nombres[k]: formas[k] for k in range(a, b) if formas[k]}
+            vuelto = (
+                ajustar_pagos_y_redondear(pagos_detallados, forma_pago_dict, montos[s])
+                if forma_pago_dict
+                else 0
+            )
+            resultado = {
+                "id": id_sesion,
+                "pagos": pagos_redondeados,
+                "detalle": pagos_detallados,
+            }
+            if vuelto:
+                resultado["vuelto"] = vuelto
+            yield resultado
+
+    def sesiones(self, bloque=BLOQUE_LECTURA):
+        """
+        Genera las sesiones como dicts, igual que flujo.leer_reservas_csv, para usarlas
+        donde se espera una reserva (para liquidarlas, mejor liquidar). Una sesión a la que le faltan jugadores (se cortó su escritura) sale con id y
+        error, como una reserva con error del CSV.
+
+        Los registros se leen de a `bloque`, así que la memoria no depende del tamaño
+        del archivo; una sesión puede quedar repartida entre dos bloques.
+        """
+        if bloque < 1:
+            raise ValueError("El bloque debe tener al menos un registro.")
+        actual, esperados, vistos = None, 0, 0
+        for desde in range(0, len(self.registros), bloque):
+            # Solo este bloque pasa a listas de Python; el resto sigue en el mapa.
+            parte = self.registros[desde : desde + bloque]
+            for tipo, forma_pago, cantidad, numero, inicio, fin, monto, nombre in zip(
+                parte["tipo"].tolist(),
+                parte["forma_pago"].tolist(),
+                parte["jugadores"].tolist(),
+                parte["sesion"].tolist(),
+                parte["inicio"].tolist(),
+                parte["fin"].tolist(),
+                parte["monto"].tolist(),
+                parte["nombre"].tolist(),
+            ):
+                if tipo == SESION:
+                    if actual is not None:
+                        yield self._terminar(actual, esperados, vistos)
+                    actual = {
+                        "id": nombre.decode() or str(numero),
+                        "hora_inicio": inicio,
+                        "hora_fin": fin,
+                        "monto_total": monto,
+                        "jugadores": [],
+                    }
+                    esperados, vistos = cantidad, 0
+                elif actual is not None:
+                    vistos += 1
+                    if nombre:
+                        jugador = {
+                            "nombre": nombre.decode(),
+                            "llegada": inicio,
+                            "salida": fin,
+                        }
+                        if forma_pago:
+                            jugador["forma_pago"] = _FORMAS_PAGO_POR_CODIGO[forma_pago]
+                        actual["jugadores"].append(jugador)
+        if actual is not None:
+            yield self._terminar(actual, esperados, vistos)
+
+    def _terminar(self, sesion, esperados, vistos):
+        if self.version < 2 or vistos == esperados:
+            return sesion
+        return _incompleta(sesion["id"], vistos, esperados)
+
+
+def _incompleta(id_sesion, vistos, esperados):
+    return {
+        "id": id_sesion,
+        "error": (
+            f"Sesión incompleta: tiene {vistos} de sus {esperados} jugadores "
+            "(se cortó la escritura)."
+        ),
+    }
+
+
+def convertir_csv(archivo_csv, ruta_bitacora):
+    """
+    Pasa las reservas de un CSV (formato de flujo.leer_reservas_csv) al final de una
+    bitácora. Las reservas con error no se escriben. Devuelve (escritas, con_error).
+    """
+    escritas = con_error = 0
+    with EscritorBitacora(ruta_bitacora) as escritor:
+        for reserva in leer_reservas_csv(archivo_csv):
+            if "error" in reserva:
+                con_error += 1
+                continue
+            try:
+                escritor.agregar(reserva)
+            except ValueError:
+                con_error += 1
+                continue
+            escritas += 1
+    return escritas, con_error
+
+
+def _texto_fijo(texto, que):
+    codificado = texto.encode("utf-8")
+    if len(codificado) > 16:
+        raise ValueError(f"{que} {texto!r} ocupa más de 16 bytes.")
+    return codificado
+
+
+def _validar_cabecera(ruta):
+    with open(ruta, "rb") as archivo:
+        cabecera = archivo.read(_CABECERA.size)
+    if len(cabecera) < _CABECERA.size:
+        raise ValueError(f"{ruta} no es una bitácora (archivo muy corto).")
+    magico, version, tamano_registro = _CABECERA.unpack(cabecera)
+    if magico != MAGICO:
+        raise ValueError(f"{ruta} no es una bitácora.")
+    if not 1 <= version <= VERSION or tamano_registro != DTYPE_REGISTRO.itemsize:
+        raise ValueError(f"Versión de bitácora no soportada: {version}.")
+    return version
+
+
+def _principal(argv=None):
+    parser = argparse.ArgumentParser(description="Bitácora binaria de sesiones.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    convertir = comandos.add_parser("convertir", help="CSV de reservas a bitácora")
+    convertir.add_argument("csv")
+    convertir.add_argument("bitacora")
+    reproducir = comandos.add_parser(
+        "reproducir", help="liquidar todas las sesiones de una bitácora"
+    )
+    reproducir.add_argument("bitacora")
+    reproducir.add_argument("--salida", default="-")
+    args = parser.parse_args(argv)
+
+    if args.comando == "convertir":
+        with open(args.csv, encoding="utf-8", newline="") as archivo:
+            escritas, con_error = convertir_csv(archivo, args.bitacora)
+        print(
+            f"Sesiones escritas: {escritas}. Con error: {con_error}.", file=sys.stderr
+        )
+        return 1 if con_error else 0
+
+    salida = (
+        sys.stdout if args.salida == "-" else open(args.salida, "w", encoding="utf-8")
+    )
+    try:
+        with Bitacora(args.bitacora) as bitacora:
+            liquidadas, con_error = escribir_resultados_jsonl(
+                bitacora.liquidar(), salida
+            )
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    print(
+        f"Sesiones liquidadas: {liquidadas}. Con error: {con_error}.", file=sys.stderr
+    )
+    return 1 if con_error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_principal())
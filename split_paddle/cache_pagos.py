@@ -0,0 +1,118 @@
+import threading
+from collections import OrderedDict
+
+from .paralelo import liquidar_sesion
+from .registros import Pago
+
+CAPACIDAD = 512
+
+
+class CacheLRU:
+    """
+    Cache acotado: cuando se llena descarta lo usado hace más tiempo.
+    Lleva la cuenta de aciertos, fallos y desalojos. Se puede compartir entre hilos
+    (Streamlit atiende cada sesión en un hilo distinto).
+    """
+
+    def __init__(self, capacidad=CAPACIDAD):
+        if capacidad < 1:
+            raise ValueError("La capacidad del cache debe ser al menos 1.")
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._datos)
+
+    def obtener(self, clave):
+        """
+        Devuelve el valor guardado o None, y lo marca como recién usado.
+        """
+        with self._lock:
+            valor = self._datos.get(clave)
+            if valor is None:
+                self.fallos += 1
+                return None
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+                self.desalojos += 1
+
+    def estadisticas(self):
+        return {
+            "tamano": len(self._datos),
+            "capacidad": self.capacidad,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
+
+
+def clave_sesion(jugadores, monto_total, hora_inicio, hora_fin):
+    """
+    Clave canónica de una sesión: el horario de la cancha, el total y los jugadores
+    ordenados por nombre con sus horarios y forma de pago. Dos envíos con los mismos
+    datos, en cualquier orden, dan la misma clave.
+    """
+    return (
+        float(hora_inicio),
+        float(hora_fin),
+        float(monto_total),
+        tuple(
+            sorted(
+                (j["nombre"], j["llegada"], j["salida"], j.get("forma_pago") or "")
+                for j in jugadores
+            )
+        ),
+    )
+
+
+def liquidar_con_cache(cache, jugadores, monto_total, hora_inicio, hora_fin):
+    """
+    Como paralelo.liquidar_sesion, pero reutiliza el resultado si ya se liquidó una
+    sesión con los mismos datos. El cálculo se hace siempre con los jugadores en orden
+    canónico, así el resultado no depende del orden en que se cargaron; después se
+    devuelve en el orden de jugadores. Devuelve (pagos_redondeados, pagos_detallados,
+    vuelto), con copias de los pagos: se pueden modificar sin afectar lo guardado.
+    """
+    clave = clave_sesion(jugadores, monto_total, hora_inicio, hora_fin)
+    resultado = cache.obtener(clave)
+    if resultado is None:
+        canonicos = []
+        for nombre, llegada, salida, forma_pago in clave[3]:
+            jugador = {"nombre": nombre, "llegada": llegada, "salida": salida}
+            if forma_pago:
+                jugador["forma_pago"] = forma_pago
+            canonicos.append(jugador)
+        pagos_redondeados, pagos_detallados, vuelto = liquidar_sesion(
+            {
+                "hora_inicio": hora_inicio,
+                "hora_fin": hora_fin,
+                "monto_total": monto_total,
+                "jugadores": canonicos,
+            }
+        )
+        resultado = (
+            {p.nombre: p for p in pagos_redondeados},
+            {p.nombre: p for p in pagos_detallados},
+            vuelto,
+        )
+        cache.guardar(clave, resultado)
+
+    redondeados, detallados, vuelto = resultado
+    nombres = [j["nombre"] for j in jugadores if j["nombre"]]
+    return (
+        [Pago(**redondeados[n].a_dict()) for n in nombres],
+        [Pago(**detallados[n].a_dict()) for n in nombres],
+        vuelto,
+    )
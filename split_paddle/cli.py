@@ -0,0 +1,503 @@
+import argparse
+import os
+import sys
+
+from . import medicion
+from .directorio import Directorio, normalizar
+from .flujo import (
+    escribir_resultados_jsonl,
+    leer_reservas_csv,
+    leer_reservas_jsonl,
+    liquidar_reservas,
+)
+from .horas import FORMATO_DECIMAL, parsear_hora
+from .incremental import LiquidacionIncremental
+from .pagos import calcular_pagos_por_intervalos
+
+
+def pedir_float(mensaje, minimo=None, maximo=None):
+    """
+    Solicita un número (ej: 10000, 12500.50). Solo acepta el punto como separador decimal.
+    """
+    while True:
+        valor_ingresado = input(f"{mensaje}\n> ").strip()
+        try:
+            if "," in valor_ingresado:
+                raise ValueError
+            valor = float(valor_ingresado)
+        except ValueError:
+            print("Formato inválido. Usa solo números y el punto decimal.")
+            continue
+        if minimo is not None and valor < minimo:
+            print(f"Error: mínimo {minimo}")
+            continue
+        if maximo is not None and valor > maximo:
+            print(f"Error: máximo {maximo}")
+            continue
+        return valor
+
+
+def pedir_hora(mensaje, minimo=None, maximo=None):
+    """
+    Solicita una hora en formato decimal (ej: 18, 18.25, 18.5, 18.75) y la devuelve
+    en decimal de horas. Escribiendo '?' se muestra la ayuda.
+    """
+    ayuda = (
+        "\nEjemplos válidos:\n"
+        "  18     → 18:00\n"
+        "  18.25  → 18:15\n"
+        "  18.5   → 18:30\n"
+        "  18.75  → 18:45\n"
+        "Solo se acepta el punto como separador decimal y cuartos de hora.\n"
+    )
+    while True:
+        valor_ingresado = input(f"{mensaje}\n> ").strip()
+        if valor_ingresado == "?":
+            print(ayuda)
+            continue
+        try:
+            valor = parsear_hora(valor_ingresado, FORMATO_DECIMAL)
+        except ValueError as e:
+            print(f"{e} Escribe '?' para ayuda.")
+            continue
+        if minimo is not None and valor < minimo:
+            print(f"Error: mínimo {minimo}")
+            continue
+        if maximo is not None and valor > maximo:
+            print(f"Error: máximo {maximo}")
+            continue
+        return valor
+
+
+def pedir_nombre(mensaje, usados, directorio=None, vacio=False):
+    """
+    Solicita el nombre de un jugador que no esté en usados (nombres normalizados).
+    Con directorio, si el nombre no está tal cual ofrece los parecidos para elegir
+    uno, y el nombre elegido queda en el directorio. Con vacio, una línea vacía
+    devuelve "" (para terminar de cargar).
+    """
+    while True:
+        nombre = input(mensaje).strip()
+        if not nombre:
+            if vacio:
+                return ""
+            print("Nombre vacío.")
+            continue
+        if directorio is not None:
+            nombre = elegir_del_directorio(nombre, directorio)
+        if normalizar(nombre) in usados:
+            print("Nombre repetido.")
+            continue
+        if directorio is not None:
+            directorio.agregar(nombre)
+        return nombre
+
+
+def elegir_del_directorio(nombre, directorio):
+    """
+    El nombre como está en el directorio o, si no está, el que se elija entre los
+    sugeridos (o el escrito, si no se elige ninguno).
+    """
+    existente = directorio.buscar(nombre)
+    if existente is not None:
+        return existente
+    sugeridos = directorio.sugerir(nombre)
+    if not sugeridos:
+        return nombre
+    for idx, sugerido in enumerate(sugeridos, 1):
+        print(f"{idx}. {sugerido}")
+    print(f"0. {nombre} (nuevo)")
+    eleccion = input("¿Quién es? (0 para dejarlo como está): ").strip()
+    if eleccion.isdigit() and 1 <= int(eleccion) <= len(sugeridos):
+        return sugeridos[int(eleccion) - 1]
+    return nombre
+
+
+def pedir_jugadores(
+    hora_inicio_cancha, hora_fin_cancha, monto_total=None, directorio=None
+):
+    """
+    Carga los 4 jugadores iniciales (deben estar desde el inicio) y permite agregar más.
+    Para los 4 iniciales, llegada = hora de inicio. Permite editar antes de calcular.
+    Con monto_total, el menú de edición muestra cuánto va pagando cada uno y lo
+    actualiza solo para los jugadores afectados por cada cambio. Con directorio, los
+    nombres se autocompletan con los jugadores del club (ver pedir_nombre).
+    """
+    jugadores = []
+    usados = set()
+    print("Jugadores iniciales (4):")
+    for i in range(4):
+        nombre = pedir_nombre(f"Nombre #{i+1}: ", usados, directorio)
+        usados.add(normalizar(nombre))
+        llegada = hora_inicio_cancha
+        hasta_el_final = (
+            input(f"{nombre.upper()} ¿hasta el final? (s/n): ").strip().lower()
+        )
+        if hasta_el_final == "s":
+            salida = hora_fin_cancha
+        else:
+            salida = pedir_hora(
+                f"¿A qué hora se va {nombre.upper()}?: ",
+                minimo=llegada,
+                maximo=hora_fin_cancha,
+            )
+        jugadores.append({"nombre": nombre, "llegada": llegada, "salida": salida})
+
+    print("\n¿Agregar más jugadores? (vacío para terminar)")
+    while True:
+        nombre = pedir_nombre(
+            "Nombre (vacío para terminar): ", usados, directorio, vacio=True
+        )
+        if not nombre:
+            break
+        usados.add(normalizar(nombre))
+        llegada = pedir_hora(
+            f"Llegó {nombre.upper()} (>= {hora_inicio_cancha}): ",
+            minimo=hora_inicio_cancha,
+            maximo=hora_fin_cancha,
+        )
+        hasta_el_final = (
+            input(f"{nombre.upper()} ¿hasta el final? (s/n): ").strip().lower()
+        )
+        if hasta_el_final == "s":
+            salida = hora_fin_cancha
+        else:
+            salida = pedir_hora(
+                f"¿A qué hora se va {nombre.upper()}?: ",
+                minimo=llegada,
+                maximo=hora_fin_cancha,
+            )
+        jugadores.append({"nombre": nombre, "llegada": llegada, "salida": salida})
+
+    # Edición rápida antes de calcular con menú numérico
+    liquidacion = None
+    if monto_total is not None:
+        liquidacion = LiquidacionIncremental(
+            jugadores, monto_total, hora_inicio_cancha, hora_fin_cancha
+        )
+    while jugadores:
+        print("\nJugadores:")
+        for idx, j in enumerate(jugadores, 1):
+            pago = f" ${liquidacion.pago(j['nombre']):.0f}" if liquidacion else ""
+            print(f"{idx}. {j['nombre'].upper()} {j['llegada']}→{j['salida']}{pago}")
+        print("0. Continuar")
+        seleccion = input("Nro a editar/eliminar (0 para seguir): ")
+
+        if seleccion == "0":
+            break
+
+        if not seleccion.isdigit() or not (1 <= int(seleccion) <= len(jugadores)):
+            print("Opción inválida.")
+            continue
+
+        seleccionado = jugadores[int(seleccion) - 1]
+        print(
+            f"1. Editar nombre\n2. Editar llegada\n3. Editar salida\n4. Eliminar jugador\n0. Volver"
+        )
+        accion = input("Elige opción: ").strip()
+        if accion == "1":
+            nuevo_nombre = input("Nuevo nombre: ").strip()
+            if nuevo_nombre and directorio is not None:
+                nuevo_nombre = elegir_del_directorio(nuevo_nombre, directorio)
+            if nuevo_nombre and normalizar(nuevo_nombre) not in usados:
+                if directorio is not None:
+                    directorio.agregar(nuevo_nombre)
+                if liquidacion:
+                    liquidacion.renombrar(seleccionado["nombre"], nuevo_nombre)
+                usados.discard(normalizar(seleccionado["nombre"]))
+                usados.add(normalizar(nuevo_nombre))
+                seleccionado["nombre"] = nuevo_nombre
+            else:
+                print("Nombre inválido o repetido.")
+        elif accion == "2":
+            nuevo_llegada = pedir_hora(
+                f"Llegada {seleccionado['nombre'].upper()}: ",
+                minimo=hora_inicio_cancha,
+                maximo=hora_fin_cancha,
+            )
+            if nuevo_llegada > seleccionado["salida"]:
+                print("Llegada > salida.")
+            else:
+                seleccionado["llegada"] = nuevo_llegada
+                if liquidacion:
+                    liquidacion.modificar(seleccionado["nombre"], llegada=nuevo_llegada)
+        elif accion == "3":
+            nuevo_salida = pedir_hora(
+                f"Salida {seleccionado['nombre'].upper()}: ",
+                minimo=seleccionado["llegada"],
+                maximo=hora_fin_cancha,
+            )
+            if nuevo_salida < seleccionado["llegada"]:
+                print("Salida < llegada.")
+            else:
+                seleccionado["salida"] = nuevo_salida
+                if liquidacion:
+                    liquidacion.modificar(seleccionado["nombre"], salida=nuevo_salida)
+        elif accion == "4":
+            if len(jugadores) <= 4:
+                print("No puedes eliminar iniciales.")
+            else:
+                jugadores.pop(int(seleccion) - 1)
+                usados.discard(normalizar(seleccionado["nombre"]))
+                if liquidacion:
+                    liquidacion.quitar(seleccionado["nombre"])
+                print("Eliminado.")
+        elif accion == "0":
+            continue
+        else:
+            print("Opción inválida.")
+    return jugadores
+
+
+@medicion.medido("mostrar_pagos")
+def mostrar_pagos(
+    lista_pagos,
+    hora_inicio=None,
+    hora_fin=None,
+    pagos_detallados=None,
+    monto_total=None,
+):
+    """
+    Muestra los pagos por pantalla en formato breve y claro, adaptado a móviles.
+    """
+    if not lista_pagos:
+        print("Sin jugadores.")
+        return
+
+    max_tiempo = max(pago["tiempo"] for pago in lista_pagos)
+    min_tiempo = min(pago["tiempo"] for pago in lista_pagos)
+    max_nombre = max(len(p["nombre"]) for p in lista_pagos)
+
+    print("\n=== RESUMEN ===")
+    for i, pago in enumerate(lista_pagos):
+        marca = ""
+        if pago["tiempo"] == max_tiempo and max_tiempo != min_tiempo:
+            marca = " ★"
+        elif pago["tiempo"] == min_tiempo and max_tiempo != min_tiempo:
+            marca = " →"
+        # Convertir tiempo decimal a horas:minutos
+        horas = int(pago["tiempo"])
+        minutos = int(round((pago["tiempo"] - horas) * 60))
+        tiempo_str = f"{horas}:{minutos:02d}"
+        print(
+            f"{pago['nombre'].upper().ljust(max_nombre)} ${pago['pago']:>6.0f} {tiempo_str}{marca}"
+        )
+        if pagos_detallados:
+            pago_exact = pagos_detallados[i]["pago"]
+            print(f"  Exacto: ${pago_exact:.2f}")
+
+    if hora_inicio is not None and hora_fin is not None:
+        total_horas_cancha = hora_fin - hora_inicio
+        horas = int(total_horas_cancha)
+        minutos = int(round((total_horas_cancha - horas) * 60))
+        print(f"Cancha: {horas}h {minutos}min ({total_horas_cancha:.2f}h)")
+
+    suma_pagos = sum(p["pago"] for p in lista_pagos)
+    print(f"Total: ${suma_pagos:.0f}")
+
+    if monto_total is not None and suma_pagos != round(monto_total):
+        print(f"¡Atención! Suma ≠ total (${monto_total:.0f})")
+
+
+def main(historial=None, directorio=None):
+    """
+    Función principal. Solicita los datos, calcula y muestra los pagos.
+    Incluye validaciones proactivas. Con directorio, autocompleta los nombres.
+    """
+    print("=== Paddle Split ===")
+    while True:
+        # Permitir formatos flexibles para hora de inicio y fin de cancha
+        hora_inicio = pedir_hora(
+            "Hora de inicio de la cancha (ej: 18.0, 18.25, 18.5, 18.75): ",
+            minimo=0,
+        )
+        hora_fin = pedir_hora(
+            "Hora de fin de la cancha (ej: 20.0, 20.25, 20.5, 20.75): ",
+            minimo=hora_inicio,
+        )
+        if hora_fin < hora_inicio:
+            print("Error: La hora de fin no puede ser menor que la hora de inicio.")
+            continue
+        monto_total = pedir_float("Total a pagar ($): ", minimo=0.01)
+        jugadores = pedir_jugadores(
+            hora_inicio_cancha=hora_inicio,
+            hora_fin_cancha=hora_fin,
+            monto_total=monto_total,
+            directorio=directorio,
+        )
+        if not jugadores or len(jugadores) < 4:
+            print("Error: Debes ingresar al menos 4 jugadores.")
+            continue
+
+        # Advertir si algún jugador no jugó tiempo
+        jugadores_sin_tiempo = [
+            j["nombre"] for j in jugadores if j["llegada"] == j["salida"]
+        ]
+        if jugadores_sin_tiempo:
+            print(
+                "Advertencia: Los siguientes jugadores no tienen tiempo jugado (llegada = salida):"
+            )
+            for nombre in jugadores_sin_tiempo:
+                print(f"- {nombre.upper()}")
+            seguir = input("¿Deseas continuar igual? (s/n): ").strip().lower()
+            if seguir != "s":
+                continue
+
+        for jugador in jugadores:
+            if jugador["llegada"] > jugador["salida"]:
+                print(
+                    f"Error: {jugador['nombre']} tiene hora de llegada mayor que la de salida."
+                )
+                break
+            if jugador["salida"] > hora_fin:
+                print(
+                    f"Advertencia: {jugador['nombre']} tiene hora de salida después del fin de la cancha. Se ajustará a {hora_fin}."
+                )
+                jugador["salida"] = hora_fin
+
+        lista_pagos, pagos_detallados = calcular_pagos_por_intervalos(
+            jugadores, monto_total, hora_inicio, hora_fin
+        )
+
+        # Validar suma de tiempos
+        suma_tiempos = sum(info["tiempo"] for info in pagos_detallados)
+        if suma_tiempos == 0:
+            print(
+                "Error: La suma de tiempos jugados es cero. Debes ingresar datos válidos."
+            )
+            continue
+
+        print("\n--- Pagos ---")
+        mostrar_pagos(lista_pagos, hora_inicio, hora_fin, pagos_detallados, monto_total)
+        if historial is not None:
+            historial.guardar(
+                {
+                    "hora_inicio": hora_inicio,
+                    "hora_fin": hora_fin,
+                    "monto_total": monto_total,
+                    "jugadores": jugadores,
+                },
+                lista_pagos,
+                pagos_detallados,
+            )
+            historial.confirmar()
+
+        # Preguntar si desea volver a ejecutar o salir
+        reiniciar = input("\n¿Deseas ingresar nuevos datos? (s/n): ").strip().lower()
+        if reiniciar != "s":
+            print("¡Hasta luego!")
+            break
+
+
+def main_archivos(entrada, formato=None, salida="-", historial=None):
+    """
+    Modo no interactivo: lee reservas de un CSV o JSONL (o de la entrada estándar con
+    "-"), las liquida una por una y escribe cada resultado como una línea JSON.
+    Con historial, además guarda cada reserva liquidada.
+    """
+    if formato is None:
+        formato = "csv" if entrada.lower().endswith(".csv") else "jsonl"
+    archivo_entrada = (
+        sys.stdin if entrada == "-" else open(entrada, encoding="utf-8", newline="")
+    )
+    archivo_salida = (
+        sys.stdout if salida == "-" else open(salida, "w", encoding="utf-8")
+    )
+    try:
+        leer = leer_reservas_csv if formato == "csv" else leer_reservas_jsonl
+        liquidadas, con_error = escribir_resultados_jsonl(
+            liquidar_reservas(
+                leer(archivo_entrada),
+                historial.guardar if historial is not None else None,
+            ),
+            archivo_salida,
+        )
+    finally:
+        if archivo_entrada is not sys.stdin:
+            archivo_entrada.close()
+        if archivo_salida is not sys.stdout:
+            archivo_salida.close()
+    print(
+        f"Reservas liquidadas: {liquidadas}. Con error: {con_error}.", file=sys.stderr
+    )
+    return 1 if con_error else 0
+
+
+def parsear_argumentos(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Divide el costo de una cancha de paddle según el tiempo jugado."
+    )
+    parser.add_argument(
+        "--entrada",
+        help="CSV o JSONL con reservas a liquidar ('-' para la entrada estándar). "
+        "Sin esta opción se piden los datos por consola.",
+    )
+    parser.add_argument(
+        "--formato",
+        choices=("csv", "jsonl"),
+        help="Formato de la entrada (por defecto se deduce de la extensión).",
+    )
+    parser.add_argument(
+        "--salida",
+        default="-",
+        help="Archivo JSONL de resultados ('-' para la salida estándar).",
+    )
+    parser.add_argument(
+        "--historial",
+        help="Base SQLite donde guardar cada sesión liquidada (se crea si no existe).",
+    )
+    parser.add_argument(
+        "--directorio",
+        default=os.environ.get("SPLIT_PADDLE_DIRECTORIO"),
+        help="Archivo con los jugadores del club, uno por línea, para autocompletar "
+        "los nombres en el modo interactivo (se crea si no existe; por defecto "
+        "$SPLIT_PADDLE_DIRECTORIO).",
+    )
+    parser.add_argument(
+        "--medir",
+        nargs="?",
+        const="json",
+        choices=("json", "prometheus"),
+        help="Al terminar, escribir en stderr el tiempo de cada etapa (JSON por "
+        "defecto, o en formato Prometheus).",
+    )
+    return parser.parse_args(argv)
+
+
+def ejecutar(argv=None):
+    """
+    Punto de entrada de python3 -m split_paddle: liquida archivos si se pasa
+    --entrada y si no arranca el modo interactivo.
+    """
+    args = parsear_argumentos(argv)
+    if args.medir:
+        medicion.activar()
+    historial = None
+    directorio = None
+    if args.historial:
+        # sqlite3 se importa solo si se pide el historial.
+        from .historial import Historial
+
+        historial = Historial(args.historial)
+    try:
+        if args.entrada:
+            sys.exit(main_archivos(args.entrada, args.formato, args.salida, historial))
+        print(
+            "Usa solo números y puntos para las horas. Ejemplo: 18.25 para 18:15, 18.5 para 18:30"
+        )
+        if args.directorio:
+            directorio = (
+                Directorio.cargar(args.directorio)
+                if os.path.exists(args.directorio)
+                else Directorio()
+            )
+        main(historial, directorio)
+    finally:
+        if historial is not None:
+            historial.cerrar()
+        if directorio is not None and directorio.modificado:
+            directorio.guardar(args.directorio)
+        if args.medir == "prometheus":
+            print(medicion.a_prometheus(), end="", file=sys.stderr)
+        elif args.medir:
+            print(medicion.a_json(), file=sys.stderr)
@@ -0,0 +1,168 @@
+from math import lcm
+
+
+def a_centavos(monto):
+    """
+    Convierte un monto en pesos a centavos enteros.
+    """
+    return round(monto * 100)
+
+
+def repartir_proporcional(total, pesos):
+    """
+    Reparte total unidades enteras (pesos, centavos...) en proporción a pesos enteros
+    no negativos, con el método del resto mayor: cada uno recibe la parte entera de su
+    cuota y las unidades que sobran van a los restos más grandes. La suma da siempre
+    exactamente total. Los empates se resuelven por orden (gana el primero).
+    Si todos los pesos son cero se reparte en partes iguales.
+    """
+    if not pesos:
+        if total:
+            raise ValueError("No hay entre quiénes repartir el total.")
+        return []
+    suma = sum(pesos)
+    if suma == 0:
+        pesos = [1] * len(pesos)
+        suma = len(pesos)
+    cuotas = []
+    restos = []
+    for peso in pesos:
+        cuota, resto = divmod(total * peso, suma)
+        cuotas.append(cuota)
+        restos.append(resto)
+    sobrante = total - sum(cuotas)
+    if sobrante:
+        for idx in sorted(range(len(pesos)), key=lambda i: -restos[i])[:sobrante]:
+            cuotas[idx] += 1
+    return cuotas
+
+
+def pesos_por_tramo(tramos, precios=None):
+    """
+    Peso entero de cada tramo (llegada, salida) en minutos: la suma, sobre los
+    intervalos que cubre, de duración / jugadores presentes, escalada por el mínimo
+    común múltiplo de las cantidades de presentes para que todo sea entero.
+    Dos tramos con el mismo peso pagan exactamente lo mismo.
+
+    precios, si se pasa, es una lista de (minuto_desde, precio entero) ordenada: cada
+    minuto pesa su precio. El primero rige desde el principio.
+    """
+    eventos = []
+    for idx, (llegada, salida) in enumerate(tramos):
+        eventos.append((llegada, 0, idx))
+        eventos.append((salida, 1, idx))
+    precio = 1
+    if precios:
+        precio = precios[0][1]
+        eventos.extend((desde, 2, valor) for desde, valor in precios[1:])
+    eventos.sort()
+
+    # 1ª pasada: qué cantidades de presentes aparecen en intervalos con duración
+    cantidades = set()
+    presentes = 0
+    ultimo_tiempo = None
+    for tiempo, tipo, _ in eventos:
+        if presentes and tiempo > ultimo_tiempo:
+            cantidades.add(presentes)
+        ultimo_tiempo = tiempo
+        if tipo == 0:
+            presentes += 1
+        elif tipo == 1:
+            presentes -= 1
+    escala = lcm(*cantidades) if cantidades else 1
+
+    # 2ª pasada: acumulado entero de minutos por cabeza
+    pesos = [0] * len(tramos)
+    acumulado = 0
+    presentes = 0
+    ultimo_tiempo = None
+    for tiempo, tipo, idx in eventos:
+        if presentes and tiempo > ultimo_tiempo:
+            acumulado += (tiempo - ultimo_tiempo) * precio * (escala // presentes)
+        ultimo_tiempo = tiempo
+        if tipo == 0:
+            pesos[idx] -= acumulado
+            presentes += 1
+        elif tipo == 1:
+            pesos[idx] += acumulado
+            presentes -= 1
+        else:
+            precio = idx
+    return pesos
+
+
+def liquidar_en_centavos(tramos, monto_centavos):
+    """
+    Reparte monto_centavos entre tramos (llegada, salida) en minutos enteros según la
+    regla de prorrateo por intervalos. Todo se calcula con enteros: la suma da
+    exactamente el monto y no hace falta corregir redondeos después.
+    Si hay ratos sin nadie en cancha, ese costo se reparte en proporción a lo jugado.
+    """
+    return repartir_proporcional(monto_centavos, pesos_por_tramo(tramos))
+
+
+def redondear_efectivo(centavos, es_efectivo, denominacion):
+    """
+    Decide cuánto paga cada uno cuando el efectivo va en múltiplos de denominacion
+    (todo en centavos enteros). El total a cobrar es sum(centavos).
+
+    Entre todas las formas de redondear el efectivo (hacia abajo o hacia arriba, sin
+    saltar más de un múltiplo) elige la que hace más chico el mayor desvío respecto de
+    lo exacto; la diferencia la reparte en partes iguales entre quienes pagan con
+    billetera, así el total coincide justo. Con la misma cantidad k de redondeos para
+    arriba, lo mejor es subir a los k de resto más grande, así que alcanza con ordenar
+    los restos una vez y probar cada k: O(n log n). Si empatan, gana el k más chico.
+
+    Sin billetera no siempre se puede llegar justo: se suben los restos más grandes
+    hasta cubrir el total, y lo que sobra hay que devolverlo como vuelto.
+    Devuelve (pagos en centavos, vuelto en centavos).
+    """
+    if denominacion < 1:
+        raise ValueError("La denominación debe ser de al menos un centavo.")
+    pagos = list(centavos)
+    efectivo = [i for i, es in enumerate(es_efectivo) if es]
+    pendiente = 0
+    for i in efectivo:
+        resto = centavos[i] % denominacion
+        pagos[i] -= resto
+        pendiente += resto
+    if not pendiente:
+        # El efectivo ya va en billetes: nadie se mueve y no hay nada que probar.
+        return pagos, 0
+
+    efectivo.sort(key=lambda i: -(centavos[i] % denominacion))
+    restos = [centavos[i] % denominacion for i in efectivo]
+    # Solo absorben diferencias los que pagan algo con billetera.
+    billetera = [i for i, es in enumerate(es_efectivo) if not es and centavos[i] > 0]
+
+    if not billetera:
+        subir = min(-(-pendiente // denominacion), len(efectivo))
+        for i in efectivo[:subir]:
+            pagos[i] += denominacion
+        return pagos, max(subir * denominacion - pendiente, 0)
+
+    # Mayor desvío del efectivo si suben los k primeros: el más chico de los que
+    # suben paga denominacion - resto de más; el más grande de los que no, resto de
+    # menos.
+    minimo_billetera = min(centavos[i] for i in billetera)
+    mejor = None
+    for k in range(len(efectivo) + 1):
+        diferencia = pendiente - k * denominacion
+        desvio_billetera = -(-abs(diferencia) // len(billetera))
+        if diferencia < 0 and desvio_billetera > minimo_billetera:
+            break  # desde acá la billetera tendría que pagar menos que cero
+        desvio = max(
+            denominacion - restos[k - 1] if k else 0,
+            restos[k] if k < len(restos) else 0,
+            desvio_billetera,
+        )
+        if mejor is None or desvio < mejor[0]:
+            mejor = (desvio, k, diferencia)
+    _, subir, diferencia = mejor
+    for i in efectivo[:subir]:
+        pagos[i] += denominacion
+    for i, extra in zip(
+        billetera, repartir_proporcional(diferencia, [1] * len(billetera))
+    ):
+        pagos[i] += extra
+    return pagos, 0
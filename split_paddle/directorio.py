@@ -0,0 +1,305 @@
+"""
+Directorio de jugadores del club, para autocompletar nombres en la página y en la
+consola aunque sean miles.
+
+Los nombres se comparan normalizados: sin mayúsculas, sin tildes y sin espacios de
+más ("  José  Pérez" es "jose perez"). Hay tres índices:
+
+- normalizado -> nombre (dict): si un jugador existe y cómo se escribe, O(1).
+- las claves ordenadas (el nombre entero y desde cada palabra, así "per" encuentra a
+  "José Pérez"): búsqueda por prefijo con bisect, O(log n + k).
+- palabra -> jugadores, y trigramas -> palabras: para errores de tipeo. Cada palabra
+  de la consulta se compara (coeficiente de Dice sobre trigramas) solo con las
+  palabras distintas del directorio, que son muchas menos que los jugadores porque
+  los nombres y apellidos se repiten; después se cruzan los jugadores de las
+  palabras más parecidas.
+
+Se guarda como texto, un nombre por línea (UTF-8).
+"""
+
+import os
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from heapq import heappop, heappush, nsmallest
+from itertools import chain
+from math import ceil, prod
+
+# Coeficiente de Dice mínimo para que una palabra cuente como parecida.
+COINCIDENCIA_MINIMA = 0.4
+# Cuántas palabras parecidas se prueban por cada palabra de la consulta.
+PALABRAS_PARECIDAS = 3
+# Cuántas combinaciones de esas palabras se cruzan, de la más parecida a la menos.
+COMBINACIONES = 12
+# Cuántas palabras de la consulta se tienen en cuenta (las primeras).
+PALABRAS_CONSULTA = 5
+
+
+def normalizar(nombre):
+    """
+    El nombre en minúsculas, sin tildes y con un solo espacio entre palabras.
+    """
+    descompuesto = unicodedata.normalize("NFKD", nombre)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_tildes.casefold().split())
+
+
+def trigramas(palabra):
+    relleno = f"  {palabra} "
+    return {relleno[i : i + 3] for i in range(len(relleno) - 2)}
+
+
+def _mejores_combinaciones(opciones, cantidad):
+    """
+    Las `cantidad` combinaciones (una (dice, palabra) de cada lista de opciones) con
+    mayor producto de parecidos, de mayor a menor. Cada lista está ordenada de mayor
+    a menor, así que se recorren desde la primera de todas con un heap, sin armar las
+    len(lista) ** len(opciones) combinaciones.
+    """
+
+    def puntaje(posiciones):
+        return -prod(opciones[i][p][0] for i, p in enumerate(posiciones))
+
+    inicio = (0,) * len(opciones)
+    pendientes = [(puntaje(inicio), inicio)]
+    vistas = {inicio}
+    while pendientes and cantidad > 0:
+        _, posiciones = heappop(pendientes)
+        yield [opciones[i][p] for i, p in enumerate(posiciones)]
+        cantidad -= 1
+        for i, p in enumerate(posiciones):
+            if p + 1 < len(opciones[i]):
+                siguiente = posiciones[:i] + (p + 1,) + posiciones[i + 1 :]
+                if siguiente not in vistas:
+                    vistas.add(siguiente)
+                    heappush(pendientes, (puntaje(siguiente), siguiente))
+
+
+class Directorio:
+    """
+    Nombres de los jugadores, sin repetidos (según normalizar), en el orden en que se
+    agregaron. modificado avisa si cambió desde que se cargó o se guardó. Se puede
+    compartir entre hilos (Streamlit atiende cada sesión en un hilo distinto): las
+    búsquedas toman el mismo lock que agregar, así nunca recorren un índice a medio
+    actualizar.
+    """
+
+    def __init__(self, nombres=()):
+        self._nombres = []
+        self._por_clave = {}
+        # (clave desde cada palabra, id), ordenadas
+        self._claves = []
+        # id -> clave del nombre
+        self._claves_nombre = []
+        # palabra -> [(clave del nombre, id)], ordenadas, y los mismos ids en un set
+        self._por_palabra = {}
+        self._ids_por_palabra = {}
+        # trigrama -> palabras que lo tienen; palabra -> cuántos trigramas tiene
+        self._por_trigrama = {}
+        self._cantidad_trigramas = {}
+        self._ordenados = None
+        # Reentrante: sugerir lo toma y llama a las otras búsquedas.
+        self._lock = threading.RLock()
+        # De a muchos, las listas se ordenan una sola vez al final.
+        for nombre in nombres:
+            self._agregar(nombre, ordenar=False)
+        self._claves.sort()
+        for con_palabra in self._por_palabra.values():
+            con_palabra.sort()
+        self.modificado = False
+
+    def __len__(self):
+        return len(self._nombres)
+
+    def __contains__(self, nombre):
+        return normalizar(nombre) in self._por_clave
+
+    def agregar(self, nombre):
+        """
+        Agrega un jugador si no estaba. Devuelve el nombre como quedó en el directorio
+        (el que ya estaba, si era un repetido). Lanza ValueError si está vacío.
+        """
+        with self._lock:
+            return self._agregar(nombre, ordenar=True)
+
+    def _agregar(self, nombre, ordenar):
+        nombre = " ".join(nombre.split())
+        clave = normalizar(nombre)
+        if not clave:
+            raise ValueError("El nombre está vacío.")
+        indice = self._por_clave.get(clave)
+        if indice is not None:
+            return self._nombres[indice]
+
+        meter = insort if ordenar else list.append
+        indice = len(self._nombres)
+        self._nombres.append(nombre)
+        self._por_clave[clave] = indice
+        palabras = clave.split(" ")
+        for i in range(len(palabras)):
+            meter(self._claves, (" ".join(palabras[i:]), indice))
+        self._claves_nombre.append(clave)
+        for palabra in set(palabras):
+            if palabra not in self._por_palabra:
+                self._por_palabra[palabra] = []
+                self._ids_por_palabra[palabra] = set()
+                propios = trigramas(palabra)
+                self._cantidad_trigramas[palabra] = len(propios)
+                for trigrama in propios:
+                    self._por_trigrama.setdefault(trigrama, []).append(palabra)
+            meter(self._por_palabra[palabra], (clave, indice))
+            self._ids_por_palabra[palabra].add(indice)
+        self._ordenados = None
+        self.modificado = True
+        return nombre
+
+    def buscar(self, nombre):
+        """
+        El nombre como está en el directorio, o None si no está.
+        """
+        clave = normalizar(nombre)
+        with self._lock:
+            indice = self._por_clave.get(clave)
+            return None if indice is None else self._nombres[indice]
+
+    def nombres(self):
+        """
+        Todos los nombres, en orden alfabético (sin distinguir tildes ni mayúsculas).
+        """
+        with self._lock:
+            if self._ordenados is None:
+                orden = sorted(
+                    range(len(self._nombres)), key=self._claves_nombre.__getitem__
+                )
+                self._ordenados = [self._nombres[indice] for indice in orden]
+            return list(self._ordenados)
+
+    def con_prefijo(self, prefijo, limite=10):
+        """
+        Hasta `limite` jugadores con alguna palabra que empiece con prefijo (desde esa
+        palabra hasta el final del nombre), en orden alfabético de la coincidencia.
+        """
+        prefijo = normalizar(prefijo)
+        if not prefijo:
+            return []
+        with self._lock:
+            return self._con_prefijo(prefijo, limite)
+
+    def _con_prefijo(self, prefijo, limite):
+        resultado = []
+        vistos = set()
+        claves = self._claves
+        for i in range(bisect_left(claves, (prefijo,)), len(claves)):
+            clave, indice = claves[i]
+            if not clave.startswith(prefijo) or len(resultado) >= limite:
+                break
+            if indice not in vistos:
+                vistos.add(indice)
+                resultado.append(self._nombres[indice])
+        return resultado
+
+    def parecidos(self, texto, limite=5):
+        """
+        Hasta `limite` jugadores que se parecen a texto aunque tenga errores de
+        tipeo: los que tienen, por cada palabra de texto, una palabra parecida. Van
+        primero los de palabras más parecidas y, a igual parecido, en orden
+        alfabético. Las palabras de texto sin ninguna parecida no se tienen en cuenta,
+        y solo cuentan las primeras PALABRAS_CONSULTA.
+        """
+        palabras_texto = list(dict.fromkeys(normalizar(texto).split()))
+        with self._lock:
+            return self._parecidos(palabras_texto, limite)
+
+    def _parecidos(self, palabras_texto, limite):
+        opciones = [
+            self._palabras_parecidas(p) for p in palabras_texto[:PALABRAS_CONSULTA]
+        ]
+        opciones = [o for o in opciones if o]
+        if not opciones:
+            return []
+        resultado = []
+        vistos = set()
+        for combinacion in _mejores_combinaciones(opciones, COMBINACIONES):
+            faltan = limite - len(resultado)
+            if faltan <= 0:
+                break
+            palabras = {palabra for _, palabra in combinacion}
+            if len(palabras) == 1:
+                # Ya están en orden alfabético: alcanza con los primeros.
+                (palabra,) = palabras
+                ids = []
+                for _, indice in self._por_palabra[palabra]:
+                    if len(ids) >= faltan:
+                        break
+                    if indice not in vistos:
+                        ids.append(indice)
+            else:
+                ids = set.intersection(
+                    *(self._ids_por_palabra[p] for p in palabras)
+                ).difference(vistos)
+                ids = sorted(ids, key=self._claves_nombre.__getitem__)[:faltan]
+            vistos.update(ids)
+            resultado += [self._nombres[indice] for indice in ids]
+        return resultado
+
+    def _palabras_parecidas(self, palabra):
+        """
+        Las (dice, palabra) del directorio más parecidas a palabra, de mayor a menor.
+        """
+        consulta = trigramas(palabra)
+        comunes = Counter(
+            chain.from_iterable(self._por_trigrama.get(t, ()) for t in consulta)
+        )
+        # Con c trigramas en común, dice <= 2c / (m + c): por debajo de este mínimo
+        # de c ni hace falta calcularlo.
+        m = len(consulta)
+        minimo = ceil(COINCIDENCIA_MINIMA * m / (2 - COINCIDENCIA_MINIMA))
+        cantidad = self._cantidad_trigramas
+        mejores = nsmallest(
+            PALABRAS_PARECIDAS,
+            [
+                (-2 * c / (m + cantidad[otra]), otra)
+                for otra, c in comunes.items()
+                if c >= minimo
+            ],
+        )
+        return [(-dice, otra) for dice, otra in mejores if -dice >= COINCIDENCIA_MINIMA]
+
+    def sugerir(self, texto, limite=5):
+        """
+        Sugerencias para lo que se está escribiendo: el nombre exacto, después los que
+        empiezan así y al final los parecidos, sin repetir.
+        """
+        resultado = []
+        with self._lock:
+            exacto = self.buscar(texto)
+            if exacto is not None:
+                resultado.append(exacto)
+            for buscar in (self.con_prefijo, self.parecidos):
+                if len(resultado) >= limite:
+                    break
+                for nombre in buscar(texto, limite):
+                    if len(resultado) < limite and nombre not in resultado:
+                        resultado.append(nombre)
+        return resultado
+
+    def guardar(self, ruta):
+        """
+        Guarda los nombres, uno por línea. Escribe a un archivo temporal y lo renombra,
+        así un corte a mitad de camino no deja el directorio a medias.
+        """
+        temporal = f"{ruta}.tmp"
+        with self._lock:
+            with open(temporal, "w", encoding="utf-8") as archivo:
+                archivo.writelines(f"{nombre}\n" for nombre in self._nombres)
+            os.replace(temporal, ruta)
+            self.modificado = False
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Lee un directorio guardado con guardar(). Las líneas vacías se ignoran.
+        """
+        with open(ruta, encoding="utf-8") as archivo:
+            return cls(linea for linea in archivo if linea.strip())
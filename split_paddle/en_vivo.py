@@ -0,0 +1,282 @@
+"""
+Cuenta en vivo de una cancha a partir de los eventos del molinete: cada entrada o
+salida actualiza lo que lleva gastado cada jugador mientras juega.
+
+CuentaEnVivo es el núcleo (sin asyncio): la misma regla que
+pagos.calcular_pagos_por_intervalos, pero avanzando el "costo por cabeza" evento a
+evento, así que cada evento cuesta O(1). Tablero la alimenta desde una cola de
+asyncio para que el lector del molinete solo tenga que publicar los eventos.
+"""
+
+import asyncio
+from math import isclose
+
+from .dinero import a_centavos, pesos_por_tramo, repartir_proporcional
+from .horas import hora_a_minutos
+from .pagos import calcular_pagos_por_intervalos
+from .registros import Pago
+from .tarifas import franjas
+
+ENTRADA = "entrada"
+SALIDA = "salida"
+
+
+class CuentaEnVivo:
+    """
+    Lo que lleva gastado cada jugador de una cancha, al día con el último evento.
+
+    Guarda el costo por cabeza acumulado desde el inicio y, por cada jugador en
+    cancha, cuánto valía al entrar: lo que lleva es la diferencia. Una entrada o
+    salida avanza el acumulado hasta su hora (más los cambios de precio de la tarifa
+    que haya en el medio) y toca solo a ese jugador. Los eventos tienen que llegar en
+    orden de hora; las horas se recortan al horario de la cancha como en
+    calcular_pagos_por_intervalos.
+    """
+
+    def __init__(self, hora_inicio, hora_fin, monto_total=None, tarifa=None):
+        self.hora_inicio = hora_inicio
+        self.hora_fin = hora_fin
+        self._cambios = []
+        self._precios_minutos = None
+        if tarifa is None:
+            if monto_total is None:
+                raise ValueError("Falta el monto total o la tarifa.")
+            duracion_total = hora_fin - hora_inicio
+            self._costo_por_hora = (
+                monto_total / duracion_total if duracion_total > 0 else 0
+            )
+        else:
+            tramos_tarifa = franjas(tarifa, hora_inicio, hora_fin)
+            costo_tarifa = sum((hasta - desde) * c for desde, hasta, c in tramos_tarifa)
+            if monto_total is None:
+                monto_total = costo_tarifa
+            elif costo_tarifa <= 0 and monto_total:
+                raise ValueError("La tarifa no cobra nada en el horario de la cancha.")
+            escala = monto_total / costo_tarifa if costo_tarifa > 0 else 0
+            self._costo_por_hora = tramos_tarifa[0][2] * escala
+            self._cambios = [(desde, c * escala) for desde, _, c in tramos_tarifa[1:]]
+            self._precios_minutos = [
+                (hora_a_minutos(desde), a_centavos(c)) for desde, _, c in tramos_tarifa
+            ]
+        self.monto_total = monto_total
+        self.tarifa = tarifa
+        self.eventos = 0
+
+        self._proximo_cambio = 0
+        self._acumulado = 0.0
+        self._ultima_hora = hora_inicio
+        # nombre -> (acumulado al entrar, índice del tramo) de los que están en cancha
+        self._en_cancha = {}
+        # nombre -> lo que pagan sus tramos ya cerrados
+        self._cerrado = {}
+        # [nombre, llegada, salida, pago] por tramo, en orden de llegada
+        self._tramos = []
+
+    def entrar(self, nombre, hora):
+        if not nombre:
+            raise ValueError("Falta el nombre del jugador.")
+        if nombre in self._en_cancha:
+            raise ValueError(f"{nombre} ya está en la cancha.")
+        hora = self._avanzar(hora)
+        self._en_cancha[nombre] = (self._acumulado, len(self._tramos))
+        self._cerrado.setdefault(nombre, 0.0)
+        self._tramos.append([nombre, hora, None, 0.0])
+        self.eventos += 1
+
+    def salir(self, nombre, hora):
+        if nombre not in self._en_cancha:
+            raise ValueError(f"{nombre} no está en la cancha.")
+        hora = self._avanzar(hora)
+        base, k = self._en_cancha.pop(nombre)
+        pago = self._acumulado - base
+        self._cerrado[nombre] += pago
+        self._tramos[k][2] = hora
+        self._tramos[k][3] = pago
+        self.eventos += 1
+
+    def registrar(self, tipo, nombre, hora):
+        """
+        Aplica un evento (ENTRADA o SALIDA). Lanza ValueError si no tiene sentido:
+        tipo desconocido, hora anterior al último evento, entrar dos veces o salir sin
+        haber entrado. En ese caso la cuenta no cambia.
+        """
+        if tipo == ENTRADA:
+            self.entrar(nombre, hora)
+        elif tipo == SALIDA:
+            self.salir(nombre, hora)
+        else:
+            raise ValueError(f"Evento desconocido: {tipo!r}.")
+
+    def foto(self, hora=None):
+        """
+        Lo que lleva gastado cada jugador hasta esa hora (por defecto, la del último
+        evento; no puede ser anterior), en pesos, como dict nombre -> monto. Cuesta
+        O(jugadores) y no cambia la cuenta.
+        """
+        acumulado = self._acumulado
+        if hora is not None:
+            acumulado = self._acumulado_hasta(self._recortar(hora))
+        resultado = dict(self._cerrado)
+        for nombre, (base, _) in self._en_cancha.items():
+            resultado[nombre] += acumulado - base
+        return resultado
+
+    def en_cancha(self):
+        return list(self._en_cancha)
+
+    def cerrar(self):
+        """
+        Saca a los que quedaron en cancha a la hora de fin.
+        """
+        for nombre in list(self._en_cancha):
+            self.salir(nombre, self.hora_fin)
+
+    def jugadores(self):
+        """
+        Los tramos como jugadores (dicts con nombre, llegada y salida), para pasarlos
+        a calcular_pagos_por_intervalos. Los que siguen en cancha salen al fin.
+        """
+        return [
+            {
+                "nombre": nombre,
+                "llegada": llegada,
+                "salida": self.hora_fin if salida is None else salida,
+            }
+            for nombre, llegada, salida, _ in self._tramos
+        ]
+
+    def resultado(self):
+        """
+        Devuelve (pagos_redondeados, pagos_detallados) como
+        calcular_pagos_por_intervalos con jugadores(), un Pago por tramo. Hay que
+        llamarlo después de cerrar().
+        """
+        if self._en_cancha:
+            raise ValueError("Todavía hay jugadores en cancha; falta cerrar().")
+        pagos_detallados = [
+            Pago(nombre, pago, salida - llegada)
+            for nombre, llegada, salida, pago in self._tramos
+        ]
+        pagos_enteros = repartir_proporcional(
+            round(self.monto_total),
+            pesos_por_tramo(
+                [
+                    (hora_a_minutos(llegada), hora_a_minutos(salida))
+                    for _, llegada, salida, _ in self._tramos
+                ],
+                self._precios_minutos,
+            ),
+        )
+        pagos_redondeados = [
+            Pago(p.nombre, pago_entero, p.tiempo)
+            for p, pago_entero in zip(pagos_detallados, pagos_enteros)
+        ]
+        return pagos_redondeados, pagos_detallados
+
+    def verificar(self, tolerancia=1e-9):
+        """
+        Compara la cuenta (cerrada) con calcular_pagos_por_intervalos sobre los mismos
+        tramos. Devuelve True si coinciden.
+        """
+        redondeados, detallados = self.resultado()
+        esperados = calcular_pagos_por_intervalos(
+            self.jugadores(),
+            self.monto_total,
+            self.hora_inicio,
+            self.hora_fin,
+            self.tarifa,
+        )
+        return [p.pago for p in redondeados] == [p.pago for p in esperados[0]] and all(
+            isclose(a.pago, b.pago, rel_tol=tolerancia, abs_tol=tolerancia)
+            for a, b in zip(detallados, esperados[1])
+        )
+
+    def _recortar(self, hora):
+        hora = min(max(hora, self.hora_inicio), self.hora_fin)
+        if hora < self._ultima_hora:
+            raise ValueError(
+                f"Evento fuera de orden: {hora} es antes de {self._ultima_hora}."
+            )
+        return hora
+
+    def _avanzar(self, hora):
+        hora = self._recortar(hora)
+        presentes = len(self._en_cancha)
+        while (
+            self._proximo_cambio < len(self._cambios)
+            and self._cambios[self._proximo_cambio][0] <= hora
+        ):
+            desde, costo = self._cambios[self._proximo_cambio]
+            if presentes and desde > self._ultima_hora:
+                self._acumulado += (
+                    (desde - self._ultima_hora) * self._costo_por_hora / presentes
+                )
+            self._ultima_hora = max(self._ultima_hora, desde)
+            self._costo_por_hora = costo
+            self._proximo_cambio += 1
+        if presentes and hora > self._ultima_hora:
+            self._acumulado += (
+                (hora - self._ultima_hora) * self._costo_por_hora / presentes
+            )
+        self._ultima_hora = hora
+        return hora
+
+    def _acumulado_hasta(self, hora):
+        acumulado = self._acumulado
+        presentes = len(self._en_cancha)
+        if not presentes:
+            return acumulado
+        ultima_hora = self._ultima_hora
+        costo_por_hora = self._costo_por_hora
+        for desde, costo in self._cambios[self._proximo_cambio :]:
+            if desde > hora:
+                break
+            acumulado += (desde - ultima_hora) * costo_por_hora / presentes
+            ultima_hora, costo_por_hora = desde, costo
+        return acumulado + (hora - ultima_hora) * costo_por_hora / presentes
+
+
+class Tablero:
+    """
+    Cuenta en vivo alimentada por una cola de asyncio. El lector del molinete llama
+    a publicar() (no bloquea) y correr() aplica los eventos a medida que llegan; los
+    que no tienen sentido (una doble lectura, una salida sin entrada) se cuentan en
+    rechazados y se siguen de largo.
+    """
+
+    def __init__(self, cuenta):
+        self.cuenta = cuenta
+        self.rechazados = 0
+        self._cola = asyncio.Queue()
+
+    def publicar(self, tipo, nombre, hora):
+        self._cola.put_nowait((tipo, nombre, hora))
+
+    def terminar(self):
+        """
+        Avisa que no hay más eventos: correr() aplica los pendientes, cierra la
+        cuenta y termina.
+        """
+        self._cola.put_nowait(None)
+
+    def foto(self, hora=None):
+        return self.cuenta.foto(hora)
+
+    async def correr(self):
+        """
+        Aplica los eventos de la cola hasta terminar() y devuelve el resultado de la
+        cuenta cerrada. Entre evento y evento le cede el turno al resto del programa
+        solo cuando la cola se vacía.
+        """
+        cola = self._cola
+        registrar = self.cuenta.registrar
+        while True:
+            evento = cola.get_nowait() if not cola.empty() else await cola.get()
+            if evento is None:
+                break
+            try:
+                registrar(*evento)
+            except ValueError:
+                self.rechazados += 1
+        self.cuenta.cerrar()
+        return self.cuenta.resultado()
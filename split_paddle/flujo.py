@@ -0,0 +1,134 @@
+import csv
+import json
+from itertools import groupby
+
+from .paralelo import liquidar_sesion
+from .registros import a_json
+
+COLUMNAS_CSV = (
+    "reserva",
+    "hora_inicio",
+    "hora_fin",
+    "monto_total",
+    "nombre",
+    "llegada",
+    "salida",
+)
+
+
+def leer_reservas_jsonl(archivo):
+    """
+    Lee reservas de un archivo JSONL (una reserva por línea) sin cargarlo entero.
+    Cada línea es un dict con id, hora_inicio, hora_fin, monto_total y jugadores.
+    Las líneas vacías se saltean; las que no son un objeto JSON salen como una
+    reserva con error.
+    """
+    for numero, linea in enumerate(archivo, 1):
+        if not linea.strip():
+            continue
+        try:
+            reserva = json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield {"id": f"linea {numero}", "error": f"JSON inválido: {e.msg}"}
+            continue
+        if not isinstance(reserva, dict):
+            yield {
+                "id": f"linea {numero}",
+                "error": "Se espera un objeto JSON con la reserva, no "
+                f"{type(reserva).__name__}.",
+            }
+            continue
+        yield reserva
+
+
+def leer_reservas_csv(archivo):
+    """
+    Lee reservas de un CSV con una fila por jugador y las columnas de COLUMNAS_CSV
+    (forma_pago, fecha y cancha son opcionales). Las filas de una misma reserva deben
+    venir seguidas; en memoria solo se guarda la reserva que se está armando.
+    """
+    filas = csv.DictReader(archivo)
+    faltantes = [c for c in COLUMNAS_CSV if c not in (filas.fieldnames or ())]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el CSV: {', '.join(faltantes)}")
+    for reserva, grupo in groupby(filas, key=lambda fila: fila["reserva"]):
+        try:
+            yield _reserva_desde_filas(reserva, grupo)
+        except ValueError as e:
+            yield {"id": reserva, "error": str(e)}
+
+
+def _reserva_desde_filas(reserva, filas):
+    jugadores = []
+    fecha = cancha = None
+    for fila in filas:
+        if any(fila[columna] is None for columna in COLUMNAS_CSV):
+            raise ValueError(f"Fila incompleta para {fila['nombre'] or 'un jugador'}.")
+        jugador = {
+            "nombre": fila["nombre"].strip(),
+            "llegada": float(fila["llegada"]),
+            "salida": float(fila["salida"]),
+        }
+        if fila.get("forma_pago"):
+            jugador["forma_pago"] = fila["forma_pago"].strip()
+        jugadores.append(jugador)
+        # Alcanza con que la fecha venga en una de las filas de la reserva.
+        fecha = fecha or (fila.get("fecha") or "").strip()
+        cancha = cancha or (fila.get("cancha") or "").strip()
+    resultado = {
+        "id": reserva,
+        "hora_inicio": float(fila["hora_inicio"]),
+        "hora_fin": float(fila["hora_fin"]),
+        "monto_total": float(fila["monto_total"]),
+        "jugadores": jugadores,
+    }
+    if fecha:
+        resultado["fecha"] = fecha
+    if cancha:
+        resultado["cancha"] = cancha
+    return resultado
+
+
+def liquidar_reservas(reservas, al_liquidar=None):
+    """
+    Liquida una secuencia de reservas a medida que llegan. Por cada una devuelve un
+    dict con id, pagos y detalle (y vuelto, si el efectivo cobra de más), o con id y
+    error si no se pudo liquidar.
+    al_liquidar(reserva, pagos_redondeados, pagos_detallados) se llama con cada
+    reserva liquidada (por ejemplo Historial.guardar).
+    """
+    for reserva in reservas:
+        if "error" in reserva:
+            yield reserva
+            continue
+        try:
+            pagos_redondeados, pagos_detallados, vuelto = liquidar_sesion(reserva)
+        except (KeyError, TypeError, ValueError) as e:
+            yield {"id": reserva.get("id"), "error": f"Reserva inválida: {e!r}"}
+            continue
+        if al_liquidar is not None:
+            al_liquidar(reserva, pagos_redondeados, pagos_detallados)
+        resultado = {
+            "id": reserva.get("id"),
+            "pagos": pagos_redondeados,
+            "detalle": pagos_detallados,
+        }
+        if vuelto:
+            resultado["vuelto"] = vuelto
+        yield resultado
+
+
+def escribir_resultados_jsonl(resultados, salida):
+    """
+    Escribe cada resultado como una línea JSON apenas está listo.
+    Devuelve (liquidadas, con_error).
+    """
+    liquidadas = con_error = 0
+    for resultado in resultados:
+        salida.write(json.dumps(resultado, ensure_ascii=False, default=a_json) + "\n")
+        if "error" in resultado:
+            con_error += 1
+        else:
+            liquidadas += 1
+    salida.flush()
+    return liquidadas, con_error
@@ -0,0 +1,262 @@
+import datetime
+import json
+import sqlite3
+
+from .dinero import a_centavos
+from .pagos import recorrer_intervalos
+
+TAMANO_LOTE = 500
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS sesiones (
+    id INTEGER PRIMARY KEY,
+    reserva TEXT,
+    fecha TEXT NOT NULL,
+    hora_inicio REAL NOT NULL,
+    hora_fin REAL NOT NULL,
+    monto_total REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pagos (
+    sesion_id INTEGER NOT NULL REFERENCES sesiones(id),
+    fecha TEXT NOT NULL,
+    nombre TEXT NOT NULL COLLATE NOCASE,
+    llegada REAL,
+    salida REAL,
+    tiempo REAL NOT NULL,
+    centavos INTEGER NOT NULL,
+    pago_redondeado INTEGER NOT NULL,
+    forma_pago TEXT
+);
+CREATE TABLE IF NOT EXISTS intervalos (
+    sesion_id INTEGER NOT NULL REFERENCES sesiones(id),
+    inicio REAL NOT NULL,
+    fin REAL NOT NULL,
+    jugadores TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pagos_nombre_fecha ON pagos (nombre, fecha);
+CREATE INDEX IF NOT EXISTS pagos_sesion ON pagos (sesion_id);
+CREATE INDEX IF NOT EXISTS sesiones_fecha ON sesiones (fecha);
+CREATE INDEX IF NOT EXISTS intervalos_sesion ON intervalos (sesion_id);
+"""
+
+
+class Historial:
+    """
+    Historial de sesiones liquidadas en SQLite: la sesión, sus jugadores con el pago y
+    la forma de pago, y los tramos con quiénes estaban.
+
+    Las escrituras se juntan en memoria y se graban de a tamano_lote sesiones en una
+    sola transacción; confirmar() graba lo pendiente y las consultas lo hacen solas
+    antes de leer. Los ids de las sesiones los asigna SQLite al grabarlas, así otro
+    proceso puede escribir en la misma base a la vez (la consola y la página). La
+    base usa WAL, así se puede consultar mientras otro proceso escribe. La fecha del pago se copia en cada fila de pagos para que el
+    índice (nombre, fecha) resuelva las consultas por jugador y período sin joins.
+    """
+
+    def __init__(self, ruta, tamano_lote=TAMANO_LOTE):
+        if tamano_lote < 1:
+            raise ValueError("El tamaño de lote debe ser al menos 1.")
+        self.ruta = ruta
+        self.tamano_lote = tamano_lote
+        self._conexion = sqlite3.connect(ruta)
+        self._conexion.row_factory = sqlite3.Row
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(_ESQUEMA)
+        # Los pagos y tramos pendientes empiezan con la posición de su sesión en
+        # _sesiones; el id se sabe recién al grabarla.
+        self._sesiones = []
+        self._pagos = []
+        self._intervalos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def guardar(self, sesion, pagos_redondeados, pagos_detallados, fecha=None):
+        """
+        Agrega una sesión liquidada (lo que devuelve paralelo.liquidar_sesion). La
+        fecha es la de la sesión ("fecha" en el dict) o, si no tiene, la de hoy; puede
+        ser datetime.date o texto AAAA-MM-DD. El id se asigna al grabarla: lo devuelve
+        confirmar().
+        """
+        fecha = _fecha_iso(fecha or sesion.get("fecha") or datetime.date.today())
+        monto_total = sesion.get("monto_total")
+        if monto_total is None:
+            # Con tarifa puede faltar el monto (o venir null): es lo que suman los
+            # pagos.
+            monto_total = sum(p.pago for p in pagos_detallados)
+        posicion = len(self._sesiones)
+        self._sesiones.append(
+            (
+                None if sesion.get("id") is None else str(sesion.get("id")),
+                fecha,
+                sesion["hora_inicio"],
+                sesion["hora_fin"],
+                monto_total,
+            )
+        )
+        horarios = {j["nombre"]: j for j in sesion["jugadores"]}
+        for redondeado, detallado in zip(pagos_redondeados, pagos_detallados):
+            jugador = horarios[detallado.nombre]
+            self._pagos.append(
+                (
+                    posicion,
+                    fecha,
+                    detallado.nombre,
+                    jugador["llegada"],
+                    jugador["salida"],
+                    detallado.tiempo,
+                    a_centavos(detallado.pago),
+                    redondeado.pago,
+                    detallado.get("forma_pago"),
+                )
+            )
+        for intervalo in recorrer_intervalos(
+            sesion["jugadores"], sesion["hora_inicio"], sesion["hora_fin"]
+        ):
+            self._intervalos.append(
+                (
+                    posicion,
+                    intervalo.inicio,
+                    intervalo.fin,
+                    json.dumps(intervalo.jugadores, ensure_ascii=False),
+                )
+            )
+        if len(self._sesiones) >= self.tamano_lote:
+            self.confirmar()
+
+    def confirmar(self):
+        """
+        Graba todo lo pendiente en una transacción y devuelve los ids que SQLite le
+        dio a cada sesión, en el orden en que se guardaron.
+        """
+        if not self._sesiones:
+            return []
+        with self._conexion:
+            ids = [
+                self._conexion.execute(
+                    "INSERT INTO sesiones "
+                    "(reserva, fecha, hora_inicio, hora_fin, monto_total) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    fila,
+                ).lastrowid
+                for fila in self._sesiones
+            ]
+            self._conexion.executemany(
+                "INSERT INTO pagos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((ids[posicion], *fila) for posicion, *fila in self._pagos),
+            )
+            self._conexion.executemany(
+                "INSERT INTO intervalos VALUES (?, ?, ?, ?)",
+                ((ids[posicion], *fila) for posicion, *fila in self._intervalos),
+            )
+        self._sesiones = []
+        self._pagos = []
+        self._intervalos = []
+        return ids
+
+    def cerrar(self):
+        self.confirmar()
+        self._conexion.close()
+
+    # --- Consultas ---
+
+    def total_de(self, nombre, desde, hasta):
+        """
+        Cuánto pagó (o debe) un jugador entre dos fechas, inclusive. El nombre no
+        distingue mayúsculas. Devuelve el total en pesos, sumado en centavos.
+        """
+        self.confirmar()
+        (centavos,) = self._conexion.execute(
+            "SELECT COALESCE(SUM(centavos), 0) FROM pagos "
+            "WHERE nombre = ? AND fecha BETWEEN ? AND ?",
+            (nombre, _fecha_iso(desde), _fecha_iso(hasta)),
+        ).fetchone()
+        return centavos / 100
+
+    def total_del_mes(self, nombre, anio, mes):
+        """
+        Lo que pagó un jugador en un mes: "¿cuánto debe Dario este mes?".
+        """
+        desde = datetime.date(anio, mes, 1)
+        hasta = (desde + datetime.timedelta(days=31)).replace(day=1)
+        return self.total_de(nombre, desde, hasta - datetime.timedelta(days=1))
+
+    def pagos_de(self, nombre, desde=None, hasta=None):
+        """
+        Los pagos de un jugador, del más viejo al más nuevo, como dicts con fecha,
+        sesion_id, tiempo, pago, pago_redondeado y forma_pago.
+        """
+        self.confirmar()
+        filas = self._conexion.execute(
+            "SELECT fecha, sesion_id, tiempo, centavos / 100.0 AS pago, "
+            "pago_redondeado, forma_pago FROM pagos "
+            "WHERE nombre = ? AND fecha BETWEEN ? AND ? ORDER BY fecha, sesion_id",
+            (
+                nombre,
+                _fecha_iso(desde or datetime.date.min),
+                _fecha_iso(hasta or datetime.date.max),
+            ),
+        )
+        return [dict(fila) for fila in filas]
+
+    def tramos(self, desde=None, hasta=None):
+        """
+        Genera los tramos de los jugadores entre dos fechas, inclusive, como tuplas
+        (fecha, sesion_id, nombre, llegada, salida). Los jugadores sin horario no
+        aparecen.
+        """
+        self.confirmar()
+        yield from self._conexion.execute(
+            "SELECT fecha, sesion_id, nombre, llegada, salida FROM pagos "
+            "WHERE fecha BETWEEN ? AND ? AND llegada IS NOT NULL "
+            "AND salida IS NOT NULL ORDER BY fecha, sesion_id",
+            (
+                _fecha_iso(desde or datetime.date.min),
+                _fecha_iso(hasta or datetime.date.max),
+            ),
+        )
+
+    def sesiones_del_dia(self, fecha):
+        """
+        Las sesiones de una fecha, cada una con sus pagos y sus tramos.
+        """
+        self.confirmar()
+        sesiones = [
+            dict(fila)
+            for fila in self._conexion.execute(
+                "SELECT id, reserva, hora_inicio, hora_fin, monto_total FROM sesiones "
+                "WHERE fecha = ? ORDER BY id",
+                (_fecha_iso(fecha),),
+            )
+        ]
+        for sesion in sesiones:
+            sesion["pagos"] = [
+                dict(fila)
+                for fila in self._conexion.execute(
+                    "SELECT nombre, llegada, salida, tiempo, centavos / 100.0 AS pago, "
+                    "pago_redondeado, forma_pago FROM pagos WHERE sesion_id = ? "
+                    "ORDER BY rowid",
+                    (sesion["id"],),
+                )
+            ]
+            sesion["intervalos"] = [
+                {"inicio": inicio, "fin": fin, "jugadores": tuple(json.loads(nombres))}
+                for inicio, fin, nombres in self._conexion.execute(
+                    "SELECT inicio, fin, jugadores FROM intervalos WHERE sesion_id = ? "
+                    "ORDER BY rowid",
+                    (sesion["id"],),
+                )
+            ]
+        return sesiones
+
+
+def _fecha_iso(fecha):
+    if isinstance(fecha, datetime.datetime):
+        fecha = fecha.date()
+    if isinstance(fecha, datetime.date):
+        return fecha.isoformat()
+    return datetime.date.fromisoformat(fecha).isoformat()
@@ -0,0 +1,98 @@
+from functools import lru_cache
+from time import perf_counter
+
+from . import medicion
+
+# Después del punto van los minutos de reloj: 18.15 = 18:15, 18.30 = 18:30.
+FORMATO_RELOJ = "reloj"
+# Después del punto va la fracción de hora en cuartos: 18.25 = 18:15, 18.5 = 18:30.
+FORMATO_DECIMAL = "decimal"
+
+_FRACCIONES_DECIMALES = {
+    "": 0,
+    "0": 0,
+    "00": 0,
+    "25": 15,
+    "5": 30,
+    "50": 30,
+    "75": 45,
+}
+
+
+def parsear_hora(valor, formato=FORMATO_RELOJ, paso_minutos=15):
+    """
+    Convierte una hora escrita como texto a decimal de horas (18:30 → 18.5).
+
+    - FORMATO_RELOJ: 18, 18.15, 18.30, 18.45. Los minutos van con dos cifras y deben
+      ser múltiplos de paso_minutos.
+    - FORMATO_DECIMAL: 18, 18.25, 18.5, 18.75 (cuartos de hora).
+
+    Los números (int o float) ya están en horas y se devuelven tal cual.
+    Lanza ValueError si la hora no es válida; no muestra nada por pantalla.
+    """
+    medir = medicion.activa
+    if medir:
+        desde = perf_counter()
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool):
+        if not 0 <= valor <= 24:
+            raise ValueError(f"La hora {valor} está fuera del día (0 a 24).")
+        hora = float(valor)
+    elif not isinstance(valor, str):
+        raise ValueError(f"Hora inválida: {valor!r}.")
+    else:
+        hora = _tabla(formato, paso_minutos).get(valor.strip())
+        if hora is None:
+            raise ValueError(_mensaje_error(valor.strip(), formato, paso_minutos))
+    if medir:
+        medicion.marcar("parsear_hora", desde)
+    return hora
+
+
+def hora_a_minutos(hora):
+    """
+    Convierte un decimal de horas (18.5) a minutos enteros desde la medianoche (1110).
+    """
+    return round(hora * 60)
+
+
+@lru_cache(maxsize=8)
+def _tabla(formato, paso_minutos):
+    """
+    Todas las horas válidas del día para un formato, ya convertidas.
+    """
+    if formato == FORMATO_RELOJ:
+        if not 1 <= paso_minutos <= 60 or 60 % paso_minutos:
+            raise ValueError("El paso en minutos debe dividir a 60.")
+        fracciones = {f"{m:02d}": m for m in range(0, 60, paso_minutos)}
+        fracciones[""] = 0
+    elif formato == FORMATO_DECIMAL:
+        fracciones = _FRACCIONES_DECIMALES
+    else:
+        raise ValueError(f"Formato de hora desconocido: {formato!r}.")
+
+    tabla = {}
+    for horas in range(25):
+        for texto_horas in {str(horas), f"{horas:02d}"}:
+            for texto_fraccion, minutos in fracciones.items():
+                if horas == 24 and minutos:
+                    continue
+                texto = (
+                    f"{texto_horas}.{texto_fraccion}" if texto_fraccion else texto_horas
+                )
+                tabla[texto] = horas + minutos / 60
+    return tabla
+
+
+def _mensaje_error(valor, formato, paso_minutos):
+    if "," in valor or ":" in valor:
+        return "Solo se acepta el punto como separador decimal."
+    if formato == FORMATO_DECIMAL:
+        return (
+            f"Formato de hora no reconocido para '{valor}'. Usa por ejemplo 18.25 para "
+            "18:15, 18.5 para 18:30, 18.75 para 18:45."
+        )
+    ejemplos = ", ".join(f"18.{m:02d}" for m in range(0, 60, paso_minutos)[:4])
+    return (
+        f"Formato de hora no reconocido para '{valor}'. Use por ejemplo {ejemplos} "
+        f"(minutos múltiplos de {paso_minutos})."
+    )
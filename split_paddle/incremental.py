@@ -0,0 +1,208 @@
+from bisect import bisect_left
+from math import isclose
+
+from .dinero import pesos_por_tramo, repartir_proporcional
+from .horas import hora_a_minutos
+from .pagos import calcular_pagos_por_intervalos
+from .registros import Pago, como_jugador
+
+
+class LiquidacionIncremental:
+    """
+    Liquidación que se actualiza al agregar, quitar o modificar un jugador sin
+    recalcular todo.
+
+    Guarda los cortes de la línea de tiempo (llegadas y salidas, ordenados) y quiénes
+    están en cada tramo entre dos cortes. Cambiar un jugador solo toca los tramos de su
+    horario viejo y nuevo y los pagos de quienes estaban en ellos: O(log n) para ubicar
+    los cortes más lo afectado.
+
+    Usa la misma regla que pagos.calcular_pagos_por_intervalos (mismo recorte de
+    horarios, mismos nombres ignorados); verificar() lo compara con un cálculo completo.
+    """
+
+    def __init__(self, jugadores, monto_total, hora_inicio, hora_fin):
+        self.monto_total = monto_total
+        self.hora_inicio = hora_inicio
+        self.hora_fin = hora_fin
+        duracion_total = hora_fin - hora_inicio
+        self._costo_por_hora = monto_total / duracion_total if duracion_total > 0 else 0
+
+        # Los extremos de la cancha quedan siempre como cortes.
+        self._cortes = [hora_inicio, hora_fin] if duracion_total > 0 else [hora_inicio]
+        self._usos = dict.fromkeys(self._cortes, 1)
+        self._tramos = [set() for _ in range(len(self._cortes) - 1)]
+
+        self._orden = []
+        self._pedidos = {}
+        self._horarios = {}
+        self._pagos = {}
+        for jugador in jugadores:
+            self.agregar(jugador)
+
+    def agregar(self, jugador):
+        jugador = como_jugador(jugador)
+        if not jugador.nombre:
+            return
+        if jugador.nombre in self._pagos:
+            raise ValueError(f"El jugador {jugador.nombre} ya está en la liquidación.")
+        self._orden.append(jugador.nombre)
+        self._pagos[jugador.nombre] = 0.0
+        self._ocupar(jugador.nombre, jugador.llegada, jugador.salida)
+
+    def quitar(self, nombre):
+        self._desocupar(nombre)
+        self._orden.remove(nombre)
+        del self._pagos[nombre]
+        del self._pedidos[nombre]
+        del self._horarios[nombre]
+
+    def modificar(self, nombre, llegada=None, salida=None):
+        """
+        Cambia la llegada y/o la salida de un jugador (lo que no se pasa queda igual).
+        """
+        llegada_actual, salida_actual = self._pedidos[nombre]
+        self._desocupar(nombre)
+        self._ocupar(
+            nombre,
+            llegada_actual if llegada is None else llegada,
+            salida_actual if salida is None else salida,
+        )
+
+    def renombrar(self, nombre, nuevo_nombre):
+        if nuevo_nombre in self._pagos:
+            raise ValueError(f"El jugador {nuevo_nombre} ya está en la liquidación.")
+        self._orden[self._orden.index(nombre)] = nuevo_nombre
+        self._pagos[nuevo_nombre] = self._pagos.pop(nombre)
+        self._pedidos[nuevo_nombre] = self._pedidos.pop(nombre)
+        self._horarios[nuevo_nombre] = self._horarios.pop(nombre)
+        for presentes in self._tramos:
+            if nombre in presentes:
+                presentes.discard(nombre)
+                presentes.add(nuevo_nombre)
+
+    def pago(self, nombre):
+        return self._pagos[nombre]
+
+    def resultado(self):
+        """
+        Devuelve (pagos_redondeados, pagos_detallados) como calcular_pagos_por_intervalos.
+        Los pagos exactos ya están al día; el reparto en pesos enteros se hace acá
+        porque el método del resto mayor depende de todos los jugadores.
+        """
+        pagos_detallados = []
+        tramos_minutos = []
+        for nombre in self._orden:
+            llegada, salida = self._horarios[nombre]
+            tiempo = 0 if llegada is None else salida - llegada
+            pagos_detallados.append(Pago(nombre, self._pagos[nombre], tiempo))
+            tramos_minutos.append(
+                (0, 0)
+                if llegada is None
+                else (hora_a_minutos(llegada), hora_a_minutos(salida))
+            )
+        pagos_enteros = repartir_proporcional(
+            round(self.monto_total), pesos_por_tramo(tramos_minutos)
+        )
+        pagos_redondeados = [
+            Pago(p.nombre, pago_entero, p.tiempo)
+            for p, pago_entero in zip(pagos_detallados, pagos_enteros)
+        ]
+        return pagos_redondeados, pagos_detallados
+
+    def verificar(self, tolerancia=1e-9):
+        """
+        Compara con un cálculo completo. Los pagos exactos pueden diferir en el último
+        decimal por el orden de las sumas; tolerancia es relativa al monto total.
+        """
+        jugadores = []
+        for nombre in self._orden:
+            llegada, salida = self._horarios[nombre]
+            jugadores.append({"nombre": nombre, "llegada": llegada, "salida": salida})
+        redondeados, detallados = calcular_pagos_por_intervalos(
+            jugadores, self.monto_total, self.hora_inicio, self.hora_fin
+        )
+        mis_redondeados, mis_detallados = self.resultado()
+        margen = tolerancia * max(abs(self.monto_total), 1)
+        return mis_redondeados == redondeados and all(
+            a.nombre == b.nombre
+            and a.tiempo == b.tiempo
+            and isclose(a.pago, b.pago, abs_tol=margen)
+            for a, b in zip(mis_detallados, detallados)
+        )
+
+    # --- Línea de tiempo ---
+
+    def _ocupar(self, nombre, llegada, salida):
+        self._pedidos[nombre] = (llegada, salida)
+        if llegada is None or salida is None:
+            self._horarios[nombre] = (None, None)
+            return
+        llegada = min(max(llegada, self.hora_inicio), self.hora_fin)
+        salida = min(max(salida, llegada), self.hora_fin)
+        self._horarios[nombre] = (llegada, salida)
+        if salida == llegada:
+            return
+        desde = self._cortar(llegada)
+        hasta = self._cortar(salida)
+        for k in range(desde, hasta):
+            self._entrar(k, nombre)
+
+    def _desocupar(self, nombre):
+        llegada, salida = self._horarios[nombre]
+        if llegada is None or salida == llegada:
+            return
+        desde = bisect_left(self._cortes, llegada)
+        hasta = bisect_left(self._cortes, salida)
+        for k in range(desde, hasta):
+            self._salir(k, nombre)
+        self._soltar(salida)
+        self._soltar(llegada)
+        # Lo que queda es solo error de redondeo de las sumas y restas.
+        self._pagos[nombre] = 0.0
+
+    def _cortar(self, tiempo):
+        k = bisect_left(self._cortes, tiempo)
+        if self._cortes[k] == tiempo:
+            self._usos[tiempo] += 1
+            return k
+        # El tramo k-1 se parte en dos con los mismos presentes.
+        self._cortes.insert(k, tiempo)
+        self._tramos.insert(k, set(self._tramos[k - 1]))
+        self._usos[tiempo] = 1
+        return k
+
+    def _soltar(self, tiempo):
+        self._usos[tiempo] -= 1
+        if self._usos[tiempo]:
+            return
+        # Nadie más llega ni se va a esa hora: los dos tramos vecinos son iguales.
+        del self._usos[tiempo]
+        k = bisect_left(self._cortes, tiempo)
+        del self._cortes[k]
+        del self._tramos[k]
+
+    def _costo_tramo(self, k):
+        return (self._cortes[k + 1] - self._cortes[k]) * self._costo_por_hora
+
+    def _entrar(self, k, nombre):
+        presentes = self._tramos[k]
+        costo = self._costo_tramo(k)
+        antes = len(presentes)
+        if antes:
+            ajuste = costo / (antes + 1) - costo / antes
+            for otro in presentes:
+                self._pagos[otro] += ajuste
+        self._pagos[nombre] += costo / (antes + 1)
+        presentes.add(nombre)
+
+    def _salir(self, k, nombre):
+        presentes = self._tramos[k]
+        presentes.discard(nombre)
+        costo = self._costo_tramo(k)
+        quedan = len(presentes)
+        self._pagos[nombre] -= costo / (quedan + 1)
+        if quedan:
+            ajuste = costo / quedan - costo / (quedan + 1)
+            for otro in presentes:
+                self._pagos[otro] += ajuste
@@ -0,0 +1,317 @@
+"""
+Índice de los tramos de muchas sesiones para responder "¿quién estaba en la cancha 3
+el martes entre las 19:15 y las 19:45?".
+
+Es estático: se arma de una vez a partir de las reservas (CSV o JSONL) o del
+historial, se guarda en un archivo .npz y se vuelve a cargar. Cada tramo es
+[llegada, salida) en horas absolutas (días desde el año 1 por 24 más la hora), y
+los tramos van ordenados por cancha y llegada. Al lado se guarda una tabla de
+máximos por potencias de dos (sparse table) sobre las salidas:
+
+- en la cancha a la hora t: entre los tramos que llegaron hasta t, los que salen
+  después de t. El máximo de un rango se saca en O(1) con la tabla, y cada máximo
+  que sale después de t es un resultado, así que son O(log n + k).
+- entre desde y hasta: los que estaban a la hora desde, más los que llegaron
+  después (búsqueda binaria sobre las llegadas), también O(log n + k).
+
+Uso: python3 -m split_paddle.indice construir reservas.csv tramos.npz
+     python3 -m split_paddle.indice consultar tramos.npz 2026-10-13 19.25 [19.75] [--cancha 3]
+"""
+
+import argparse
+import datetime
+import sys
+
+import numpy as np
+
+from .flujo import leer_reservas_csv, leer_reservas_jsonl
+from .registros import Tramo
+
+
+class IndiceTramos:
+    """
+    Índice de tramos. Se arma con construir() o con desde_reservas() y
+    desde_historial(); las fechas de las consultas van como datetime.date o texto
+    AAAA-MM-DD y las horas en horas decimales del día.
+    """
+
+    def __init__(
+        self, dias, llegadas, salidas, canchas, sesiones, nombres, nombres_canchas
+    ):
+        # Arrays alineados, ordenados por (cancha, inicio). canchas tiene el código de
+        # cada tramo en nombres_canchas ("" si no se sabe la cancha).
+        self.dias = dias
+        self.llegadas = llegadas
+        self.salidas = salidas
+        self.inicios = dias * 24.0 + llegadas
+        self.fines = dias * 24.0 + salidas
+        self.canchas = canchas
+        self.sesiones = sesiones
+        self.nombres = nombres
+        self.nombres_canchas = nombres_canchas
+        self._codigos = {str(n): i for i, n in enumerate(nombres_canchas)}
+        self._limites = np.searchsorted(canchas, np.arange(len(nombres_canchas) + 1))
+        self._tabla = _tabla_de_maximos(self.fines)
+
+    def __len__(self):
+        return len(self.inicios)
+
+    @classmethod
+    def construir(cls, tramos):
+        """
+        Arma el índice a partir de tuplas (fecha, cancha, sesion, nombre, llegada,
+        salida). Los tramos sin nombre o que no duran nada se ignoran.
+        """
+        dias = []
+        llegadas = []
+        salidas = []
+        canchas = []
+        sesiones = []
+        nombres = []
+        for fecha, cancha, sesion, nombre, llegada, salida in tramos:
+            if not nombre or not salida > llegada:
+                continue
+            dias.append(_dia(fecha))
+            llegadas.append(llegada)
+            salidas.append(salida)
+            canchas.append("" if cancha is None else str(cancha))
+            sesiones.append("" if sesion is None else str(sesion))
+            nombres.append(nombre)
+
+        nombres_canchas, codigos = np.unique(
+            np.array(canchas, dtype=str), return_inverse=True
+        )
+        dias = np.array(dias, dtype=np.int64)
+        llegadas = np.array(llegadas, dtype=np.float64)
+        orden = np.lexsort((dias * 24.0 + llegadas, codigos))
+        return cls(
+            dias[orden],
+            llegadas[orden],
+            np.array(salidas, dtype=np.float64)[orden],
+            codigos.astype(np.int32)[orden],
+            np.array(sesiones, dtype=str)[orden],
+            np.array(nombres, dtype=str)[orden],
+            nombres_canchas,
+        )
+
+    def guardar(self, ruta):
+        """
+        Guarda el índice en un archivo .npz (la tabla de máximos se rearma al cargar).
+        """
+        with open(ruta, "wb") as archivo:
+            np.savez(
+                archivo,
+                dias=self.dias,
+                llegadas=self.llegadas,
+                salidas=self.salidas,
+                canchas=self.canchas,
+                sesiones=self.sesiones,
+                nombres=self.nombres,
+                nombres_canchas=self.nombres_canchas,
+            )
+
+    @classmethod
+    def cargar(cls, ruta):
+        with np.load(ruta, allow_pickle=False) as datos:
+            return cls(
+                datos["dias"],
+                datos["llegadas"],
+                datos["salidas"],
+                datos["canchas"],
+                datos["sesiones"],
+                datos["nombres"],
+                datos["nombres_canchas"],
+            )
+
+    def en_cancha(self, fecha, hora, cancha=None):
+        """
+        Los tramos de quienes estaban en la cancha a esa hora (llegada <= hora <
+        salida), como Tramo, ordenados por cancha y llegada. Sin cancha, en todas.
+        """
+        t = _dia(fecha) * 24.0 + hora
+        indices = []
+        for desde, hasta in self._rangos(cancha):
+            fin_rango = desde + int(
+                np.searchsorted(self.inicios[desde:hasta], t, side="right")
+            )
+            indices += self._salen_despues(desde, fin_rango, t)
+        return self._tramos(indices)
+
+    def entre(self, fecha, desde, hasta, cancha=None):
+        """
+        Los tramos que se superponen con [desde, hasta) ese día, como Tramo, ordenados
+        por cancha y llegada. Sin cancha, en todas. Lanza ValueError si hasta no es
+        mayor que desde.
+        """
+        if not hasta > desde:
+            raise ValueError("La hora de fin debe ser mayor que la de inicio.")
+        base = _dia(fecha) * 24.0
+        a, b = base + desde, base + hasta
+        indices = []
+        for inicio_rango, fin_rango in self._rangos(cancha):
+            llegadas = self.inicios[inicio_rango:fin_rango]
+            primero = inicio_rango + int(np.searchsorted(llegadas, a, side="right"))
+            ultimo = inicio_rango + int(np.searchsorted(llegadas, b, side="left"))
+            indices += self._salen_despues(inicio_rango, primero, a)
+            indices += range(primero, ultimo)
+        return self._tramos(indices)
+
+    def _rangos(self, cancha):
+        if cancha is None:
+            codigos = range(len(self.nombres_canchas))
+        elif str(cancha) in self._codigos:
+            codigos = [self._codigos[str(cancha)]]
+        else:
+            return []
+        limites = self._limites
+        return [(int(limites[c]), int(limites[c + 1])) for c in codigos]
+
+    def _salen_despues(self, desde, hasta, t):
+        # Índices de [desde, hasta) con fin > t: se saca el máximo del rango y, si
+        # sale después de t, se parte el rango en dos. Cada paso que sigue encontró
+        # un resultado, así que son O(k) pasos de O(1).
+        fines = self.fines
+        tabla = self._tabla
+        resultado = []
+        pendientes = [(desde, hasta)]
+        while pendientes:
+            izquierda, derecha = pendientes.pop()
+            if izquierda >= derecha:
+                continue
+            nivel = (derecha - izquierda).bit_length() - 1
+            a = tabla[nivel][izquierda]
+            b = tabla[nivel][derecha - (1 << nivel)]
+            maximo = int(a if fines[a] >= fines[b] else b)
+            if fines[maximo] <= t:
+                continue
+            resultado.append(maximo)
+            pendientes.append((izquierda, maximo))
+            pendientes.append((maximo + 1, derecha))
+        resultado.sort()
+        return resultado
+
+    def _tramos(self, indices):
+        resultado = []
+        for i in indices:
+            resultado.append(
+                Tramo(
+                    str(self.nombres[i]),
+                    datetime.date.fromordinal(int(self.dias[i])).isoformat(),
+                    float(self.llegadas[i]),
+                    float(self.salidas[i]),
+                    str(self.nombres_canchas[self.canchas[i]]) or None,
+                    str(self.sesiones[i]) or None,
+                )
+            )
+        return resultado
+
+
+def desde_reservas(reservas):
+    """
+    Arma el índice con los jugadores de las reservas (dicts como los de
+    flujo.leer_reservas_csv, con fecha y opcionalmente cancha). Las reservas con
+    error o sin fecha no se indexan. Devuelve (indice, con_error).
+    """
+    con_error = 0
+
+    def tramos():
+        nonlocal con_error
+        for reserva in reservas:
+            if "error" in reserva or not reserva.get("fecha"):
+                con_error += 1
+                continue
+            for jugador in reserva["jugadores"]:
+                if jugador.get("llegada") is None or jugador.get("salida") is None:
+                    continue
+                yield (
+                    reserva["fecha"],
+                    reserva.get("cancha"),
+                    reserva.get("id"),
+                    jugador["nombre"],
+                    jugador["llegada"],
+                    jugador["salida"],
+                )
+
+    indice = IndiceTramos.construir(tramos())
+    return indice, con_error
+
+
+def desde_historial(historial, desde=None, hasta=None):
+    """
+    Arma el índice con los tramos guardados en un historial.Historial entre dos
+    fechas. El historial no guarda la cancha; la sesión es el id de la sesión.
+    """
+    return IndiceTramos.construir(
+        (fecha, None, sesion, nombre, llegada, salida)
+        for fecha, sesion, nombre, llegada, salida in historial.tramos(desde, hasta)
+    )
+
+
+def _dia(fecha):
+    if isinstance(fecha, datetime.datetime):
+        fecha = fecha.date()
+    if not isinstance(fecha, datetime.date):
+        fecha = datetime.date.fromisoformat(fecha)
+    return fecha.toordinal()
+
+
+def _tabla_de_maximos(valores):
+    # tabla[j][i] es el índice del máximo de valores[i:i + 2**j].
+    tabla = [np.arange(len(valores), dtype=np.int64)]
+    ancho = 1
+    while 2 * ancho <= len(valores):
+        anterior = tabla[-1]
+        a = anterior[: len(anterior) - ancho]
+        b = anterior[ancho:]
+        tabla.append(np.where(valores[a] >= valores[b], a, b))
+        ancho *= 2
+    return tabla
+
+
+def _principal(argv=None):
+    parser = argparse.ArgumentParser(description="Índice de tramos por horario.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    construir = comandos.add_parser(
+        "construir", help="índice a partir de un CSV o JSONL de reservas"
+    )
+    construir.add_argument("reservas")
+    construir.add_argument("indice")
+    consultar = comandos.add_parser("consultar", help="quiénes estaban en la cancha")
+    consultar.add_argument("indice")
+    consultar.add_argument("fecha")
+    consultar.add_argument("desde", type=float)
+    consultar.add_argument("hasta", type=float, nargs="?")
+    consultar.add_argument("--cancha")
+    args = parser.parse_args(argv)
+
+    if args.comando == "construir":
+        with open(args.reservas, encoding="utf-8", newline="") as archivo:
+            leer = (
+                leer_reservas_jsonl
+                if args.reservas.endswith(".jsonl")
+                else leer_reservas_csv
+            )
+            indice, con_error = desde_reservas(leer(archivo))
+        indice.guardar(args.indice)
+        print(
+            f"Tramos indexados: {len(indice)}. Reservas con error o sin fecha: "
+            f"{con_error}.",
+            file=sys.stderr,
+        )
+        return 1 if con_error else 0
+
+    indice = IndiceTramos.cargar(args.indice)
+    if args.hasta is None:
+        tramos = indice.en_cancha(args.fecha, args.desde, args.cancha)
+    else:
+        tramos = indice.entre(args.fecha, args.desde, args.hasta, args.cancha)
+    for tramo in tramos:
+        print(
+            f"{tramo.nombre}\tcancha {tramo.cancha or '?'}\t"
+            f"{tramo.llegada:g}-{tramo.salida:g}\tsesión {tramo.sesion or '?'}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_principal())
@@ -0,0 +1,92 @@
+"""
+Liquidación de una jornada completa: varias canchas, cada una con su horario y su
+monto, y jugadores que pasan de una cancha a otra durante la noche.
+"""
+
+from .pagos import calcular_pagos_por_intervalos
+from .paralelo import ajustar_formas_de_pago
+from .registros import Pago
+
+
+def liquidar_jornada(canchas, tramos):
+    """
+    Reparte el costo de cada cancha entre los tramos que se jugaron en ella, con la
+    misma regla que calcular_pagos_por_intervalos, y suma una cuenta por jugador.
+
+    canchas: dict cancha -> dict con hora_inicio, hora_fin y monto_total.
+    tramos: dicts con nombre, cancha, llegada, salida y opcionalmente forma_pago. Un
+    jugador puede tener varios tramos, en la misma cancha o en otras, pero no dos a la
+    vez. Los tramos sin nombre se ignoran; una cancha sin tramos no se le cobra a nadie.
+
+    Los tramos se indexan por cancha y cada cancha se barre una sola vez, así que el
+    costo es O(n log n) en la cantidad de tramos. Los pagos redondeados de cada cancha
+    suman su total en pesos enteros, y la cuenta del jugador es la suma de los suyos.
+    Si hay formas de pago, las cuentas exactas se ajustan con ajustar_pagos_y_redondear
+    sobre el total cobrado en la jornada.
+
+    Devuelve (pagos_redondeados, pagos_detallados, por_cancha): una cuenta (Pago) por
+    jugador, en el orden en que aparecen, y por cada cancha el resultado de
+    calcular_pagos_por_intervalos para sus tramos. Lanza ValueError si un tramo es de
+    una cancha desconocida o si un jugador se superpone consigo mismo.
+    """
+    tramos_por_cancha = {cancha: [] for cancha in canchas}
+    tramos_por_jugador = {}
+    for tramo in tramos:
+        if not tramo["nombre"]:
+            continue
+        if tramo["cancha"] not in tramos_por_cancha:
+            raise ValueError(f"Cancha desconocida: {tramo['cancha']!r}.")
+        tramos_por_cancha[tramo["cancha"]].append(tramo)
+        tramos_por_jugador.setdefault(tramo["nombre"], []).append(tramo)
+    _verificar_superposiciones(tramos_por_jugador)
+
+    redondeado = dict.fromkeys(tramos_por_jugador, 0)
+    exacto = dict.fromkeys(tramos_por_jugador, 0.0)
+    tiempo = dict.fromkeys(tramos_por_jugador, 0)
+    por_cancha = {}
+    for cancha, tramos_cancha in tramos_por_cancha.items():
+        if not tramos_cancha:
+            por_cancha[cancha] = ([], [])
+            continue
+        datos = canchas[cancha]
+        pagos_redondeados, pagos_detallados = calcular_pagos_por_intervalos(
+            tramos_cancha, datos["monto_total"], datos["hora_inicio"], datos["hora_fin"]
+        )
+        for pago_redondeado, pago_detallado in zip(pagos_redondeados, pagos_detallados):
+            nombre = pago_detallado.nombre
+            redondeado[nombre] += pago_redondeado.pago
+            exacto[nombre] += pago_detallado.pago
+            tiempo[nombre] += pago_detallado.tiempo
+        por_cancha[cancha] = (pagos_redondeados, pagos_detallados)
+
+    pagos_redondeados = [Pago(n, redondeado[n], tiempo[n]) for n in tramos_por_jugador]
+    pagos_detallados = [Pago(n, exacto[n], tiempo[n]) for n in tramos_por_jugador]
+    ajustar_formas_de_pago(
+        {
+            "jugadores": [t for t in tramos if t["nombre"]],
+            # Solo lo que se cobró: las canchas vacías no suman.
+            "monto_total": sum(
+                canchas[cancha]["monto_total"]
+                for cancha, tramos_cancha in tramos_por_cancha.items()
+                if tramos_cancha
+            ),
+        },
+        pagos_detallados,
+    )
+    return pagos_redondeados, pagos_detallados, por_cancha
+
+
+def _verificar_superposiciones(tramos_por_jugador):
+    for nombre, tramos in tramos_por_jugador.items():
+        if len(tramos) < 2:
+            continue
+        con_horario = sorted(
+            (t["llegada"], t["salida"])
+            for t in tramos
+            if t["llegada"] is not None and t["salida"] is not None
+        )
+        for (_, salida), (llegada, _) in zip(con_horario, con_horario[1:]):
+            if llegada < salida:
+                raise ValueError(
+                    f"{nombre} tiene dos tramos superpuestos ({llegada} < {salida})."
+                )
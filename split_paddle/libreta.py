@@ -0,0 +1,113 @@
+"""
+Libreta de deudas entre jugadores a lo largo de muchas sesiones.
+
+Cuando alguien paga en efectivo, ajustar_pagos_y_redondear lo redondea a billetes y
+la diferencia la pone quien paga con billetera. Sesión a sesión quedan deudas
+chicas; la libreta las acumula en un saldo por jugador y al final propone pocas
+transferencias para saldar todo.
+"""
+
+import heapq
+
+from .dinero import a_centavos, repartir_proporcional
+from .paralelo import calcular_sesion
+from .registros import Transferencia
+
+
+class Libreta:
+    """
+    Saldo en centavos de cada jugador: lo que pagó de más (positivo, le deben) o de
+    menos (negativo, debe). Los saldos suman siempre cero.
+    """
+
+    def __init__(self):
+        self._saldos = {}
+        self.movimientos = 0
+
+    def registrar(self, justos, pagados):
+        """
+        Registra una sesión a partir de dos listas de pagos (Pago o dicts con nombre
+        y pago), alineadas: lo que le tocaba a cada uno y lo que pagó. Lo justo se
+        lleva a centavos que sumen exactamente lo pagado, así que la sesión no
+        cambia la suma de los saldos.
+        """
+        pagados_centavos = [a_centavos(p["pago"]) for p in pagados]
+        justos_centavos = repartir_proporcional(
+            sum(pagados_centavos), [a_centavos(p["pago"]) for p in justos]
+        )
+        saldos = self._saldos
+        for pago, justo, pagado in zip(pagados, justos_centavos, pagados_centavos):
+            if pagado != justo:
+                nombre = pago["nombre"]
+                saldos[nombre] = saldos.get(nombre, 0) + pagado - justo
+                self.movimientos += 1
+
+    def registrar_sesion(self, sesion, pagos_redondeados, pagos_detallados):
+        """
+        Registra una sesión liquidada con paralelo.liquidar_sesion. Tiene la misma
+        firma que el al_liquidar de flujo.liquidar_reservas. Si nadie trae forma de
+        pago, cada uno pagó lo justo y no hay nada que anotar.
+        """
+        if not any(j.get("forma_pago") for j in sesion["jugadores"]):
+            return
+        _, justos = calcular_sesion(sesion)
+        self.registrar(justos, pagos_detallados)
+
+    def registrar_transferencia(self, deudor, acreedor, monto):
+        """
+        Anota que deudor le pagó monto (en pesos) a acreedor.
+        """
+        centavos = a_centavos(monto)
+        self._saldos[deudor] = self._saldos.get(deudor, 0) + centavos
+        self._saldos[acreedor] = self._saldos.get(acreedor, 0) - centavos
+        self.movimientos += 1
+
+    def saldo(self, nombre):
+        """
+        Saldo de un jugador en pesos: positivo si le deben, negativo si debe.
+        """
+        return self._saldos.get(nombre, 0) / 100
+
+    def saldos(self):
+        """
+        Los saldos distintos de cero, en pesos.
+        """
+        return {n: c / 100 for n, c in self._saldos.items() if c}
+
+    def transferencias(self):
+        """
+        Propone transferencias que dejan todos los saldos en cero: primero junta a
+        quienes deben y a quienes les deben exactamente lo mismo, y con el resto el
+        que más debe le paga al que más le deben (dos montículos). Son a lo sumo
+        jugadores - 1 transferencias, en O(n log n). Los montos van en pesos.
+        """
+        deudores = {}
+        acreedores = {}
+        for nombre, centavos in self._saldos.items():
+            if centavos < 0:
+                deudores.setdefault(-centavos, []).append(nombre)
+            elif centavos > 0:
+                acreedores.setdefault(centavos, []).append(nombre)
+
+        resultado = []
+        for centavos, nombres in deudores.items():
+            pares = acreedores.get(centavos)
+            while nombres and pares:
+                resultado.append(
+                    Transferencia(nombres.pop(), pares.pop(), centavos / 100)
+                )
+
+        monticulo_deudores = [(-c, n) for c, ns in deudores.items() for n in ns]
+        monticulo_acreedores = [(-c, n) for c, ns in acreedores.items() for n in ns]
+        heapq.heapify(monticulo_deudores)
+        heapq.heapify(monticulo_acreedores)
+        while monticulo_deudores and monticulo_acreedores:
+            debe, deudor = heapq.heappop(monticulo_deudores)
+            le_deben, acreedor = heapq.heappop(monticulo_acreedores)
+            centavos = min(-debe, -le_deben)
+            resultado.append(Transferencia(deudor, acreedor, centavos / 100))
+            if -debe > centavos:
+                heapq.heappush(monticulo_deudores, (debe + centavos, deudor))
+            if -le_deben > centavos:
+                heapq.heappush(monticulo_acreedores, (le_deben + centavos, acreedor))
+        return resultado
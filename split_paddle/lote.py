@@ -0,0 +1,241 @@
+import numpy as np
+
+from . import medicion
+from .dinero import pesos_por_tramo, repartir_proporcional
+from .horas import hora_a_minutos
+from .paralelo import ajustar_formas_de_pago, liquidar_sesion
+from .registros import Pago, como_jugador
+
+
+@medicion.medido("lote.calcular")
+def calcular_pagos_en_lote(
+    sesion_ids, inicios, fines, montos, jugador_sesion, llegadas, salidas
+):
+    """
+    Calcula de una sola vez los pagos exactos de muchas sesiones de cancha.
+
+    Recibe columnas: por sesión el id, la hora de inicio, la de fin y el monto total;
+    por jugador el id de su sesión, la llegada y la salida. Devuelve dos arrays
+    alineados con los jugadores: (pagos, tiempos).
+
+    Aplica la misma regla y el mismo orden de operaciones que
+    pagos.calcular_pagos_por_intervalos, así que los resultados coinciden exactamente
+    con llamar a la función escalar sesión por sesión.
+    """
+    sesion_ids = np.asarray(sesion_ids)
+    inicios = np.asarray(inicios, dtype=np.float64)
+    fines = np.asarray(fines, dtype=np.float64)
+    montos = np.asarray(montos, dtype=np.float64)
+    jugador_sesion = np.asarray(jugador_sesion)
+    llegadas = np.asarray(llegadas, dtype=np.float64)
+    salidas = np.asarray(salidas, dtype=np.float64)
+
+    num_jugadores = len(jugador_sesion)
+    if num_jugadores == 0:
+        return np.zeros(0), np.zeros(0)
+
+    # 1. Ubicar la sesión de cada jugador
+    orden_ids = np.argsort(sesion_ids, kind="stable")
+    ids_ordenados = sesion_ids[orden_ids]
+    pos = np.searchsorted(ids_ordenados, jugador_sesion)
+    pos = np.minimum(pos, len(ids_ordenados) - 1)
+    if len(ids_ordenados) == 0 or np.any(ids_ordenados[pos] != jugador_sesion):
+        raise ValueError("Hay jugadores asignados a una sesión desconocida.")
+    sesion = orden_ids[pos]
+
+    # 2. Recortar llegadas y salidas al horario de cada cancha
+    inicio_j = inicios[sesion]
+    fin_j = fines[sesion]
+    llegada = np.minimum(np.maximum(llegadas, inicio_j), fin_j)
+    salida = np.minimum(np.maximum(salidas, llegada), fin_j)
+
+    duracion_total = fines - inicios
+    costo_por_hora = np.zeros(len(inicios))
+    np.divide(montos, duracion_total, out=costo_por_hora, where=duracion_total > 0)
+
+    # 3. Ordenar los eventos por sesión y tiempo. Los empates no cambian el resultado:
+    # entre eventos simultáneos el acumulado no avanza.
+    jugador_ev = np.concatenate([np.arange(num_jugadores)] * 2)
+    tipo_ev = np.repeat(np.array([0, 1], dtype=np.int8), num_jugadores)
+    tiempo_ev = np.concatenate([llegada, salida])
+    sesion_ev = np.concatenate([sesion, sesion])
+    orden = np.argsort(tiempo_ev, kind="stable")
+    orden = orden[np.argsort(sesion_ev[orden], kind="stable")]
+    jugador_ev = jugador_ev[orden]
+    tipo_ev = tipo_ev[orden]
+    tiempo_ev = tiempo_ev[orden]
+    sesion_ev = sesion_ev[orden]
+
+    # 4. Jugadores presentes antes de cada evento. Cada sesión tiene tantas salidas
+    # como llegadas, así que la suma acumulada global vuelve a cero entre sesiones.
+    presentes = np.cumsum(np.where(tipo_ev == 0, 1, -1))
+    presentes_antes = np.concatenate([[0], presentes[:-1]])
+    tiempo_antes = np.concatenate([[0.0], tiempo_ev[:-1]])
+    hueco = tiempo_ev - tiempo_antes
+    con_costo = (presentes_antes > 0) & (hueco > 0)
+    incremento = np.zeros(len(tiempo_ev))
+    incremento[con_costo] = (
+        hueco[con_costo]
+        * costo_por_hora[sesion_ev[con_costo]]
+        / presentes_antes[con_costo]
+    )
+
+    # 5. Costo por cabeza acumulado dentro de cada sesión
+    acumulado = _acumular_por_sesion(incremento, sesion_ev, len(inicios))
+
+    # 6. Cada jugador paga la diferencia del acumulado entre su salida y su llegada
+    acumulado_llegada = np.empty(num_jugadores)
+    acumulado_salida = np.empty(num_jugadores)
+    es_llegada = tipo_ev == 0
+    acumulado_llegada[jugador_ev[es_llegada]] = acumulado[es_llegada]
+    acumulado_salida[jugador_ev[~es_llegada]] = acumulado[~es_llegada]
+    return acumulado_salida - acumulado_llegada, salida - llegada
+
+
+def _acumular_por_sesion(valores, sesion_ev, num_sesiones):
+    """
+    Suma acumulada reiniciada en cada sesión (los eventos vienen agrupados por sesión).
+
+    Se arma una matriz por sesión y se acumula por filas, así cada sesión suma en el
+    mismo orden y desde cero, igual que el barrido escalar. Las sesiones se agrupan por
+    cantidad de eventos (potencias de dos) para no rellenar todo al tamaño de la más
+    grande.
+    """
+    eventos_por_sesion = np.bincount(sesion_ev, minlength=num_sesiones)
+    comienzo = np.concatenate([[0], np.cumsum(eventos_por_sesion)[:-1]])
+    posicion = np.arange(len(valores)) - comienzo[sesion_ev]
+
+    ancho_sesion = np.ones(num_sesiones, dtype=np.int64)
+    con_eventos = eventos_por_sesion > 0
+    ancho_sesion[con_eventos] = 2 ** np.ceil(
+        np.log2(eventos_por_sesion[con_eventos])
+    ).astype(np.int64)
+    ancho_ev = ancho_sesion[sesion_ev]
+
+    acumulado = np.empty(len(valores))
+    for ancho in np.unique(ancho_sesion[con_eventos]):
+        sesiones_grupo = ancho_sesion == ancho
+        fila_sesion = np.cumsum(sesiones_grupo) - 1
+        en_grupo = ancho_ev == ancho
+        fila = fila_sesion[sesion_ev[en_grupo]]
+        matriz = np.zeros((fila_sesion[-1] + 1, ancho))
+        matriz[fila, posicion[en_grupo]] = valores[en_grupo]
+        np.cumsum(matriz, axis=1, out=matriz)
+        acumulado[en_grupo] = matriz[fila, posicion[en_grupo]]
+    return acumulado
+
+
+def columnas_desde_sesiones(sesiones):
+    """
+    Arma las columnas de calcular_pagos_en_lote a partir de una lista de sesiones
+    (dicts con hora_inicio, hora_fin, monto_total y jugadores). El id de cada sesión
+    es su posición en la lista.
+    """
+    inicios, fines, montos = [], [], []
+    jugador_sesion, llegadas, salidas = [], [], []
+    for idx, sesion in enumerate(sesiones):
+        inicios.append(sesion["hora_inicio"])
+        fines.append(sesion["hora_fin"])
+        montos.append(sesion["monto_total"])
+        for j in sesion["jugadores"]:
+            jugador_sesion.append(idx)
+            llegadas.append(j["llegada"])
+            salidas.append(j["salida"])
+    return (
+        np.arange(len(sesiones)),
+        np.array(inicios, dtype=np.float64),
+        np.array(fines, dtype=np.float64),
+        np.array(montos, dtype=np.float64),
+        np.array(jugador_sesion, dtype=np.int64),
+        np.array(llegadas, dtype=np.float64),
+        np.array(salidas, dtype=np.float64),
+    )
+
+
+@medicion.medido("lote")
+def liquidar_sesiones_en_lote(sesiones):
+    """
+    Da lo mismo que paralelo.liquidar_sesion aplicado a cada sesión, pero el barrido
+    de todas las sesiones se hace de una vez con calcular_pagos_en_lote. El reparto en
+    pesos enteros y el ajuste por forma de pago siguen siendo por sesión (son enteros
+    y dependen de todos los jugadores de la sesión). Las sesiones con tarifa se
+    liquidan de a una con liquidar_sesion.
+    Devuelve una lista de (pagos_redondeados, pagos_detallados, vuelto).
+    """
+    sesiones = list(sesiones)
+    con_tarifa = {
+        idx: liquidar_sesion(sesion)
+        for idx, sesion in enumerate(sesiones)
+        if sesion.get("tarifa") is not None
+    }
+    if not con_tarifa:
+        return _liquidar_sin_tarifa(sesiones)
+    sin_tarifa = iter(
+        _liquidar_sin_tarifa(
+            [s for idx, s in enumerate(sesiones) if idx not in con_tarifa]
+        )
+    )
+    return [
+        con_tarifa[idx] if idx in con_tarifa else next(sin_tarifa)
+        for idx in range(len(sesiones))
+    ]
+
+
+def _liquidar_sin_tarifa(sesiones):
+    inicios, fines, montos = [], [], []
+    jugador_sesion, llegadas, salidas = [], [], []
+    armadas = []
+    for idx, sesion in enumerate(sesiones):
+        hora_inicio = sesion["hora_inicio"]
+        hora_fin = sesion["hora_fin"]
+        inicios.append(hora_inicio)
+        fines.append(hora_fin)
+        montos.append(sesion["monto_total"])
+        # Por jugador: (nombre, fila en las columnas o None si no tiene horario, tiempo)
+        filas = []
+        tramos_minutos = []
+        for j in map(como_jugador, sesion["jugadores"]):
+            if not j.nombre:
+                continue
+            if j.llegada is None or j.salida is None:
+                filas.append((j.nombre, None, 0))
+                tramos_minutos.append((0, 0))
+                continue
+            # El tiempo se calcula acá para que conserve el tipo que da la versión
+            # escalar (int si los horarios son enteros).
+            llegada = min(max(j.llegada, hora_inicio), hora_fin)
+            salida = min(max(j.salida, llegada), hora_fin)
+            filas.append((j.nombre, len(llegadas), salida - llegada))
+            tramos_minutos.append((hora_a_minutos(llegada), hora_a_minutos(salida)))
+            jugador_sesion.append(idx)
+            llegadas.append(j.llegada)
+            salidas.append(j.salida)
+        armadas.append((filas, tramos_minutos))
+
+    pagos, _ = calcular_pagos_en_lote(
+        np.arange(len(sesiones)),
+        inicios,
+        fines,
+        montos,
+        np.array(jugador_sesion, dtype=np.int64),
+        llegadas,
+        salidas,
+    )
+    pagos = pagos.tolist()
+
+    resultados = []
+    for sesion, (filas, tramos_minutos) in zip(sesiones, armadas):
+        pagos_enteros = repartir_proporcional(
+            round(sesion["monto_total"]), pesos_por_tramo(tramos_minutos)
+        )
+        pagos_detallados = [
+            Pago(nombre, 0.0 if fila is None else pagos[fila], tiempo)
+            for nombre, fila, tiempo in filas
+        ]
+        pagos_redondeados = [
+            Pago(nombre, pago_entero, tiempo)
+            for (nombre, _, tiempo), pago_entero in zip(filas, pagos_enteros)
+        ]
+        vuelto = ajustar_formas_de_pago(sesion, pagos_detallados)
+        resultados.append((pagos_redondeados, pagos_detallados, vuelto))
+    return resultados
@@ -0,0 +1,151 @@
+"""
+Medición opcional de las etapas de una liquidación: tiempos y contadores.
+
+Está apagada por defecto, y apagada cuesta leer medicion.activa una vez por etapa.
+Se prende con activar() o con la variable de entorno SPLIT_PADDLE_MEDIR=1 (por
+ejemplo en el servidor de Streamlit). Lo medido se exporta con a_json() o en el
+formato de texto de Prometheus con a_prometheus().
+
+Etapas: parsear_hora; calcular (total) y calcular.eventos, calcular.costo,
+calcular.orden, calcular.barrido, calcular.redondeo y calcular.salida; ajustar;
+lote y lote.calcular; mostrar_pagos y mostrar_pagos_streamlit.
+"""
+
+import functools
+import json
+import os
+import threading
+from time import perf_counter
+
+activa = os.environ.get("SPLIT_PADDLE_MEDIR", "") not in ("", "0")
+
+# etapa -> [llamadas, segundos, máximo]
+_etapas = {}
+_contadores = {}
+_candado = threading.Lock()
+
+
+def activar():
+    global activa
+    activa = True
+
+
+def desactivar():
+    global activa
+    activa = False
+
+
+def reiniciar():
+    """
+    Borra lo medido hasta ahora (no cambia si la medición está prendida).
+    """
+    with _candado:
+        _etapas.clear()
+        _contadores.clear()
+
+
+def registrar(etapa, segundos):
+    with _candado:
+        datos = _etapas.get(etapa)
+        if datos is None:
+            _etapas[etapa] = [1, segundos, segundos]
+        else:
+            datos[0] += 1
+            datos[1] += segundos
+            if segundos > datos[2]:
+                datos[2] = segundos
+
+
+def marcar(etapa, desde):
+    """
+    Registra el tiempo desde `desde` (un perf_counter) hasta ahora y devuelve ahora,
+    para encadenar etapas.
+    """
+    ahora = perf_counter()
+    registrar(etapa, ahora - desde)
+    return ahora
+
+
+def contar(nombre, cantidad=1):
+    with _candado:
+        _contadores[nombre] = _contadores.get(nombre, 0) + cantidad
+
+
+def medido(etapa):
+    """
+    Decorador para medir una función entera. Apagado agrega una llamada y una
+    comparación, así que es para etapas de microsegundos para arriba; en las más
+    chicas el chequeo va adentro de la función.
+    """
+
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltorio(*args, **kwargs):
+            if not activa:
+                return funcion(*args, **kwargs)
+            desde = perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                marcar(etapa, desde)
+
+        return envoltorio
+
+    return decorador
+
+
+def resumen():
+    """
+    Lo medido como dict: por etapa las llamadas, los segundos en total y el máximo,
+    y los contadores.
+    """
+    with _candado:
+        return {
+            "etapas": {
+                etapa: {"llamadas": llamadas, "segundos": segundos, "maximo": maximo}
+                for etapa, (llamadas, segundos, maximo) in sorted(_etapas.items())
+            },
+            "contadores": dict(sorted(_contadores.items())),
+        }
+
+
+def a_json():
+    return json.dumps(resumen(), ensure_ascii=False)
+
+
+def a_prometheus():
+    """
+    Lo medido en el formato de texto de Prometheus (version 0.0.4).
+    """
+    datos = resumen()
+    lineas = [
+        "# HELP split_paddle_etapa_llamadas_total Veces que se ejecutó cada etapa.",
+        "# TYPE split_paddle_etapa_llamadas_total counter",
+    ]
+    for etapa, valores in datos["etapas"].items():
+        lineas.append(
+            f'split_paddle_etapa_llamadas_total{{etapa="{etapa}"}} {valores["llamadas"]}'
+        )
+    lineas += [
+        "# HELP split_paddle_etapa_segundos_total Tiempo total en cada etapa.",
+        "# TYPE split_paddle_etapa_segundos_total counter",
+    ]
+    for etapa, valores in datos["etapas"].items():
+        lineas.append(
+            f'split_paddle_etapa_segundos_total{{etapa="{etapa}"}} {valores["segundos"]!r}'
+        )
+    lineas += [
+        "# HELP split_paddle_etapa_segundos_max Llamada más lenta de cada etapa.",
+        "# TYPE split_paddle_etapa_segundos_max gauge",
+    ]
+    for etapa, valores in datos["etapas"].items():
+        lineas.append(
+            f'split_paddle_etapa_segundos_max{{etapa="{etapa}"}} {valores["maximo"]!r}'
+        )
+    lineas += [
+        "# HELP split_paddle_contador_total Contadores de las etapas.",
+        "# TYPE split_paddle_contador_total counter",
+    ]
+    for nombre, valor in datos["contadores"].items():
+        lineas.append(f'split_paddle_contador_total{{nombre="{nombre}"}} {valor}')
+    return "\n".join(lineas) + "\n"
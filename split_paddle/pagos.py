@@ -0,0 +1,209 @@
+from time import perf_counter
+
+from . import medicion
+from .dinero import (
+    a_centavos,
+    pesos_por_tramo,
+    redondear_efectivo,
+    repartir_proporcional,
+)
+from .horas import hora_a_minutos
+from .registros import Intervalo, Pago, como_jugador
+from .tarifas import franjas
+
+PAGO_EFECTIVO = "Efectivo"
+PAGO_BILLETERA = "Billetera"
+# Billete más chico con el que se paga en efectivo, en pesos.
+DENOMINACION = 100
+
+
+def calcular_pagos_por_intervalos(
+    jugadores, monto_total, hora_inicio, hora_fin, tarifa=None
+):
+    """
+    Calcula el pago de cada jugador prorrateando por intervalos según la cantidad de
+    jugadores presentes en cada tramo.
+
+    Se recorre una sola vez la línea de tiempo ordenada acumulando el "costo por cabeza"
+    (costo del tramo dividido la cantidad de presentes). Lo que paga cada jugador es la
+    diferencia de ese acumulado entre su salida y su llegada, así que no hace falta
+    guardar quién estaba en cada intervalo.
+
+    Los pagos redondeados salen de repartir el total en pesos enteros según el peso
+    exacto de cada jugador, calculado en minutos enteros (ver dinero.pesos_por_tramo);
+    suman exactamente el total sin cargarle la diferencia a nadie en particular.
+
+    Con tarifa (lista de (desde, costo_por_hora), ver tarifas.py) cada tramo se cobra
+    al precio de su franja: los cambios de precio entran al barrido como un evento
+    más, así que el costo sigue siendo O((jugadores + franjas) log n). Si además hay
+    monto_total, los precios se escalan para que sumen ese total; con monto_total
+    None el total es lo que marca la tarifa.
+
+    Las llegadas y salidas se recortan al horario de la cancha. Se ignoran los jugadores
+    sin nombre; los que no tienen horario no suman tiempo ni pagan.
+    Devuelve (pagos_redondeados, pagos_detallados).
+    """
+    # Medición opcional por etapa (ver medicion.py); apagada es solo este if.
+    medir = medicion.activa
+    if medir:
+        inicio_calculo = marca = perf_counter()
+
+    # 1. Obtener todos los puntos de cambio (llegadas y salidas)
+    nombres = []
+    tiempos = []
+    tramos_minutos = []
+    eventos = []
+    for j in map(como_jugador, jugadores):
+        if not j.nombre:
+            continue
+        idx = len(nombres)
+        nombres.append(j.nombre)
+        if j.llegada is None or j.salida is None:
+            tiempos.append(0)
+            tramos_minutos.append((0, 0))
+            continue
+        llegada = min(max(j.llegada, hora_inicio), hora_fin)
+        salida = min(max(j.salida, llegada), hora_fin)
+        tiempos.append(salida - llegada)
+        tramos_minutos.append((hora_a_minutos(llegada), hora_a_minutos(salida)))
+        eventos.append((llegada, 0, idx))
+        eventos.append((salida, 1, idx))
+    if medir:
+        marca = medicion.marcar("calcular.eventos", marca)
+
+    # 2. Calcular el costo por hora (con tarifa, el de la primera franja y un evento
+    # por cada cambio de precio)
+    precios_minutos = None
+    if tarifa is None:
+        if monto_total is None:
+            raise ValueError("Falta el monto total o la tarifa.")
+        duracion_total = hora_fin - hora_inicio
+        costo_por_hora = monto_total / duracion_total if duracion_total > 0 else 0
+    else:
+        tramos_tarifa = franjas(tarifa, hora_inicio, hora_fin)
+        costo_tarifa = sum((hasta - desde) * c for desde, hasta, c in tramos_tarifa)
+        if monto_total is None:
+            monto_total = costo_tarifa
+        elif costo_tarifa <= 0 and monto_total:
+            raise ValueError("La tarifa no cobra nada en el horario de la cancha.")
+        escala = monto_total / costo_tarifa if costo_tarifa > 0 else 0
+        costo_por_hora = tramos_tarifa[0][2] * escala
+        for desde, _, costo in tramos_tarifa[1:]:
+            eventos.append((desde, 2, costo * escala))
+        precios_minutos = [
+            (hora_a_minutos(desde), a_centavos(costo))
+            for desde, _, costo in tramos_tarifa
+        ]
+    if medir:
+        marca = medicion.marcar("calcular.costo", marca)
+    eventos.sort()
+    if medir:
+        marca = medicion.marcar("calcular.orden", marca)
+
+    # 3. Barrer los eventos acumulando el costo por cabeza
+    pagos = [0.0] * len(nombres)
+    acumulado = 0.0
+    presentes = 0
+    ultimo_tiempo = hora_inicio
+    for tiempo, tipo, idx in eventos:
+        if presentes and tiempo > ultimo_tiempo:
+            acumulado += (tiempo - ultimo_tiempo) * costo_por_hora / presentes
+        ultimo_tiempo = tiempo
+        if tipo == 0:
+            pagos[idx] -= acumulado
+            presentes += 1
+        elif tipo == 1:
+            pagos[idx] += acumulado
+            presentes -= 1
+        else:
+            costo_por_hora = idx
+    if medir:
+        marca = medicion.marcar("calcular.barrido", marca)
+
+    # 4. Redondear repartiendo el total en pesos enteros
+    pagos_enteros = repartir_proporcional(
+        round(monto_total), pesos_por_tramo(tramos_minutos, precios_minutos)
+    )
+    if medir:
+        marca = medicion.marcar("calcular.redondeo", marca)
+
+    # 5. Preparar la salida en el mismo formato que antes
+    pagos_detallados = []
+    pagos_redondeados = []
+    for nombre, pago, pago_entero, tiempo in zip(
+        nombres, pagos, pagos_enteros, tiempos
+    ):
+        pagos_detallados.append(Pago(nombre, pago, tiempo))
+        pagos_redondeados.append(Pago(nombre, pago_entero, tiempo))
+    if medir:
+        medicion.marcar("calcular.salida", marca)
+        medicion.marcar("calcular", inicio_calculo)
+        medicion.contar("calcular.jugadores", len(nombres))
+        medicion.contar("calcular.eventos", len(eventos))
+    return pagos_redondeados, pagos_detallados
+
+
+def recorrer_intervalos(jugadores, hora_inicio, hora_fin):
+    """
+    Genera los tramos de la cancha (Intervalo) con quiénes estaban en cada uno, con el
+    mismo recorte de horarios que calcular_pagos_por_intervalos. Sirve para mostrar o
+    auditar un cálculo; los pagos no lo necesitan.
+    """
+    eventos = []
+    for j in map(como_jugador, jugadores):
+        if not j.nombre or j.llegada is None or j.salida is None:
+            continue
+        llegada = min(max(j.llegada, hora_inicio), hora_fin)
+        salida = min(max(j.salida, llegada), hora_fin)
+        eventos.append((llegada, 0, j.nombre))
+        eventos.append((salida, 1, j.nombre))
+    eventos.sort()
+
+    en_cancha = {}
+    ultimo_tiempo = hora_inicio
+    for tiempo, tipo, nombre in eventos:
+        if en_cancha and tiempo > ultimo_tiempo:
+            yield Intervalo(ultimo_tiempo, tiempo, tuple(en_cancha))
+        ultimo_tiempo = tiempo
+        if tipo == 0:
+            en_cancha[nombre] = None
+        else:
+            en_cancha.pop(nombre, None)
+
+
+@medicion.medido("ajustar")
+def ajustar_pagos_y_redondear(
+    pagos_detallados, forma_pago_dict, monto_total=None, denominacion=DENOMINACION
+):
+    """
+    Ajusta los pagos: redondea efectivo, distribuye diferencias a billetera.
+    Modifica pagos_detallados directamente.
+
+    Las cuentas se hacen en centavos enteros. Con monto_total los pagos se llevan
+    primero a centavos que sumen exactamente ese total. El efectivo se redondea a
+    múltiplos de denominacion (en pesos) con dinero.redondear_efectivo: el mayor
+    desvío respecto de lo exacto queda lo más chico posible y billetera cubre la
+    diferencia, así que el total coincide justo.
+
+    Si todos pagan en efectivo y el total no se puede formar con billetes, se cobra de
+    más y se devuelve el vuelto en pesos (0 si no hace falta).
+    """
+    es_efectivo = []
+    for pago in pagos_detallados:
+        forma_pago = forma_pago_dict.get(pago["nombre"], PAGO_EFECTIVO)
+        pago["forma_pago"] = forma_pago
+        es_efectivo.append(forma_pago == PAGO_EFECTIVO)
+
+    centavos = [a_centavos(p["pago"]) for p in pagos_detallados]
+    if monto_total is not None and pagos_detallados:
+        centavos = repartir_proporcional(a_centavos(monto_total), centavos)
+
+    pagados, vuelto = redondear_efectivo(
+        centavos, es_efectivo, a_centavos(denominacion)
+    )
+    for pago, efectivo, centavos_pago in zip(pagos_detallados, es_efectivo, pagados):
+        if efectivo and centavos_pago % 100 == 0:
+            pago["pago"] = centavos_pago // 100
+        else:
+            pago["pago"] = centavos_pago / 100
+    return vuelto / 100
@@ -0,0 +1,97 @@
+from itertools import islice
+
+from .pagos import (
+    DENOMINACION,
+    ajustar_pagos_y_redondear,
+    calcular_pagos_por_intervalos,
+)
+from .tarifas import tarifa_del_dia
+
+TAMANO_BLOQUE = 256
+
+
+def liquidar_sesion(sesion):
+    """
+    Liquida una sesión: dict con hora_inicio, hora_fin, monto_total y jugadores.
+    Puede traer una tarifa (ver tarifas.py; si distingue fines de semana se usa la
+    fecha de la sesión) y entonces monto_total es opcional.
+    Si los jugadores traen forma_pago, además se ajustan los pagos detallados con
+    ajustar_pagos_y_redondear. Devuelve (pagos_redondeados, pagos_detallados, vuelto),
+    con el vuelto en pesos (0 si no hay que dar).
+    """
+    pagos_redondeados, pagos_detallados = calcular_sesion(sesion)
+    vuelto = ajustar_formas_de_pago(sesion, pagos_detallados)
+    return pagos_redondeados, pagos_detallados, vuelto
+
+
+def calcular_sesion(sesion):
+    """
+    calcular_pagos_por_intervalos sobre una sesión en dict, con su tarifa si tiene:
+    los pagos exactos, sin el ajuste por forma de pago.
+    """
+    tarifa = sesion.get("tarifa")
+    return calcular_pagos_por_intervalos(
+        sesion["jugadores"],
+        sesion.get("monto_total"),
+        sesion["hora_inicio"],
+        sesion["hora_fin"],
+        None if tarifa is None else tarifa_del_dia(tarifa, sesion.get("fecha")),
+    )
+
+
+def ajustar_formas_de_pago(sesion, pagos_detallados):
+    """
+    Si los jugadores de la sesión traen forma_pago, ajusta los pagos detallados con
+    ajustar_pagos_y_redondear (con el billete de sesion["denominacion"], si lo trae);
+    si no, los deja como están. Devuelve el vuelto en pesos (0 si no hay que dar).
+    """
+    # Los jugadores sin nombre no se liquidan: su forma de pago no cuenta.
+    forma_pago_dict = {
+        j["nombre"]: j["forma_pago"]
+        for j in sesion["jugadores"]
+        if j["nombre"] and j.get("forma_pago")
+    }
+    if not forma_pago_dict:
+        return 0
+    return ajustar_pagos_y_redondear(
+        pagos_detallados,
+        forma_pago_dict,
+        sesion.get("monto_total"),
+        sesion.get("denominacion", DENOMINACION),
+    )
+
+
+def _liquidar_bloque(sesiones):
+    return [liquidar_sesion(sesion) for sesion in sesiones]
+
+
+def _bloques(sesiones, tamano_bloque):
+    iterador = iter(sesiones)
+    while True:
+        bloque = list(islice(iterador, tamano_bloque))
+        if not bloque:
+            return
+        yield bloque
+
+
+def liquidar_sesiones(sesiones, procesos=None, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Liquida muchas sesiones repartiéndolas en bloques entre varios procesos.
+
+    Los resultados vuelven en el mismo orden que las sesiones, así que la salida
+    (con el vuelto incluido) es idéntica a llamar a liquidar_sesion una por una. Con procesos=1 no se levanta
+    ningún proceso; con None se usa uno por CPU.
+    """
+    if tamano_bloque < 1:
+        raise ValueError("El tamaño de bloque debe ser al menos 1.")
+    if procesos == 1:
+        return [liquidar_sesion(sesion) for sesion in sesiones]
+
+    # Se importa acá: levantar procesos es lo raro y el import cuesta en el arranque.
+    from concurrent.futures import ProcessPoolExecutor
+
+    resultados = []
+    with ProcessPoolExecutor(max_workers=procesos) as executor:
+        for bloque in executor.map(_liquidar_bloque, _bloques(sesiones, tamano_bloque)):
+            resultados.extend(bloque)
+    return resultados
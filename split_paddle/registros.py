@@ -0,0 +1,187 @@
+from array import array
+
+
+class _Registro:
+    """
+    Base de los registros livianos (con __slots__, sin __dict__ por instancia).
+
+    Los campos se leen como atributos, pero también como en un dict
+    (registro["pago"], registro.get("forma_pago")) para que el código que usaba
+    dicts siga funcionando igual.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, campo):
+        try:
+            return getattr(self, campo)
+        except AttributeError:
+            raise KeyError(campo) from None
+
+    def __setitem__(self, campo, valor):
+        if campo not in self.__slots__:
+            raise KeyError(campo)
+        setattr(self, campo, valor)
+
+    def __contains__(self, campo):
+        return campo in self.__slots__ and hasattr(self, campo)
+
+    def get(self, campo, defecto=None):
+        return getattr(self, campo, defecto) if campo in self.__slots__ else defecto
+
+    def a_dict(self):
+        return {c: getattr(self, c) for c in self.__slots__ if hasattr(self, c)}
+
+    def __eq__(self, otro):
+        if isinstance(otro, (_Registro, dict)):
+            return self.a_dict() == (
+                otro.a_dict() if isinstance(otro, _Registro) else otro
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        campos = ", ".join(f"{c}={v!r}" for c, v in self.a_dict().items())
+        return f"{type(self).__name__}({campos})"
+
+
+class Jugador(_Registro):
+    __slots__ = ("nombre", "llegada", "salida", "forma_pago")
+
+    def __init__(self, nombre, llegada, salida, forma_pago=None):
+        self.nombre = nombre
+        self.llegada = llegada
+        self.salida = salida
+        if forma_pago is not None:
+            self.forma_pago = forma_pago
+
+
+class Intervalo(_Registro):
+    """
+    Tramo de la cancha con los mismos jugadores presentes.
+    """
+
+    __slots__ = ("inicio", "fin", "jugadores")
+
+    def __init__(self, inicio, fin, jugadores):
+        self.inicio = inicio
+        self.fin = fin
+        self.jugadores = jugadores
+
+    @property
+    def duracion(self):
+        return self.fin - self.inicio
+
+
+class Pago(_Registro):
+    __slots__ = ("nombre", "pago", "tiempo", "forma_pago")
+
+    def __init__(self, nombre, pago, tiempo, forma_pago=None):
+        self.nombre = nombre
+        self.pago = pago
+        self.tiempo = tiempo
+        if forma_pago is not None:
+            self.forma_pago = forma_pago
+
+
+class Transferencia(_Registro):
+    """
+    Pago de un jugador a otro para saldar deudas.
+    """
+
+    __slots__ = ("deudor", "acreedor", "monto")
+
+    def __init__(self, deudor, acreedor, monto):
+        self.deudor = deudor
+        self.acreedor = acreedor
+        self.monto = monto
+
+
+class Tramo(_Registro):
+    """
+    Rato que un jugador estuvo en una cancha, un día, dentro de una sesión.
+    """
+
+    __slots__ = ("nombre", "fecha", "llegada", "salida", "cancha", "sesion")
+
+    def __init__(self, nombre, fecha, llegada, salida, cancha=None, sesion=None):
+        self.nombre = nombre
+        self.fecha = fecha
+        self.llegada = llegada
+        self.salida = salida
+        self.cancha = cancha
+        self.sesion = sesion
+
+
+class Problema(_Registro):
+    """
+    Error o aviso de una validación (ver validacion.py). nivel es ERROR o AVISO,
+    codigo identifica la regla y mensaje es el texto para mostrar; jugador y sesion
+    dicen a qué se refiere, si corresponde.
+    """
+
+    __slots__ = ("nivel", "codigo", "mensaje", "jugador", "sesion")
+
+    def __init__(self, nivel, codigo, mensaje, jugador=None, sesion=None):
+        self.nivel = nivel
+        self.codigo = codigo
+        self.mensaje = mensaje
+        self.jugador = jugador
+        self.sesion = sesion
+
+
+def como_jugador(jugador):
+    """
+    Devuelve el Jugador tal cual, o arma uno a partir de un dict.
+    """
+    if isinstance(jugador, Jugador):
+        return jugador
+    return Jugador(
+        jugador["nombre"],
+        jugador["llegada"],
+        jugador["salida"],
+        jugador.get("forma_pago"),
+    )
+
+
+def a_json(objeto):
+    """
+    Para usar como default= de json.dumps con listas de registros.
+    """
+    if isinstance(objeto, _Registro):
+        return objeto.a_dict()
+    raise TypeError(f"{type(objeto).__name__} no se puede pasar a JSON")
+
+
+class TablaJugadores:
+    """
+    Jugadores de muchas sesiones guardados por columnas (arrays de C y una lista de
+    nombres) en lugar de un objeto por fila. Es la entrada natural de
+    lote.calcular_pagos_en_lote.
+    """
+
+    __slots__ = ("sesion", "nombres", "llegadas", "salidas")
+
+    def __init__(self):
+        self.sesion = array("q")
+        self.nombres = []
+        self.llegadas = array("d")
+        self.salidas = array("d")
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def agregar(self, sesion, nombre, llegada, salida):
+        self.sesion.append(sesion)
+        self.nombres.append(nombre)
+        self.llegadas.append(llegada)
+        self.salidas.append(salida)
+
+    def jugadores(self, desde=0, hasta=None):
+        """
+        Genera Jugador para las filas pedidas, sin materializar toda la tabla.
+        """
+        hasta = len(self) if hasta is None else hasta
+        for i in range(desde, hasta):
+            yield Jugador(self.nombres[i], self.llegadas[i], self.salidas[i])
@@ -0,0 +1,353 @@
+"""
+Servicio HTTP de liquidación (solo biblioteca estándar, con asyncio).
+
+    POST /liquidar   cuerpo: una sesión en JSON (hora_inicio, hora_fin, monto_total y
+                     jugadores, como en el modo --entrada jsonl). Responde con pagos y
+                     detalle (y vuelto, si el efectivo cobra de más), o con error
+                     y código 400.
+    GET  /metricas   pedidos atendidos, lotes calculados (y cuántos se liquidaron de a
+                     uno porque el lote falló) y latencia p50/p99 en ms; con
+                     --medir, además el tiempo de cada etapa (ver medicion.py).
+    GET  /metricas/prometheus   lo mismo en el formato de texto de Prometheus.
+
+Los pedidos que llegan casi juntos se agrupan (micro-lotes) y se liquidan de una vez
+con lote.liquidar_sesiones_en_lote; sin numpy se liquidan de a uno.
+
+Ejecutar con: python3 -m split_paddle.servicio [--host 0.0.0.0] [--puerto 8000] [--medir]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+
+from . import medicion
+from .paralelo import liquidar_sesion
+from .registros import a_json
+
+try:
+    from .lote import liquidar_sesiones_en_lote
+except ImportError:  # numpy es opcional
+    liquidar_sesiones_en_lote = None
+
+# Cuánto se espera juntando pedidos antes de calcular, y el máximo por lote.
+VENTANA_LOTE = 0.002
+MAX_LOTE = 256
+# Latencias que se guardan para calcular los percentiles.
+MUESTRAS_LATENCIA = 10_000
+MAX_CUERPO = 1 << 20
+
+_MOTIVOS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+
+
+def percentil(valores, p):
+    """
+    Percentil p (0 a 100) por el método del rango más cercano. None si no hay valores.
+    """
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    rango = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(rango) - 1]
+
+
+# Lo que lanza una sesión mal armada (falta un campo, un tipo o un número fuera de
+# rango). Cualquier otra excepción del cálculo en lote es un error del programa y no
+# se tapa.
+_ERRORES_DE_DATOS = (KeyError, TypeError, ValueError, OverflowError)
+
+
+def liquidar_lote(sesiones):
+    """
+    Liquida un lote de sesiones. Devuelve por cada una el dict de respuesta: id,
+    pagos y detalle, o id y error. Si el lote completo falla por una sesión mal
+    armada se reintenta de a una, para que el error quede solo en la que lo causó:
+    una sesión nunca hace fallar a las demás del lote.
+    """
+    respuestas, _ = _liquidar_lote(sesiones)
+    return respuestas
+
+
+def _liquidar_lote(sesiones):
+    """
+    liquidar_lote, y además si hubo que liquidar de a una porque el lote falló.
+    """
+    if liquidar_sesiones_en_lote is not None and len(sesiones) > 1:
+        try:
+            return [
+                _respuesta(sesion, resultado)
+                for sesion, resultado in zip(
+                    sesiones, liquidar_sesiones_en_lote(sesiones)
+                )
+            ], False
+        except _ERRORES_DE_DATOS:
+            de_a_una = True
+    else:
+        de_a_una = False
+    respuestas = []
+    for sesion in sesiones:
+        try:
+            respuestas.append(_respuesta(sesion, liquidar_sesion(sesion)))
+        except Exception as e:
+            respuestas.append(
+                {"id": sesion.get("id"), "error": f"Sesión inválida: {e!r}"}
+            )
+    return respuestas, de_a_una
+
+
+def _numero_finito(texto):
+    valor = float(texto)
+    if not math.isfinite(valor):
+        raise ValueError(f"Número fuera de rango: {texto}")
+    return valor
+
+
+def _constante_invalida(nombre):
+    raise ValueError(f"Número no válido: {nombre}")
+
+
+def _respuesta(sesion, resultado):
+    pagos_redondeados, pagos_detallados, vuelto = resultado
+    respuesta = {
+        "id": sesion.get("id"),
+        "pagos": pagos_redondeados,
+        "detalle": pagos_detallados,
+    }
+    if vuelto:
+        respuesta["vuelto"] = vuelto
+    return respuesta
+
+
+class Agrupador:
+    """
+    Junta los pedidos que llegan dentro de la ventana y los liquida en un solo lote.
+    El cálculo corre en un hilo aparte para que el servidor siga aceptando conexiones.
+    """
+
+    def __init__(self, ventana=VENTANA_LOTE, max_lote=MAX_LOTE):
+        self.ventana = ventana
+        self.max_lote = max_lote
+        self.lotes = 0
+        # Lotes que fallaron por una sesión mal armada y se liquidaron de a una.
+        self.lotes_de_a_uno = 0
+        self._pendientes = []
+        self._temporizador = None
+
+    async def liquidar(self, sesion):
+        futuro = asyncio.get_running_loop().create_future()
+        self._pendientes.append((sesion, futuro))
+        if len(self._pendientes) >= self.max_lote:
+            self._despachar()
+        elif self._temporizador is None:
+            self._temporizador = asyncio.get_running_loop().call_later(
+                self.ventana, self._despachar
+            )
+        return await futuro
+
+    def _despachar(self):
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        pendientes, self._pendientes = self._pendientes, []
+        if pendientes:
+            self.lotes += 1
+            asyncio.get_running_loop().create_task(self._calcular(pendientes))
+
+    async def _calcular(self, pendientes):
+        sesiones = [sesion for sesion, _ in pendientes]
+        try:
+            respuestas, de_a_una = await asyncio.get_running_loop().run_in_executor(
+                None, _liquidar_lote, sesiones
+            )
+        except Exception as e:
+            for _, futuro in pendientes:
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+        self.lotes_de_a_uno += de_a_una
+        for (_, futuro), respuesta in zip(pendientes, respuestas):
+            if not futuro.done():
+                futuro.set_result(respuesta)
+
+
+class Servicio:
+    def __init__(self, ventana=VENTANA_LOTE, max_lote=MAX_LOTE):
+        self.agrupador = Agrupador(ventana, max_lote)
+        self.pedidos = 0
+        self.latencias = deque(maxlen=MUESTRAS_LATENCIA)
+
+    def metricas(self):
+        latencias = list(self.latencias)
+        p50 = percentil(latencias, 50)
+        p99 = percentil(latencias, 99)
+        metricas = {
+            "pedidos": self.pedidos,
+            "lotes": self.agrupador.lotes,
+            "lotes_de_a_uno": self.agrupador.lotes_de_a_uno,
+            "p50_ms": None if p50 is None else round(p50 * 1000, 3),
+            "p99_ms": None if p99 is None else round(p99 * 1000, 3),
+        }
+        if medicion.activa:
+            metricas.update(medicion.resumen())
+        return metricas
+
+    def metricas_prometheus(self):
+        latencias = list(self.latencias)
+        lineas = [
+            "# HELP split_paddle_pedidos_total Pedidos a /liquidar atendidos.",
+            "# TYPE split_paddle_pedidos_total counter",
+            f"split_paddle_pedidos_total {self.pedidos}",
+            "# HELP split_paddle_lotes_total Lotes calculados.",
+            "# TYPE split_paddle_lotes_total counter",
+            f"split_paddle_lotes_total {self.agrupador.lotes}",
+            "# HELP split_paddle_lotes_de_a_uno_total Lotes que fallaron y se "
+            "liquidaron de a una sesión.",
+            "# TYPE split_paddle_lotes_de_a_uno_total counter",
+            f"split_paddle_lotes_de_a_uno_total {self.agrupador.lotes_de_a_uno}",
+            "# HELP split_paddle_latencia_segundos Latencia de /liquidar.",
+            "# TYPE split_paddle_latencia_segundos summary",
+        ]
+        for p, cuantil in ((50, "0.5"), (99, "0.99")):
+            valor = percentil(latencias, p)
+            if valor is not None:
+                lineas.append(
+                    f'split_paddle_latencia_segundos{{quantile="{cuantil}"}} {valor!r}'
+                )
+        return "\n".join(lineas) + "\n" + medicion.a_prometheus()
+
+    async def atender(self, lector, escritor):
+        """
+        Atiende una conexión HTTP/1.1, con keep-alive, hasta que el cliente la cierra.
+        """
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                inicio = time.perf_counter()
+                try:
+                    metodo, ruta, _ = linea.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    await self._responder(escritor, 400, {"error": "Pedido inválido."})
+                    break
+                encabezados = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b"\r\n", b"\n", b""):
+                        break
+                    clave, _, valor = linea.decode("latin-1").partition(":")
+                    encabezados[clave.strip().lower()] = valor.strip()
+                try:
+                    largo = int(encabezados.get("content-length") or 0)
+                except ValueError:
+                    largo = -1
+                if not 0 <= largo <= MAX_CUERPO:
+                    await self._responder(
+                        escritor,
+                        413,
+                        {"error": "Content-Length inválido o muy grande."},
+                    )
+                    break
+                cuerpo = await lector.readexactly(largo) if largo else b""
+
+                codigo, respuesta = await self._despachar(metodo, ruta, cuerpo)
+                cerrar = encabezados.get("connection", "").lower() == "close"
+                await self._responder(escritor, codigo, respuesta, cerrar)
+                if ruta == "/liquidar":
+                    self.pedidos += 1
+                    self.latencias.append(time.perf_counter() - inicio)
+                if cerrar:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _despachar(self, metodo, ruta, cuerpo):
+        if ruta in ("/metricas", "/metricas/prometheus"):
+            if metodo != "GET":
+                return 405, {"error": "Usar GET."}
+            if ruta == "/metricas/prometheus":
+                return 200, self.metricas_prometheus()
+            return 200, self.metricas()
+        if ruta != "/liquidar":
+            return 404, {"error": f"No existe {ruta}."}
+        if metodo != "POST":
+            return 405, {"error": "Usar POST."}
+        try:
+            # Infinity, NaN y números como 1e400 no son montos ni horas.
+            sesion = json.loads(
+                cuerpo,
+                parse_float=_numero_finito,
+                parse_constant=_constante_invalida,
+            )
+        except (ValueError, UnicodeDecodeError) as e:
+            return 400, {"error": f"JSON inválido: {e}"}
+        if not isinstance(sesion, dict) or not isinstance(
+            sesion.get("jugadores"), list
+        ):
+            return 400, {"error": "Se espera una sesión con la lista de jugadores."}
+        respuesta = await self.agrupador.liquidar(sesion)
+        return (400 if "error" in respuesta else 200), respuesta
+
+    async def _responder(self, escritor, codigo, respuesta, cerrar=False):
+        # Las respuestas en texto son las métricas para Prometheus; el resto, JSON.
+        if isinstance(respuesta, str):
+            cuerpo = respuesta.encode()
+            tipo = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            cuerpo = json.dumps(respuesta, ensure_ascii=False, default=a_json).encode()
+            tipo = "application/json; charset=utf-8"
+        encabezado = (
+            f"HTTP/1.1 {codigo} {_MOTIVOS[codigo]}\r\n"
+            f"Content-Type: {tipo}\r\n"
+            f"Content-Length: {len(cuerpo)}\r\n"
+            f"Connection: {'close' if cerrar else 'keep-alive'}\r\n\r\n"
+        )
+        escritor.write(encabezado.encode("latin-1") + cuerpo)
+        await escritor.drain()
+
+
+async def iniciar(host="127.0.0.1", puerto=8000, servicio=None):
+    """
+    Levanta el servidor y devuelve (servidor, servicio). Con puerto=0 el sistema elige
+    uno libre: servidor.sockets[0].getsockname()[1].
+    """
+    servicio = servicio or Servicio()
+    servidor = await asyncio.start_server(servicio.atender, host, puerto, backlog=1024)
+    return servidor, servicio
+
+
+async def _principal(host, puerto):
+    servidor, _ = await iniciar(host, puerto)
+    print(f"Escuchando en http://{host}:{puerto}")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def parsear_argumentos(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP de liquidación.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8000)
+    parser.add_argument(
+        "--medir", action="store_true", help="medir el tiempo de cada etapa"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parsear_argumentos()
+    if args.medir:
+        medicion.activar()
+    try:
+        asyncio.run(_principal(args.host, args.puerto))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,72 @@
+"""
+Tarifas por franja horaria: el precio por hora cambia a ciertas horas (hora pico) y
+puede ser otro los fines de semana.
+
+Una tarifa es una lista de (desde, costo_por_hora) ordenada por hora: cada precio
+rige desde su hora hasta la siguiente, y antes de la primera hora rige el primero.
+Para distinguir los fines de semana se usa un dict con las claves "semana" y
+"fin_de_semana"; tarifa_del_dia elige la que corresponde a una fecha.
+"""
+
+import datetime
+
+
+def tarifa_del_dia(tarifa, fecha=None):
+    """
+    Devuelve la lista de precios que rige en la fecha (datetime.date o texto
+    AAAA-MM-DD). Si la tarifa ya es una lista se devuelve tal cual. Lanza ValueError
+    si la tarifa distingue fines de semana y no hay fecha: no se usa la de hoy, para
+    que volver a liquidar una sesión dé siempre lo mismo.
+    """
+    if not isinstance(tarifa, dict):
+        return tarifa
+    if fecha is None:
+        raise ValueError("La tarifa distingue fines de semana y falta la fecha.")
+    if not isinstance(fecha, datetime.date):
+        fecha = datetime.date.fromisoformat(fecha)
+    return tarifa["fin_de_semana" if fecha.weekday() >= 5 else "semana"]
+
+
+def franjas(tarifa, hora_inicio, hora_fin):
+    """
+    Corta la tarifa al horario de la cancha. Devuelve una lista de
+    (desde, hasta, costo_por_hora) que cubre de hora_inicio a hora_fin sin huecos.
+    Lanza ValueError si la tarifa está vacía, desordenada o tiene precios negativos.
+    """
+    if not tarifa:
+        raise ValueError("La tarifa no tiene precios.")
+    anterior = None
+    for desde, costo in tarifa:
+        if anterior is not None and desde <= anterior:
+            raise ValueError("Las horas de la tarifa deben ir en orden creciente.")
+        if costo < 0:
+            raise ValueError(f"Precio negativo en la tarifa: {costo}.")
+        anterior = desde
+
+    resultado = []
+    costo_actual = tarifa[0][1]
+    for desde, costo in tarifa:
+        if desde > hora_inicio:
+            break
+        costo_actual = costo
+    inicio_franja = hora_inicio
+    for desde, costo in tarifa:
+        if desde <= hora_inicio:
+            continue
+        if desde >= hora_fin:
+            break
+        resultado.append((inicio_franja, desde, costo_actual))
+        inicio_franja, costo_actual = desde, costo
+    if hora_fin > inicio_franja or not resultado:
+        resultado.append((inicio_franja, hora_fin, costo_actual))
+    return resultado
+
+
+def costo_de_tarifa(tarifa, hora_inicio, hora_fin):
+    """
+    Lo que cuesta la cancha de hora_inicio a hora_fin con esta tarifa.
+    """
+    return sum(
+        (hasta - desde) * costo
+        for desde, hasta, costo in franjas(tarifa, hora_inicio, hora_fin)
+    )
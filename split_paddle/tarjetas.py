@@ -0,0 +1,122 @@
+from functools import lru_cache
+from html import escape
+from string import Formatter, Template
+
+from .pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+
+# Plantillas en una sola línea: sin la sangría de los f-strings anteriores el HTML
+# pesa bastante menos, y todas las tarjetas entran en un único st.markdown
+# (un bloque HTML de markdown termina en la primera línea vacía).
+# La tarjeta se arma en dos etapas: lo fijo ($estilo, $icono...) se completa una vez
+# por combinación en _plantilla_tarjeta, que la corta en los pedazos que van entre
+# los campos {} de cada jugador; cada tarjeta es después una sola concatenación.
+_TARJETA_PAGO = Template(
+    '<div style="$estilo">'
+    '<div style="display:flex; align-items:center;">'
+    '<span style="font-size:1.3em; margin-right:8px;">$icono</span>'
+    '<span style="font-weight:bold; font-size:1.1em; color:var(--text-color);">'
+    "{nombre}</span></div>"
+    '<div style="font-size:0.95em; color:var(--text-color);">{marca}</div>'
+    '<div style="color:var(--primary-color); font-weight:bold; margin-top:2px;">'
+    "$forma_pago</div>"
+    '<div style="color:var(--text-color);">Pago: '
+    '<span style="color:var(--primary-color); font-size:1.1em;">$pago</span></div>'
+    '<div style="color:var(--text-color); font-size:0.95em;">Tiempo: {tiempo}</div>'
+    "</div>"
+)
+_ENCABEZADO_JUGADOR = Template(
+    '<div style="border:$borde; border-radius:10px; background:$fondo; '
+    'padding:14px; margin-bottom:14px; box-shadow:0 2px 8px rgba(0,0,0,0.04);">'
+    '<span style="font-size:1.2em; font-weight:bold;">$icono Jugador #$numero</span>'
+    '<div style="margin-top:10px;"></div></div>'
+)
+
+
+def tarjetas_pagos(pagos_detallados, forma_pago_defecto=PAGO_EFECTIVO):
+    """
+    HTML de la tarjeta de cada jugador, en el orden de pagos_detallados.
+    No depende de Streamlit: las apps solo pasan el HTML a st.markdown.
+    forma_pago_defecto es la que se muestra si un pago no tiene forma_pago.
+    """
+    if not pagos_detallados:
+        return []
+    max_tiempo = max(p["tiempo"] for p in pagos_detallados)
+    min_tiempo = min(p["tiempo"] for p in pagos_detallados)
+    return [
+        tarjeta_pago(pago, idx < 4, max_tiempo, min_tiempo, forma_pago_defecto)
+        for idx, pago in enumerate(pagos_detallados)
+    ]
+
+
+def html_tarjetas(pagos_detallados, forma_pago_defecto=PAGO_EFECTIVO):
+    """
+    Todas las tarjetas en un solo bloque HTML, para dibujarlas con un único
+    st.markdown.
+    """
+    return "".join(tarjetas_pagos(pagos_detallados, forma_pago_defecto))
+
+
+def tarjeta_pago(pago, es_inicial, max_tiempo, min_tiempo, forma_pago_defecto):
+    marca = ""
+    if pago["tiempo"] == max_tiempo and max_tiempo != min_tiempo:
+        marca = " (más tiempo)"
+    elif pago["tiempo"] == min_tiempo and max_tiempo != min_tiempo:
+        marca = " (menos tiempo)"
+    horas = int(pago["tiempo"])
+    minutos = int(round((pago["tiempo"] - horas) * 60))
+
+    es_efectivo = pago.get("forma_pago", forma_pago_defecto) == PAGO_EFECTIVO
+    monto = f"{pago['pago']:,.0f}" if es_efectivo else f"{round(pago['pago'], 2):,.2f}"
+    nombre = escape(str(pago["nombre"]))
+    a, b, c, d, e = _plantilla_tarjeta(es_inicial, es_efectivo)
+    return f"{a}{nombre}{b}{marca}{c}{monto}{d}{horas}h {minutos:02d}m{e}"
+
+
+@lru_cache(maxsize=None)
+def encabezado_jugador(numero, es_inicial):
+    """
+    Recuadro con el número de jugador que encabeza sus campos en el formulario.
+    Es el mismo en cada recarga de la página, así que se arma una sola vez.
+    """
+    borde, fondo = _colores(es_inicial)
+    return _ENCABEZADO_JUGADOR.substitute(
+        borde=borde, fondo=fondo, icono="⭐️" if es_inicial else "", numero=numero
+    )
+
+
+@lru_cache(maxsize=None)
+def _plantilla_tarjeta(es_inicial, es_efectivo):
+    """
+    La tarjeta con colores, ícono y forma de pago ya puestos (hay solo cuatro
+    combinaciones), cortada en los cinco pedazos fijos que rodean a nombre, marca,
+    monto y tiempo.
+    """
+    borde, fondo = _colores(es_inicial)
+    if es_efectivo:
+        icono, forma_pago = "💵", PAGO_EFECTIVO
+        pago = "<b>${monto}</b> <span style='font-size:0.9em;'>(redondeado)</span>"
+    else:
+        icono, forma_pago = "📲", PAGO_BILLETERA
+        pago = "<b>${monto}</b>"
+    texto = _TARJETA_PAGO.substitute(
+        estilo=(
+            f"border:{borde}; border-radius:10px; padding:14px 10px 14px 10px; "
+            f"margin-bottom:14px; background:{fondo}; color:var(--text-color); "
+            "box-shadow: 0 2px 8px rgba(0,0,0,0.07); font-size:1em; "
+            "word-break: break-word;"
+        ),
+        icono=icono,
+        forma_pago=forma_pago,
+        pago=pago,
+    )
+    return tuple(literal for literal, _, _, _ in Formatter().parse(texto))
+
+
+def _colores(es_inicial):
+    # Azul suave para los jugadores 1-4, neutro para el resto
+    if es_inicial:
+        return "2.5px solid var(--primary-color)", "rgba(0, 123, 255, 0.10)"
+    return (
+        "1.5px solid var(--secondary-background-color)",
+        "var(--secondary-background-color)",
+    )
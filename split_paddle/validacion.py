@@ -0,0 +1,341 @@
+"""
+Validación de jugadores y de lotes de sesiones antes de liquidar.
+
+No se corta en el primer error: se revisa todo de una pasada y cada error o aviso
+sale como un Problema, así la página puede mostrar todos juntos y una importación
+grande puede separar las sesiones buenas de las malas. Lo que viene mal armado (una
+sesión o un jugador que no es un objeto, horas que no son números, un id que no
+sirve) es un ERROR con código "formato" y se sigue con lo demás. Los repetidos
+(nombres sin distinguir mayúsculas ni espacios, ids de sesión) se buscan con un
+dict, así que validar es O(n).
+"""
+
+import math
+
+from .registros import Jugador, Problema
+
+ERROR = "error"
+AVISO = "aviso"
+FORMATO = "formato"
+
+
+def hay_errores(problemas):
+    return any(p.nivel == ERROR for p in problemas)
+
+
+def _es_numero(valor):
+    return (
+        isinstance(valor, (int, float))
+        and not isinstance(valor, bool)
+        and math.isfinite(valor)
+    )
+
+
+def validar_jugadores(
+    jugadores, hora_inicio, hora_fin, minimo=0, iniciales=0, sesion=None
+):
+    """
+    Valida los jugadores de una cancha. Los que no tienen nombre se descartan.
+
+    minimo es la cantidad mínima de jugadores con nombre; los primeros `iniciales`
+    tienen que llegar al inicio de la cancha. Las llegadas y salidas fuera del
+    horario se recortan, con un AVISO por cada recorte. sesion (un id) se copia en
+    los problemas.
+
+    Devuelve (validos, problemas): copias de los jugadores con nombre (dicts), ya
+    recortados, y la lista de Problema. Si hay algún ERROR no hay que liquidar.
+    """
+    problemas = []
+    for campo, valor in (("inicio", hora_inicio), ("fin", hora_fin)):
+        if valor is not None and not _es_numero(valor):
+            problemas.append(
+                Problema(
+                    ERROR,
+                    FORMATO,
+                    f"La hora de {campo} de la cancha no es un número ({valor!r}).",
+                    sesion=sesion,
+                )
+            )
+    if problemas:
+        # Sin horario no se pueden revisar los de los jugadores.
+        hora_inicio = hora_fin = None
+    elif hora_inicio is None or hora_fin is None or hora_fin <= hora_inicio:
+        problemas.append(
+            Problema(
+                ERROR,
+                "horario_cancha",
+                "Las horas de inicio y fin deben ser válidas y la de fin mayor a la "
+                "de inicio.",
+                sesion=sesion,
+            )
+        )
+
+    validos = []
+    for posicion, j in enumerate(jugadores, 1):
+        if isinstance(j, dict):
+            datos = dict(j)
+        elif isinstance(j, Jugador):
+            datos = j.a_dict()
+        else:
+            datos = None
+        problema = _formato_jugador(datos, j, posicion, sesion)
+        if problema is not None:
+            problemas.append(problema)
+        elif datos["nombre"]:
+            validos.append(datos)
+    if len(validos) < minimo:
+        problemas.append(
+            Problema(
+                ERROR,
+                "pocos_jugadores",
+                f"Debes ingresar al menos {minimo} jugadores con nombre.",
+                sesion=sesion,
+            )
+        )
+
+    primeros = {}
+    repetidos = {}
+    for j in validos:
+        clave = j["nombre"].strip().lower()
+        if clave in primeros:
+            repetidos.setdefault(clave, primeros[clave])
+        else:
+            primeros[clave] = j["nombre"]
+    for nombre in repetidos.values():
+        problemas.append(
+            Problema(
+                ERROR,
+                "nombre_repetido",
+                f"No se permiten nombres repetidos: {nombre.strip().title()}.",
+                nombre,
+                sesion,
+            )
+        )
+
+    for idx, j in enumerate(validos):
+        problemas += _validar_horario(j, idx < iniciales, hora_inicio, hora_fin, sesion)
+    return validos, problemas
+
+
+def _formato_jugador(datos, original, posicion, sesion):
+    """
+    Un Problema de formato si el jugador no se puede validar, o None.
+    """
+    if datos is None:
+        mensaje = f"El jugador {posicion} no es un objeto ({original!r})."
+        return Problema(ERROR, FORMATO, mensaje, None, sesion)
+    nombre = datos.get("nombre", "")
+    if "nombre" not in datos or not (nombre is None or isinstance(nombre, str)):
+        mensaje = f"El jugador {posicion} no tiene un nombre válido."
+        return Problema(ERROR, FORMATO, mensaje, None, sesion)
+    if not nombre:
+        return None
+    for campo in ("llegada", "salida"):
+        valor = datos.get(campo)
+        if campo not in datos or not (valor is None or _es_numero(valor)):
+            mensaje = f"La {campo} de {nombre} no es un número ({valor!r})."
+            return Problema(ERROR, FORMATO, mensaje, nombre, sesion)
+    return None
+
+
+def _validar_horario(j, es_inicial, hora_inicio, hora_fin, sesion):
+    nombre, llegada, salida = j["nombre"], j["llegada"], j["salida"]
+    if llegada is None or salida is None:
+        return [
+            Problema(
+                ERROR,
+                "hora_invalida",
+                f"Hora de llegada o salida inválida para {nombre} (no se pudo "
+                "parsear).",
+                nombre,
+                sesion,
+            )
+        ]
+    if llegada >= salida:
+        return [
+            Problema(
+                ERROR,
+                "llegada_despues_de_salida",
+                f"La llegada ({llegada}) debe ser menor que la salida ({salida}) "
+                f"para {nombre}.",
+                nombre,
+                sesion,
+            )
+        ]
+    if hora_inicio is None or hora_fin is None or hora_fin <= hora_inicio:
+        return []
+
+    problemas = []
+    if es_inicial and llegada > hora_inicio:
+        problemas.append(
+            Problema(
+                ERROR,
+                "inicial_tarde",
+                f"El jugador inicial {nombre} debe comenzar a las {hora_inicio} "
+                f"(inicio de cancha). Su hora de llegada configurada es {llegada}.",
+                nombre,
+                sesion,
+            )
+        )
+    if llegada < hora_inicio:
+        problemas.append(
+            Problema(
+                AVISO,
+                "llegada_ajustada",
+                f"La llegada de {nombre} ({llegada}) es anterior al inicio de la "
+                f"cancha ({hora_inicio}). Se ajustará a {hora_inicio}.",
+                nombre,
+                sesion,
+            )
+        )
+        j["llegada"] = hora_inicio
+    if salida > hora_fin:
+        problemas.append(
+            Problema(
+                AVISO,
+                "salida_ajustada",
+                f"La salida de {nombre} ({salida}) es posterior al fin de la cancha "
+                f"({hora_fin}). Se ajustará a {hora_fin}.",
+                nombre,
+                sesion,
+            )
+        )
+        j["salida"] = hora_fin
+    if j["llegada"] >= j["salida"]:
+        problemas.append(
+            Problema(
+                ERROR,
+                "fuera_de_horario",
+                f"Tras los ajustes, el horario de {nombre} ({j['llegada']} - "
+                f"{j['salida']}) es inválido (llegada >= salida).",
+                nombre,
+                sesion,
+            )
+        )
+    return problemas
+
+
+def validar_sesiones(sesiones, minimo=0, iniciales=0):
+    """
+    Valida un lote de sesiones (dicts como los de flujo.leer_reservas_csv) de una
+    sola pasada: los jugadores de cada una con validar_jugadores, que tenga monto o
+    tarifa (y fecha, si la tarifa distingue fines de semana), y que no se repitan
+    los ids. Las reservas que ya vienen con "error" (de la
+    lectura) son un ERROR más.
+
+    Devuelve (validas, problemas): las sesiones sin errores, con los jugadores ya
+    recortados (copias), y todos los problemas con el id de su sesión.
+    """
+    validas = []
+    problemas = []
+    ids = set()
+    for numero, sesion in enumerate(sesiones, 1):
+        if not isinstance(sesion, dict):
+            problemas.append(
+                Problema(
+                    ERROR,
+                    FORMATO,
+                    f"La sesión {numero} no es un objeto ({type(sesion).__name__}).",
+                    None,
+                    numero,
+                )
+            )
+            continue
+        id_sesion = sesion.get("id", numero)
+        try:
+            hash(id_sesion)
+        except TypeError:
+            problemas.append(
+                Problema(
+                    ERROR,
+                    FORMATO,
+                    f"El id de la sesión {numero} no sirve ({id_sesion!r}).",
+                    None,
+                    numero,
+                )
+            )
+            continue
+        if "error" in sesion:
+            problemas.append(
+                Problema(ERROR, "lectura", sesion["error"], None, id_sesion)
+            )
+            continue
+
+        propios = []
+        if id_sesion in ids:
+            propios.append(
+                Problema(
+                    ERROR,
+                    "sesion_repetida",
+                    f"La sesión {id_sesion} está repetida.",
+                    None,
+                    id_sesion,
+                )
+            )
+        ids.add(id_sesion)
+        monto_total = sesion.get("monto_total")
+        if monto_total is not None and not _es_numero(monto_total):
+            propios.append(
+                Problema(
+                    ERROR,
+                    FORMATO,
+                    f"El monto total no es un número ({monto_total!r}).",
+                    None,
+                    id_sesion,
+                )
+            )
+        elif monto_total is None and sesion.get("tarifa") is None:
+            propios.append(
+                Problema(
+                    ERROR,
+                    "sin_monto",
+                    "Falta el monto total o la tarifa.",
+                    None,
+                    id_sesion,
+                )
+            )
+        elif monto_total is not None and monto_total < 0:
+            propios.append(
+                Problema(
+                    ERROR,
+                    "monto_negativo",
+                    f"El monto total no puede ser negativo ({monto_total}).",
+                    None,
+                    id_sesion,
+                )
+            )
+        if isinstance(sesion.get("tarifa"), dict) and sesion.get("fecha") is None:
+            propios.append(
+                Problema(
+                    ERROR,
+                    "sin_fecha",
+                    "La tarifa distingue fines de semana y falta la fecha.",
+                    None,
+                    id_sesion,
+                )
+            )
+        jugadores = sesion.get("jugadores", ())
+        if not isinstance(jugadores, (list, tuple)):
+            propios.append(
+                Problema(
+                    ERROR,
+                    FORMATO,
+                    "Los jugadores tienen que ser una lista.",
+                    None,
+                    id_sesion,
+                )
+            )
+            jugadores = ()
+        jugadores, de_jugadores = validar_jugadores(
+            jugadores,
+            sesion.get("hora_inicio"),
+            sesion.get("hora_fin"),
+            minimo,
+            iniciales,
+            id_sesion,
+        )
+        propios += de_jugadores
+        if not hay_errores(propios):
+            validas.append({**sesion, "jugadores": jugadores})
+        problemas += propios
+    return validas, problemas
@@ -0,0 +1,130 @@
+"""
+Piezas de Streamlit que comparten las apps web. Este es el único módulo del paquete
+que importa streamlit; las apps lo importan recién al dibujar la página.
+"""
+
+import os
+
+import streamlit as st
+
+from . import horas, medicion
+from .cache_pagos import CacheLRU
+from .directorio import Directorio
+from .pagos import PAGO_EFECTIVO
+from .tarjetas import html_tarjetas
+
+
+@st.cache_resource
+def cache_de_pagos():
+    """
+    Un único cache de resultados para todas las sesiones del servidor.
+    """
+    return CacheLRU()
+
+
+# Cuántos nombres ofrece como máximo el selectbox de un jugador.
+OPCIONES_NOMBRE = 50
+
+
+@st.cache_resource
+def directorio(ruta, iniciales=()):
+    """
+    El directorio de jugadores guardado en ruta (o uno nuevo con los iniciales), uno
+    solo para todas las sesiones del servidor.
+    """
+    if os.path.exists(ruta):
+        return Directorio.cargar(ruta)
+    return Directorio(iniciales)
+
+
+def opciones_de_nombre(directorio, busqueda="", elegido=""):
+    """
+    Opciones para el selectbox del nombre de un jugador: vacío, el ya elegido (para
+    que no se pierda al cambiar la búsqueda) y los sugeridos para la búsqueda, más la
+    búsqueda misma si es un jugador nuevo. Sin búsqueda, todo el directorio si es
+    chico.
+    """
+    if busqueda.strip():
+        nombres = directorio.sugerir(busqueda, OPCIONES_NOMBRE)
+        if directorio.buscar(busqueda) is None:
+            nombres.append(" ".join(busqueda.split()))
+    elif len(directorio) <= OPCIONES_NOMBRE:
+        nombres = directorio.nombres()
+    else:
+        nombres = []
+    opciones = [""]
+    for nombre in [elegido] + nombres:
+        if nombre and nombre not in opciones:
+            opciones.append(nombre)
+    return opciones
+
+
+def parsear_hora(valor):
+    """
+    Convierte una entrada de hora en formato flexible:
+    - 18      → 18.0
+    - 18.15   → 18.25
+    - 18.30   → 18.5
+    - 18.45   → 18.75
+    - 18.00   → 18.0
+    Si la hora no es válida muestra el error y devuelve None.
+    """
+    if not valor:
+        return None
+    try:
+        return horas.parsear_hora(valor, horas.FORMATO_RELOJ, paso_minutos=15)
+    except ValueError as e:
+        st.error(str(e))
+        return None
+
+
+@medicion.medido("mostrar_pagos_streamlit")
+def mostrar_pagos_streamlit(
+    pagos_detallados,
+    hora_inicio,
+    hora_fin,
+    monto_total,
+    total_efectivo,
+    total_billetera,
+    forma_pago_defecto=PAGO_EFECTIVO,
+):
+    st.subheader("Pagos por jugador")
+    if not pagos_detallados:
+        st.info("Sin jugadores.")
+        return
+
+    # Todas las tarjetas van en un solo mensaje al navegador.
+    st.markdown(
+        html_tarjetas(pagos_detallados, forma_pago_defecto), unsafe_allow_html=True
+    )
+
+    total_horas_cancha = hora_fin - hora_inicio
+    horas = int(total_horas_cancha)
+    minutos = int(round((total_horas_cancha - horas) * 60))
+    suma_total_recaudada = total_efectivo + total_billetera
+    st.markdown(
+        f"<b>Cancha:</b> {horas}h {minutos}m ({total_horas_cancha:.2f}h)<br>"
+        f"<b>Total recaudado:</b> ${suma_total_recaudada:,.2f}",
+        unsafe_allow_html=True,
+    )
+
+    if monto_total is not None and round(suma_total_recaudada, 2) > round(
+        monto_total, 2
+    ):
+        # Todos en efectivo y el total no se forma con billetes: se cobra de más.
+        st.info(f"Vuelto: ${suma_total_recaudada - monto_total:,.2f}")
+    elif monto_total is not None and round(suma_total_recaudada) != round(monto_total):
+        diferencia = monto_total - suma_total_recaudada
+        st.markdown(
+            f"""
+            <div style="background: #fff3cd; border: 1.5px solid #ffe082; border-radius: 8px; padding: 12px; margin: 10px 0; color: #664d03; font-size: 1.05em;">
+                <b>¡Atención!</b> El total recaudado (<b>${suma_total_recaudada:,.2f}</b>) no coincide con el total a pagar ingresado (<b>${monto_total:,.2f}</b>).<br>
+                <b>Diferencia:</b> <span style="color:#d35400;"><b>${diferencia:,.2f}</b></span>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+    if medicion.activa:
+        with st.expander("Tiempos por etapa"):
+            st.json(medicion.resumen())
@@ -0,0 +1,283 @@
+import gc
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional para el resto del proyecto
+    np = None
+
+from split_paddle.flujo import leer_reservas_csv, liquidar_reservas
+from split_paddle.pagos import (
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    calcular_pagos_por_intervalos,
+)
+from split_paddle.registros import a_json
+
+if np is not None:
+    from split_paddle import bitacora as modulo_bitacora
+    from split_paddle.bitacora import (
+        DTYPE_REGISTRO,
+        Bitacora,
+        EscritorBitacora,
+        _principal,
+        convertir_csv,
+    )
+
+CSV = """reserva,hora_inicio,hora_fin,monto_total,nombre,llegada,salida,forma_pago
+1,18,20,900,A,18,20,Efectivo
+1,18,20,900,B,19,20,Billetera
+2,18,19,1000,C,18,19,
+2,18,19,1000,D,18,tarde,
+3,18,19.5,1000,E,18,19.5,
+3,18,19.5,1000,F,18.25,19,
+"""
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestBitacora(unittest.TestCase):
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta = os.path.join(directorio.name, "reservas.bit")
+
+    def test_convertir_y_reproducir_igual_que_el_csv(self):
+        self.assertEqual(convertir_csv(io.StringIO(CSV), self.ruta), (2, 1))
+        self.assertEqual(os.path.getsize(self.ruta), 16 + 6 * DTYPE_REGISTRO.itemsize)
+        esperado = [
+            r
+            for r in liquidar_reservas(leer_reservas_csv(io.StringIO(CSV)))
+            if "error" not in r
+        ]
+        with Bitacora(self.ruta) as bitacora:
+            self.assertEqual(len(bitacora), 2)
+            obtenido = list(bitacora.liquidar())
+        self.assertEqual(
+            json.dumps(obtenido, default=a_json), json.dumps(esperado, default=a_json)
+        )
+        salida = self.ruta + ".jsonl"
+        self.assertEqual(_principal(["reproducir", self.ruta, "--salida", salida]), 0)
+        with open(salida, encoding="utf-8") as archivo:
+            self.assertEqual(
+                [json.loads(linea) for linea in archivo],
+                json.loads(json.dumps(esperado, default=a_json)),
+            )
+
+    def test_liquidar_de_a_bloques_igual_que_de_a_una(self):
+        rng = random.Random(11)
+        with EscritorBitacora(self.ruta) as escritor:
+            for i in range(60):
+                inicio = rng.choice([17, 18, 18.25])
+                jugadores = [
+                    {
+                        "nombre": rng.choice([f"J{k}", ""]),
+                        "llegada": inicio + rng.randint(-2, 8) * 0.25,
+                        "salida": inicio + rng.randint(1, 10) * 0.25,
+                        "forma_pago": rng.choice([None, PAGO_EFECTIVO, PAGO_BILLETERA]),
+                    }
+                    for k in range(rng.randint(0, 6))
+                ]
+                escritor.agregar(
+                    {
+                        "id": f"r{i}",
+                        "hora_inicio": inicio,
+                        "hora_fin": inicio + rng.choice([1, 1.5, 2]),
+                        "monto_total": rng.choice([10000, 12345.5, 9050]),
+                        "jugadores": jugadores,
+                    }
+                )
+        # La última sesión queda a medias.
+        escritor = EscritorBitacora(self.ruta)
+        escritor.agregar(_sesion("X", 18, 20) | {"id": "cortada"})
+        escritor.cerrar()
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(os.path.getsize(self.ruta) - DTYPE_REGISTRO.itemsize)
+
+        with Bitacora(self.ruta) as bitacora:
+            esperado = json.dumps(
+                list(liquidar_reservas(bitacora.sesiones())), default=a_json
+            )
+            for bloque in (1, 2, 5, 64, len(bitacora.registros)):
+                with mock.patch.object(
+                    modulo_bitacora,
+                    "calcular_pagos_en_lote",
+                    wraps=modulo_bitacora.calcular_pagos_en_lote,
+                ) as calcular:
+                    obtenido = json.dumps(
+                        list(bitacora.liquidar(bloque)), default=a_json
+                    )
+                self.assertEqual(obtenido, esperado, bloque)
+                self.assertLessEqual(
+                    calcular.call_count, -(-len(bitacora.registros) // bloque)
+                )
+            with self.assertRaises(ValueError):
+                next(bitacora.liquidar(0))
+        self.assertIn('"vuelto"', esperado)
+        self.assertIn("incompleta", esperado)
+
+    def test_sesiones_de_a_bloques(self):
+        rng = random.Random(5)
+        with EscritorBitacora(self.ruta) as escritor:
+            for i in range(30):
+                sesion = _sesion(f"J{i}", 18, 20)
+                sesion["jugadores"] *= rng.randint(0, 4)
+                escritor.agregar(sesion)
+        with Bitacora(self.ruta) as bitacora:
+            esperado = list(bitacora.sesiones())
+            for bloque in (1, 2, 3, 7, len(bitacora.registros)):
+                self.assertEqual(list(bitacora.sesiones(bloque)), esperado, bloque)
+            with self.assertRaises(ValueError):
+                next(bitacora.sesiones(0))
+        self.assertEqual(len(esperado), 30)
+        self.assertNotIn("error", {k for s in esperado for k in s})
+
+    def test_lee_sin_copiar(self):
+        convertir_csv(io.StringIO(CSV), self.ruta)
+        bitacora = Bitacora(self.ruta)
+        self.assertFalse(bitacora.registros.flags.owndata)
+        self.assertFalse(bitacora.registros.flags.writeable)
+        bitacora.cerrar()
+
+    def test_agrega_al_final(self):
+        with EscritorBitacora(self.ruta) as escritor:
+            self.assertEqual(escritor.agregar(_sesion("X", 18, 19)), 0)
+        with EscritorBitacora(self.ruta) as escritor:
+            self.assertEqual(escritor.agregar(_sesion("Y", 20, 21)), 2)
+        with Bitacora(self.ruta) as bitacora:
+            ids = [s["jugadores"][0]["nombre"] for s in bitacora.sesiones()]
+        self.assertEqual(ids, ["X", "Y"])
+
+    def test_ignora_un_registro_cortado(self):
+        with EscritorBitacora(self.ruta) as escritor:
+            escritor.agregar(_sesion("X", 18, 19))
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(b"\x00" * 10)
+        with Bitacora(self.ruta) as bitacora:
+            self.assertEqual(len(bitacora.registros), 2)
+        with EscritorBitacora(self.ruta) as escritor:
+            escritor.agregar(_sesion("Y", 20, 21))
+        with Bitacora(self.ruta) as bitacora:
+            nombres = [j["nombre"] for s in bitacora.sesiones() for j in s["jugadores"]]
+        self.assertEqual(nombres, ["X", "Y"])
+
+    def test_avisa_una_sesion_cortada(self):
+        sesion = _sesion("A", 18, 20)
+        sesion["id"] = "r1"
+        sesion["jugadores"] += [
+            {"nombre": nombre, "llegada": 18, "salida": 20} for nombre in "BCD"
+        ]
+        with EscritorBitacora(self.ruta) as escritor:
+            escritor.agregar(_sesion("X", 18, 19))
+            escritor.agregar(sesion)
+        # Se corta a mitad del registro del tercer jugador de r1.
+        tamano = 16 + DTYPE_REGISTRO.itemsize * 5 + 20
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(tamano)
+        with EscritorBitacora(self.ruta) as escritor:
+            self.assertEqual(escritor.agregar(_sesion("Y", 20, 21)), 5)
+        with Bitacora(self.ruta) as bitacora:
+            sesiones = list(bitacora.sesiones())
+            jugadores, _, _ = bitacora.liquidar_en_lote()
+            nombres = jugadores["nombre"].tolist()
+            del jugadores
+        self.assertEqual(len(sesiones), 3)
+        self.assertEqual(sesiones[1]["id"], "r1")
+        self.assertIn("2 de sus 4 jugadores", sesiones[1]["error"])
+        self.assertEqual(
+            [s["jugadores"][0]["nombre"] for s in sesiones[::2]], ["X", "Y"]
+        )
+        self.assertEqual(nombres, [b"X", b"Y"])
+
+    def test_lee_la_version_1_sin_contar_jugadores(self):
+        with EscritorBitacora(self.ruta) as escritor:
+            escritor.agregar(_sesion("X", 18, 19))
+        with open(self.ruta, "r+b") as archivo:
+            archivo.seek(8)
+            archivo.write((1).to_bytes(4, "little"))
+            # En la versión 1 la cantidad de jugadores era relleno.
+            archivo.seek(16 + 2)
+            archivo.write(bytes(2))
+        with Bitacora(self.ruta) as bitacora:
+            sesiones = list(bitacora.sesiones())
+        self.assertEqual(sesiones[0]["jugadores"][0]["nombre"], "X")
+
+    def test_rechaza_nombres_largos_sin_escribir(self):
+        with EscritorBitacora(self.ruta) as escritor:
+            with self.assertRaises(ValueError):
+                escritor.agregar(_sesion("Un nombre demasiado largo", 18, 19))
+        self.assertEqual(os.path.getsize(self.ruta), 16)
+
+    def test_rechaza_archivos_ajenos(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"reserva,hora_inicio\n")
+        with self.assertRaises(ValueError):
+            Bitacora(self.ruta)
+
+    def test_no_deja_abierto_un_archivo_ajeno(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"reserva,hora_inicio,hora_fin\n")
+        with warnings.catch_warnings(record=True) as avisos:
+            warnings.simplefilter("always", ResourceWarning)
+            try:
+                EscritorBitacora(self.ruta)
+            except ValueError:
+                pass
+            else:
+                self.fail("Aceptó un archivo que no es una bitácora.")
+            gc.collect()
+        self.assertEqual([a for a in avisos if a.category is ResourceWarning], [])
+
+    def test_liquidar_en_lote_coincide_con_la_funcion_escalar(self):
+        rng = random.Random(3)
+        sesiones = []
+        with EscritorBitacora(self.ruta) as escritor:
+            for _ in range(200):
+                inicio = rng.choice([17, 18, 18.25, 19])
+                fin = inicio + rng.choice([1, 1.5, 2])
+                jugadores = []
+                for i in range(rng.randint(1, 10)):
+                    llegada = inicio + rng.randint(-2, 8) * 0.25
+                    salida = llegada + rng.randint(-1, 8) * 0.25
+                    jugadores.append(
+                        {"nombre": f"J{i}", "llegada": llegada, "salida": salida}
+                    )
+                sesion = {
+                    "hora_inicio": inicio,
+                    "hora_fin": fin,
+                    "monto_total": rng.choice([10000, 12345.5]),
+                    "jugadores": jugadores,
+                }
+                escritor.agregar(sesion)
+                sesiones.append(sesion)
+        with Bitacora(self.ruta) as bitacora:
+            jugadores, pagos, tiempos = bitacora.liquidar_en_lote()
+            self.assertEqual(len(jugadores), sum(len(s["jugadores"]) for s in sesiones))
+            del jugadores
+        esperado = [
+            (p["pago"], p["tiempo"])
+            for s in sesiones
+            for p in calcular_pagos_por_intervalos(
+                s["jugadores"], s["monto_total"], s["hora_inicio"], s["hora_fin"]
+            )[1]
+        ]
+        self.assertEqual(list(zip(pagos.tolist(), tiempos.tolist())), esperado)
+
+
+def _sesion(nombre, inicio, fin):
+    return {
+        "hora_inicio": inicio,
+        "hora_fin": fin,
+        "monto_total": 1000,
+        "jugadores": [{"nombre": nombre, "llegada": inicio, "salida": fin}],
+    }
+
+
+if __name__ == "__main__":
+    unittest.main()
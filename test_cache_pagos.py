@@ -0,0 +1,75 @@
+import unittest
+
+from split_paddle.cache_pagos import CacheLRU, clave_sesion, liquidar_con_cache
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+
+
+def jugadores():
+    return [
+        {"nombre": "Dario", "llegada": 18, "salida": 20, "forma_pago": PAGO_EFECTIVO},
+        {"nombre": "Hugo", "llegada": 18, "salida": 19.5, "forma_pago": PAGO_BILLETERA},
+        {"nombre": "Yel", "llegada": 18.5, "salida": 20, "forma_pago": PAGO_BILLETERA},
+    ]
+
+
+class TestCacheLRU(unittest.TestCase):
+    def test_desaloja_lo_menos_usado(self):
+        cache = CacheLRU(capacidad=2)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        self.assertEqual(cache.obtener("a"), 1)
+        cache.guardar("c", 3)
+        self.assertIsNone(cache.obtener("b"))
+        self.assertEqual(cache.obtener("c"), 3)
+        self.assertEqual(
+            cache.estadisticas(),
+            {"tamano": 2, "capacidad": 2, "aciertos": 2, "fallos": 1, "desalojos": 1},
+        )
+
+    def test_capacidad_invalida(self):
+        with self.assertRaises(ValueError):
+            CacheLRU(capacidad=0)
+
+
+class TestLiquidarConCache(unittest.TestCase):
+    def test_clave_no_depende_del_orden(self):
+        a = clave_sesion(jugadores(), 10000, 18, 20)
+        b = clave_sesion(list(reversed(jugadores())), 10000.0, 18.0, 20)
+        self.assertEqual(a, b)
+        cambiado = jugadores()
+        cambiado[0]["forma_pago"] = PAGO_BILLETERA
+        self.assertNotEqual(a, clave_sesion(cambiado, 10000, 18, 20))
+
+    def test_reutiliza_y_respeta_el_orden_pedido(self):
+        cache = CacheLRU()
+        primero = liquidar_con_cache(cache, jugadores(), 10000, 18, 20)
+        invertidos = list(reversed(jugadores()))
+        segundo = liquidar_con_cache(cache, invertidos, 10000, 18, 20)
+        self.assertEqual(cache.aciertos, 1)
+        self.assertEqual(cache.fallos, 1)
+        self.assertEqual([p.nombre for p in segundo[1]], ["Yel", "Hugo", "Dario"])
+        self.assertEqual(list(reversed(segundo[1])), primero[1])
+        self.assertEqual(sum(p.pago for p in primero[0]), 10000)
+        self.assertEqual(primero[1][0].pago % 100, 0)
+
+    def test_devuelve_copias(self):
+        cache = CacheLRU()
+        _, detalle, _ = liquidar_con_cache(cache, jugadores(), 10000, 18, 20)
+        detalle[0]["pago"] = -1
+        _, otra_vez, _ = liquidar_con_cache(cache, jugadores(), 10000, 18, 20)
+        self.assertNotEqual(otra_vez[0]["pago"], -1)
+
+    def test_guarda_el_vuelto(self):
+        cache = CacheLRU()
+        en_efectivo = jugadores()
+        for jugador in en_efectivo:
+            jugador["forma_pago"] = PAGO_EFECTIVO
+        for _ in range(2):
+            _, detalle, vuelto = liquidar_con_cache(cache, en_efectivo, 10050, 18, 20)
+            self.assertEqual(vuelto, 50)
+            self.assertEqual(sum(p.pago for p in detalle), 10100)
+        self.assertEqual(cache.aciertos, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
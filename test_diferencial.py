@@ -0,0 +1,338 @@
+"""
+Pruebas diferenciales: sesiones al azar (tramos superpuestos, de largo cero, fuera
+del horario de la cancha, justo en los bordes, sin horario y sin nombre) contra un
+cálculo de referencia con fracciones exactas, invariantes de la regla de reparto y
+cada camino rápido comparado con pagos.calcular_pagos_por_intervalos.
+
+La cantidad de casos se cambia con SPLIT_PADDLE_CASOS (por defecto 1000 por prueba)
+y la semilla con SPLIT_PADDLE_SEMILLA.
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from fractions import Fraction
+from math import isclose
+
+from split_paddle.cache_pagos import CacheLRU, liquidar_con_cache
+from split_paddle.incremental import LiquidacionIncremental
+from split_paddle.jornada import liquidar_jornada
+from split_paddle.pagos import (
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    calcular_pagos_por_intervalos,
+)
+from split_paddle.paralelo import liquidar_sesion
+from split_paddle.registros import a_json
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional para el resto del proyecto
+    np = None
+
+if np is not None:
+    from split_paddle.bitacora import Bitacora, EscritorBitacora
+    from split_paddle.lote import calcular_pagos_en_lote, liquidar_sesiones_en_lote
+
+CASOS = int(os.environ.get("SPLIT_PADDLE_CASOS", 1000))
+SEMILLA = int(os.environ.get("SPLIT_PADDLE_SEMILLA", 20))
+
+
+def generar_sesion(rng, con_huecos=True):
+    """
+    Una sesión en cuartos de hora (números exactos en binario). Con con_huecos hay
+    jugadores sin nombre y sin horario.
+    """
+    inicio = rng.choice([17, 17.5, 18, 18.25, 19])
+    fin = inicio + rng.choice([0.25, 1, 1.5, 2, 3])
+    jugadores = []
+    for i in range(rng.randint(1, 12)):
+        tipo = rng.random()
+        if tipo < 0.15:
+            llegada, salida = inicio, fin  # justo en los bordes
+        elif tipo < 0.25:
+            llegada = salida = inicio + rng.randint(0, 12) * 0.25  # largo cero
+        elif tipo < 0.35:
+            llegada, salida = inicio - rng.randint(1, 4) * 0.25, fin + 0.5  # afuera
+        else:
+            llegada = inicio + rng.randint(-2, 12) * 0.25
+            salida = llegada + rng.randint(-1, 12) * 0.25
+        jugador = {"nombre": f"J{i}", "llegada": llegada, "salida": salida}
+        if con_huecos and rng.random() < 0.05:
+            jugador["llegada"] = jugador["salida"] = None
+        if con_huecos and rng.random() < 0.05:
+            jugador["nombre"] = ""
+        if rng.random() < 0.5:
+            jugador["forma_pago"] = rng.choice([PAGO_EFECTIVO, PAGO_BILLETERA])
+        jugadores.append(jugador)
+    jugadores[0]["nombre"] = jugadores[0]["nombre"] or "J0"
+    return {
+        "hora_inicio": inicio,
+        "hora_fin": fin,
+        "monto_total": rng.choice([10000, 12345, 999, 7, 15000.5]),
+        "jugadores": jugadores,
+    }
+
+
+def sesiones(cantidad=CASOS, con_huecos=True, semilla=SEMILLA):
+    rng = random.Random(semilla)
+    return [generar_sesion(rng, con_huecos) for _ in range(cantidad)]
+
+
+def recortar(jugador, inicio, fin):
+    if jugador["llegada"] is None or jugador["salida"] is None:
+        return None
+    llegada = min(max(jugador["llegada"], inicio), fin)
+    return llegada, min(max(jugador["salida"], llegada), fin)
+
+
+def referencia(sesion):
+    """
+    Pagos exactos por fuerza bruta con fracciones: cada tramo entre dos cortes se
+    reparte entre los presentes. Devuelve {nombre: Fraction}.
+    """
+    inicio, fin = sesion["hora_inicio"], sesion["hora_fin"]
+    horarios = {
+        j["nombre"]: recortar(j, inicio, fin)
+        for j in sesion["jugadores"]
+        if j["nombre"]
+    }
+    cortes = sorted({t for h in horarios.values() if h for t in h})
+    costo_por_hora = Fraction(sesion["monto_total"]) / Fraction(fin - inicio)
+    pagos = dict.fromkeys(horarios, Fraction(0))
+    for a, b in zip(cortes, cortes[1:]):
+        presentes = [n for n, h in horarios.items() if h and h[0] <= a and b <= h[1]]
+        for nombre in presentes:
+            pagos[nombre] += costo_por_hora * Fraction(b - a) / len(presentes)
+    return pagos
+
+
+def exactos(sesion):
+    _, detallados = calcular_pagos_por_intervalos(
+        sesion["jugadores"],
+        sesion["monto_total"],
+        sesion["hora_inicio"],
+        sesion["hora_fin"],
+    )
+    return detallados
+
+
+def como_json(resultado):
+    return json.dumps(resultado, default=a_json)
+
+
+class TestReferencia(unittest.TestCase):
+    def test_coincide_con_la_fuerza_bruta(self):
+        for sesion in sesiones():
+            esperado = referencia(sesion)
+            margen = 1e-9 * sesion["monto_total"]
+            for pago in exactos(sesion):
+                self.assertTrue(
+                    isclose(pago.pago, esperado[pago.nombre], abs_tol=margen),
+                    (sesion, pago),
+                )
+
+
+class TestInvariantes(unittest.TestCase):
+    def test_redondeados_suman_el_total(self):
+        for sesion in sesiones():
+            redondeados, _ = calcular_pagos_por_intervalos(
+                sesion["jugadores"],
+                sesion["monto_total"],
+                sesion["hora_inicio"],
+                sesion["hora_fin"],
+            )
+            self.assertEqual(
+                sum(p.pago for p in redondeados), round(sesion["monto_total"])
+            )
+            self.assertTrue(all(p.pago >= 0 for p in redondeados))
+
+    def test_exactos_suman_lo_que_estuvo_ocupado(self):
+        for sesion in sesiones():
+            inicio, fin = sesion["hora_inicio"], sesion["hora_fin"]
+            tramos = sorted(
+                h
+                for j in sesion["jugadores"]
+                if j["nombre"]
+                for h in [recortar(j, inicio, fin)]
+                if h
+            )
+            ocupado, hasta = 0, inicio
+            for a, b in tramos:
+                ocupado += max(0, b - max(a, hasta))
+                hasta = max(hasta, b)
+            esperado = sesion["monto_total"] * ocupado / (fin - inicio)
+            detallados = exactos(sesion)
+            self.assertAlmostEqual(sum(p.pago for p in detallados), esperado, places=6)
+            for pago, jugador in zip(
+                detallados, [j for j in sesion["jugadores"] if j["nombre"]]
+            ):
+                horario = recortar(jugador, inicio, fin)
+                self.assertEqual(
+                    pago.tiempo, 0 if horario is None else horario[1] - horario[0]
+                )
+
+    def test_quien_juega_mas_no_paga_menos(self):
+        for sesion in sesiones(con_huecos=False):
+            inicio, fin = sesion["hora_inicio"], sesion["hora_fin"]
+            redondeados, detallados = calcular_pagos_por_intervalos(
+                sesion["jugadores"], sesion["monto_total"], inicio, fin
+            )
+            horarios = [recortar(j, inicio, fin) for j in sesion["jugadores"]]
+            for a, (ha, ra, da) in enumerate(zip(horarios, redondeados, detallados)):
+                for hb, rb, db in zip(
+                    horarios[a + 1 :], redondeados[a + 1 :], detallados[a + 1 :]
+                ):
+                    for (h1, r1, d1), (h2, r2, d2) in (
+                        ((ha, ra, da), (hb, rb, db)),
+                        ((hb, rb, db), (ha, ra, da)),
+                    ):
+                        if h2[0] <= h1[0] and h1[1] <= h2[1]:
+                            self.assertLessEqual(d1.pago, d2.pago + 1e-9)
+                            # El resto mayor desempata por orden: a lo sumo un peso.
+                            self.assertLessEqual(r1.pago, r2.pago + 1)
+
+    def test_quedarse_mas_nunca_baja_el_pago(self):
+        rng = random.Random(SEMILLA + 1)
+        for sesion in sesiones(con_huecos=False):
+            idx = rng.randrange(len(sesion["jugadores"]))
+            antes = exactos(sesion)[idx].pago
+            jugadores = [dict(j) for j in sesion["jugadores"]]
+            jugadores[idx]["salida"] += rng.choice([0.25, 0.5, 2])
+            despues = exactos(dict(sesion, jugadores=jugadores))[idx].pago
+            self.assertGreaterEqual(despues, antes - 1e-9)
+
+    def test_el_orden_de_los_jugadores_no_cambia_los_exactos(self):
+        rng = random.Random(SEMILLA + 2)
+        for sesion in sesiones():
+            jugadores = list(sesion["jugadores"])
+            rng.shuffle(jugadores)
+            antes = {p.nombre: p.pago for p in exactos(sesion)}
+            despues = {
+                p.nombre: p.pago for p in exactos(dict(sesion, jugadores=jugadores))
+            }
+            self.assertEqual(antes.keys(), despues.keys())
+            for nombre, pago in antes.items():
+                self.assertAlmostEqual(pago, despues[nombre], places=6)
+
+
+class TestCaminosRapidos(unittest.TestCase):
+    @unittest.skipIf(np is None, "numpy no está instalado")
+    def test_lote_igual_a_liquidar_de_a_una(self):
+        casos = sesiones()
+        esperado = [liquidar_sesion(s) for s in casos]
+        self.assertEqual(
+            como_json(liquidar_sesiones_en_lote(casos)), como_json(esperado)
+        )
+
+    @unittest.skipIf(np is None, "numpy no está instalado")
+    def test_calcular_en_lote_bit_a_bit(self):
+        casos = sesiones(con_huecos=False)
+        jugador_sesion, llegadas, salidas, esperado = [], [], [], []
+        for idx, s in enumerate(casos):
+            for j in s["jugadores"]:
+                jugador_sesion.append(idx)
+                llegadas.append(j["llegada"])
+                salidas.append(j["salida"])
+            esperado += [(p.pago, p.tiempo) for p in exactos(s)]
+        pagos, tiempos = calcular_pagos_en_lote(
+            list(range(len(casos))),
+            [s["hora_inicio"] for s in casos],
+            [s["hora_fin"] for s in casos],
+            [s["monto_total"] for s in casos],
+            jugador_sesion,
+            llegadas,
+            salidas,
+        )
+        self.assertEqual(list(zip(pagos.tolist(), tiempos.tolist())), esperado)
+
+    @unittest.skipIf(np is None, "numpy no está instalado")
+    def test_bitacora_ida_y_vuelta(self):
+        casos = sesiones(con_huecos=False)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "casos.bit")
+            with EscritorBitacora(ruta) as escritor:
+                for s in casos:
+                    escritor.agregar(s)
+            with Bitacora(ruta) as bitacora:
+                _, pagos, _ = bitacora.liquidar_en_lote()
+                leidas = list(bitacora.sesiones())
+        self.assertEqual(pagos.tolist(), [p.pago for s in casos for p in exactos(s)])
+        # La bitácora guarda todo en float64: los valores son iguales aunque un 2
+        # vuelva como 2.0, así que se compara por valor y no el JSON.
+        self.assertEqual(
+            [liquidar_sesion(s) for s in leidas], [liquidar_sesion(s) for s in casos]
+        )
+
+    def test_incremental(self):
+        rng = random.Random(SEMILLA + 3)
+        for sesion in sesiones():
+            args = (sesion["monto_total"], sesion["hora_inicio"], sesion["hora_fin"])
+            liquidacion = LiquidacionIncremental(sesion["jugadores"], *args)
+            self.assertTrue(liquidacion.verificar(), sesion)
+            nombres = [
+                j["nombre"]
+                for j in sesion["jugadores"]
+                if j["nombre"] and j["llegada"] is not None
+            ]
+            if nombres:
+                nombre = rng.choice(nombres)
+                llegada = sesion["hora_inicio"] + rng.randint(-2, 8) * 0.25
+                liquidacion.modificar(
+                    nombre, llegada, llegada + rng.randint(0, 8) * 0.25
+                )
+                self.assertTrue(liquidacion.verificar(), sesion)
+                if len(liquidacion.resultado()[0]) > 1:
+                    liquidacion.quitar(nombre)
+                    self.assertTrue(liquidacion.verificar(), sesion)
+
+    def test_cache_igual_en_cualquier_orden(self):
+        rng = random.Random(SEMILLA + 4)
+        cache = CacheLRU(capacidad=64)
+        for sesion in sesiones(con_huecos=False):
+            args = (sesion["monto_total"], sesion["hora_inicio"], sesion["hora_fin"])
+            ordenada = dict(
+                sesion, jugadores=sorted(sesion["jugadores"], key=lambda j: j["nombre"])
+            )
+            mezclados = list(sesion["jugadores"])
+            rng.shuffle(mezclados)
+            esperado = {p.nombre: p for p in liquidar_sesion(ordenada)[1]}
+            for jugadores in (sesion["jugadores"], mezclados):
+                _, detallados, _ = liquidar_con_cache(cache, jugadores, *args)
+                self.assertEqual(
+                    [p.nombre for p in detallados], [j["nombre"] for j in jugadores]
+                )
+                for p in detallados:
+                    self.assertEqual(p, esperado[p.nombre])
+
+    def test_tarifa_plana_igual_que_sin_tarifa(self):
+        for sesion in sesiones():
+            args = (
+                sesion["jugadores"],
+                sesion["monto_total"],
+                sesion["hora_inicio"],
+                sesion["hora_fin"],
+            )
+            self.assertEqual(
+                calcular_pagos_por_intervalos(*args, [(0, 1)]),
+                calcular_pagos_por_intervalos(*args),
+            )
+
+    def test_jornada_de_una_cancha(self):
+        for sesion in sesiones(cantidad=CASOS // 4):
+            cancha = {k: sesion[k] for k in ("hora_inicio", "hora_fin", "monto_total")}
+            tramos = [dict(j, cancha=1) for j in sesion["jugadores"]]
+            redondeados, detallados, _ = liquidar_jornada({1: cancha}, tramos)
+            esperado = liquidar_sesion(sesion)
+            self.assertEqual(
+                [(p.nombre, p.pago) for p in redondeados],
+                [(p.nombre, p.pago) for p in esperado[0]],
+            )
+            for a, b in zip(detallados, esperado[1]):
+                self.assertAlmostEqual(a.pago, b.pago, places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
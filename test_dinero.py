@@ -0,0 +1,140 @@
+import itertools
+import random
+import unittest
+
+from split_paddle.dinero import (
+    a_centavos,
+    liquidar_en_centavos,
+    pesos_por_tramo,
+    redondear_efectivo,
+    repartir_proporcional,
+)
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO, ajustar_pagos_y_redondear
+
+
+class TestRepartirProporcional(unittest.TestCase):
+    def test_resto_mayor(self):
+        self.assertEqual(repartir_proporcional(10, [1, 1, 1]), [4, 3, 3])
+        self.assertEqual(repartir_proporcional(100, [1, 2, 3]), [17, 33, 50])
+        self.assertEqual(repartir_proporcional(7, [5, 0, 5]), [4, 0, 3])
+
+    def test_pesos_en_cero_reparte_igual(self):
+        self.assertEqual(repartir_proporcional(5, [0, 0]), [3, 2])
+
+    def test_sin_pesos(self):
+        self.assertEqual(repartir_proporcional(0, []), [])
+        with self.assertRaises(ValueError):
+            repartir_proporcional(1, [])
+
+    def test_suma_siempre_exacta(self):
+        for total in range(0, 200, 7):
+            for pesos in ([3, 7, 11], [1] * 13, [0, 5, 1000, 2]):
+                self.assertEqual(sum(repartir_proporcional(total, pesos)), total)
+
+
+class TestPesosPorTramo(unittest.TestCase):
+    def test_intervalos_compartidos(self):
+        # 0-60 A solo, 60-120 A y B, 120-150 A, B y C.
+        pesos = pesos_por_tramo([(0, 150), (60, 150), (120, 150)])
+        self.assertEqual(pesos, [60 * 6 + 60 * 3 + 30 * 2, 60 * 3 + 30 * 2, 30 * 2])
+
+    def test_tramo_vacio(self):
+        self.assertEqual(pesos_por_tramo([(0, 60), (30, 30)]), [60, 0])
+
+    def test_liquidar_en_centavos(self):
+        centavos = liquidar_en_centavos([(0, 120), (60, 120)], a_centavos(900))
+        self.assertEqual(centavos, [67500, 22500])
+        centavos = liquidar_en_centavos([(0, 60)] * 3, 100)
+        self.assertEqual(centavos, [34, 33, 33])
+
+
+class TestAjustarPagosYRedondear(unittest.TestCase):
+    def pagos(self):
+        return [
+            {"nombre": "A", "pago": 3333.3333, "tiempo": 2},
+            {"nombre": "B", "pago": 3333.3333, "tiempo": 2},
+            {"nombre": "C", "pago": 3333.3333, "tiempo": 2},
+        ]
+
+    def test_efectivo_baja_a_cien_y_billetera_completa(self):
+        pagos = self.pagos()
+        formas = {"A": PAGO_EFECTIVO, "B": PAGO_BILLETERA, "C": PAGO_BILLETERA}
+        ajustar_pagos_y_redondear(pagos, formas, 10000)
+        self.assertEqual(pagos[0]["pago"], 3300)
+        self.assertEqual([p["pago"] for p in pagos[1:]], [3350.0, 3350.0])
+        self.assertEqual(a_centavos(sum(p["pago"] for p in pagos)), 1000000)
+
+    def test_sin_billetera_se_cobra_el_total(self):
+        pagos = self.pagos()
+        vuelto = ajustar_pagos_y_redondear(pagos, {}, 10000)
+        self.assertEqual([p["pago"] for p in pagos], [3400, 3300, 3300])
+        self.assertEqual(vuelto, 0)
+        self.assertEqual(pagos[0]["forma_pago"], PAGO_EFECTIVO)
+
+    def test_sin_billetera_con_vuelto(self):
+        pagos = self.pagos()
+        vuelto = ajustar_pagos_y_redondear(pagos, {}, 10000, denominacion=1000)
+        self.assertEqual([p["pago"] for p in pagos], [4000, 3000, 3000])
+        self.assertEqual(vuelto, 0)
+        pagos = [{"nombre": n, "pago": 150, "tiempo": 1} for n in "ABC"]
+        self.assertEqual(ajustar_pagos_y_redondear(pagos, {}, 450), 50)
+        self.assertEqual([p["pago"] for p in pagos], [200, 200, 100])
+
+    def test_denominacion(self):
+        pagos = self.pagos()
+        formas = {"A": PAGO_EFECTIVO, "B": PAGO_EFECTIVO, "C": PAGO_BILLETERA}
+        ajustar_pagos_y_redondear(pagos, formas, 10000, denominacion=500)
+        self.assertEqual([p["pago"] for p in pagos], [3500, 3000, 3500.0])
+
+
+def desvio_maximo(centavos, pagados):
+    return max((abs(p - c) for p, c in zip(pagados, centavos)), default=0)
+
+
+class TestRedondearEfectivo(unittest.TestCase):
+    def test_sube_al_de_resto_mas_grande(self):
+        pagos, vuelto = redondear_efectivo([33334, 33333, 33333], [1, 1, 0], 10000)
+        self.assertEqual((pagos, vuelto), ([40000, 30000, 30000], 0))
+
+    def test_billetera_no_paga_negativo(self):
+        pagos, vuelto = redondear_efectivo([9000, 100], [True, False], 10000)
+        self.assertEqual((pagos, vuelto), ([0, 9100], 0))
+
+    def test_igual_que_probar_todas_las_combinaciones(self):
+        rng = random.Random(3)
+        for _ in range(400):
+            n = rng.randint(1, 7)
+            denominacion = rng.choice([100, 1000, 10000])
+            centavos = [rng.randint(0, 50000) for _ in range(n)]
+            es_efectivo = [rng.random() < 0.6 for _ in range(n)]
+            pagos, vuelto = redondear_efectivo(centavos, es_efectivo, denominacion)
+            efectivo = [i for i in range(n) if es_efectivo[i]]
+            billetera = [i for i in range(n) if not es_efectivo[i] and centavos[i]]
+            for i in efectivo:
+                self.assertEqual(pagos[i] % denominacion, 0)
+                self.assertLess(abs(pagos[i] - centavos[i]), denominacion)
+            self.assertTrue(all(p >= 0 for p in pagos))
+            self.assertEqual(sum(pagos), sum(centavos) + vuelto)
+            if not billetera:
+                self.assertLess(vuelto, denominacion)
+                continue
+            self.assertEqual(vuelto, 0)
+            mejor = None
+            for subir in itertools.product([0, 1], repeat=len(efectivo)):
+                prueba = list(centavos)
+                for i, arriba in zip(efectivo, subir):
+                    prueba[i] += (denominacion if arriba else 0) - (
+                        centavos[i] % denominacion
+                    )
+                diferencia = sum(centavos) - sum(prueba)
+                extras = repartir_proporcional(diferencia, [1] * len(billetera))
+                for i, extra in zip(billetera, extras):
+                    prueba[i] += extra
+                if min(prueba) >= 0:
+                    desvio = desvio_maximo(centavos, prueba)
+                    mejor = desvio if mejor is None else min(mejor, desvio)
+            self.assertEqual(desvio_maximo(centavos, pagos), mejor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from itertools import product
+from math import prod
+
+from split_paddle.cli import pedir_nombre
+from split_paddle import directorio as modulo_directorio
+from split_paddle.directorio import Directorio, _mejores_combinaciones, normalizar
+
+NOMBRES = [
+    "José Pérez",
+    "Josefina Gómez",
+    "Martín Pérez González",
+    "María Martínez",
+    "Hugo Díaz",
+]
+
+
+class TestDirectorio(unittest.TestCase):
+    def setUp(self):
+        self.directorio = Directorio(NOMBRES)
+
+    def test_normalizar(self):
+        self.assertEqual(normalizar("  José   PÉREZ "), "jose perez")
+        self.assertEqual(normalizar("Ñandú"), "nandu")
+
+    def test_sin_repetidos(self):
+        self.assertFalse(self.directorio.modificado)
+        self.assertEqual(self.directorio.agregar("jose  perez"), "José Pérez")
+        self.assertFalse(self.directorio.modificado)
+        self.assertEqual(self.directorio.agregar(" Ana  Ruiz "), "Ana Ruiz")
+        self.assertTrue(self.directorio.modificado)
+        self.assertEqual(len(self.directorio), 6)
+        self.assertIn("ANA RUIZ", self.directorio)
+        self.assertEqual(self.directorio.buscar("hugo diaz"), "Hugo Díaz")
+        self.assertIsNone(self.directorio.buscar("Hugo"))
+        with self.assertRaises(ValueError):
+            self.directorio.agregar("   ")
+
+    def test_nombres_en_orden(self):
+        self.directorio.agregar("Ana Ruiz")
+        self.assertEqual(
+            self.directorio.nombres(),
+            ["Ana Ruiz", "Hugo Díaz", "José Pérez", "Josefina Gómez"]
+            + ["María Martínez", "Martín Pérez González"],
+        )
+
+    def test_con_prefijo(self):
+        self.assertEqual(
+            self.directorio.con_prefijo("jos"), ["José Pérez", "Josefina Gómez"]
+        )
+        # También desde el apellido, y cada jugador una sola vez
+        self.assertEqual(
+            self.directorio.con_prefijo("PER"), ["José Pérez", "Martín Pérez González"]
+        )
+        self.assertEqual(self.directorio.con_prefijo("jose p"), ["José Pérez"])
+        self.assertEqual(
+            self.directorio.con_prefijo("mar", limite=1), ["María Martínez"]
+        )
+        self.assertEqual(self.directorio.con_prefijo(""), [])
+        # Lo agregado después también se encuentra
+        self.directorio.agregar("Pedro Sosa")
+        self.assertEqual(
+            self.directorio.con_prefijo("pe"),
+            ["Pedro Sosa", "José Pérez", "Martín Pérez González"],
+        )
+
+    def test_parecidos_con_errores_de_tipeo(self):
+        self.assertEqual(self.directorio.parecidos("mrtin")[0], "Martín Pérez González")
+        # Tienen que estar todas las palabras (o una parecida)
+        self.assertEqual(self.directorio.parecidos("Jose Peres"), ["José Pérez"])
+        self.assertEqual(
+            self.directorio.parecidos("Peres"), ["José Pérez", "Martín Pérez González"]
+        )
+        self.assertEqual(
+            self.directorio.parecidos("gonzales peres"), ["Martín Pérez González"]
+        )
+        self.assertEqual(self.directorio.parecidos("xqzw"), [])
+
+    def test_consulta_larga_no_explota(self):
+        # Cada palabra de la consulta tiene tres parecidas: antes se probaban las
+        # 3 ** 14 combinaciones.
+        bases = [f"{a}{b}{c}" for a, b, c in product("bcdfg", "aeiou", "lmnrs")]
+        directorio = Directorio(
+            " ".join(f"{base}{fin}" for base in bases[i : i + 3] for fin in "sz")
+            for i in range(0, len(bases) - 3)
+        )
+        consulta = " ".join(bases[:14])
+        with unittest.mock.patch.object(
+            directorio,
+            "_palabras_parecidas",
+            wraps=directorio._palabras_parecidas,
+        ) as parecidas:
+            inicio = time.perf_counter()
+            directorio.parecidos(consulta)
+            segundos = time.perf_counter() - inicio
+        self.assertEqual(parecidas.call_count, modulo_directorio.PALABRAS_CONSULTA)
+        self.assertLess(segundos, 0.5)
+
+    def test_mejores_combinaciones_igual_que_probar_todas(self):
+        rng = random.Random(3)
+        for _ in range(50):
+            opciones = [
+                sorted(
+                    ((rng.randint(1, 10) / 10, f"p{i}{j}") for j in range(3)),
+                    key=lambda o: (-o[0], o[1]),
+                )
+                for i in range(rng.randint(1, 4))
+            ]
+            todas = sorted(prod(d for d, _ in c) for c in product(*opciones))[::-1]
+            mejores = list(_mejores_combinaciones(opciones, 5))
+            self.assertEqual(
+                [prod(d for d, _ in c) for c in mejores], todas[: len(mejores)]
+            )
+            self.assertEqual(len(mejores), min(5, len(todas)))
+
+    def test_sugerir(self):
+        self.assertEqual(self.directorio.sugerir("hugo diaz"), ["Hugo Díaz"])
+        self.assertEqual(
+            self.directorio.sugerir("jos", limite=2), ["José Pérez", "Josefina Gómez"]
+        )
+        self.assertEqual(self.directorio.sugerir("Hgo Dias")[0], "Hugo Díaz")
+
+    def test_igual_que_de_a_uno(self):
+        de_a_uno = Directorio()
+        for nombre in NOMBRES:
+            de_a_uno.agregar(nombre)
+        for texto in ["p", "ma", "jose", "peres", "diaz hugo"]:
+            self.assertEqual(
+                de_a_uno.sugerir(texto), self.directorio.sugerir(texto), texto
+            )
+
+    def test_las_busquedas_esperan_a_agregar(self):
+        # Mientras otro hilo tiene el lock (como agregar a mitad de un insort), las
+        # búsquedas no recorren los índices.
+        resultados = {}
+        busquedas = {
+            "buscar": lambda: self.directorio.buscar("hugo diaz"),
+            "nombres": self.directorio.nombres,
+            "con_prefijo": lambda: self.directorio.con_prefijo("jos"),
+            "parecidos": lambda: self.directorio.parecidos("Jose Peres"),
+            "sugerir": lambda: self.directorio.sugerir("Hgo Dias"),
+        }
+        hilos = [
+            threading.Thread(target=lambda n=n, f=f: resultados.update({n: f()}))
+            for n, f in busquedas.items()
+        ]
+        with self.directorio._lock:
+            for hilo in hilos:
+                hilo.start()
+            time.sleep(0.05)
+            self.assertEqual(resultados, {})
+        for hilo in hilos:
+            hilo.join(5)
+        self.assertEqual(set(resultados), set(busquedas))
+        self.assertEqual(resultados["sugerir"][0], "Hugo Díaz")
+
+    def test_guardar_y_cargar(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, "jugadores.txt")
+            self.directorio.agregar("Ana Ruiz")
+            self.directorio.guardar(ruta)
+            self.assertFalse(self.directorio.modificado)
+            cargado = Directorio.cargar(ruta)
+            self.assertEqual(os.listdir(carpeta), ["jugadores.txt"])
+        self.assertEqual(cargado.nombres(), self.directorio.nombres())
+        self.assertFalse(cargado.modificado)
+
+
+class TestPedirNombre(unittest.TestCase):
+    def pedir(self, entradas, usados=(), directorio=None, vacio=False):
+        with unittest.mock.patch(
+            "builtins.input", side_effect=entradas
+        ), unittest.mock.patch("builtins.print"):
+            return pedir_nombre("Nombre: ", set(usados), directorio, vacio)
+
+    def test_sin_directorio(self):
+        self.assertEqual(self.pedir(["", "José", "Ana"], {"jose"}), "Ana")
+        self.assertEqual(self.pedir([""], vacio=True), "")
+
+    def test_con_directorio(self):
+        directorio = Directorio(NOMBRES)
+        # Escrito igual que en el directorio (salvo tildes): sin preguntar
+        self.assertEqual(
+            self.pedir(["jose perez"], directorio=directorio), "José Pérez"
+        )
+        # Con un error de tipeo se elige entre los sugeridos
+        self.assertEqual(
+            self.pedir(["martin peres", "1"], directorio=directorio),
+            "Martín Pérez González",
+        )
+        # Un jugador nuevo queda en el directorio
+        self.assertEqual(self.pedir(["Ana Ruiz"], directorio=directorio), "Ana Ruiz")
+        self.assertIn("ana ruiz", directorio)
+        self.assertEqual(
+            self.pedir(["jose perez", "Josefina", "1"], {"jose perez"}, directorio),
+            "Josefina Gómez",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import random
+import unittest
+
+from split_paddle.en_vivo import ENTRADA, SALIDA, CuentaEnVivo, Tablero
+from split_paddle.pagos import calcular_pagos_por_intervalos
+
+
+class TestCuentaEnVivo(unittest.TestCase):
+    def test_cuenta_mientras_juegan(self):
+        cuenta = CuentaEnVivo(18, 20, 900)  # 450 por hora
+        cuenta.entrar("A", 18)
+        self.assertEqual(cuenta.foto(19), {"A": 450})
+        cuenta.entrar("B", 19)
+        self.assertEqual(cuenta.foto(19.5), {"A": 562.5, "B": 112.5})
+        cuenta.salir("A", 19.5)
+        self.assertEqual(cuenta.foto(), {"A": 562.5, "B": 112.5})
+        self.assertEqual(cuenta.en_cancha(), ["B"])
+        cuenta.cerrar()
+        self.assertEqual(cuenta.foto(), {"A": 562.5, "B": 337.5})
+        self.assertTrue(cuenta.verificar())
+
+    def test_tarifa_y_reentrada(self):
+        cuenta = CuentaEnVivo(18, 21, tarifa=[(0, 8000), (19, 12000)])
+        cuenta.entrar("A", 18.5)
+        cuenta.salir("A", 19.5)
+        cuenta.entrar("A", 20)
+        cuenta.cerrar()
+        self.assertEqual(cuenta.foto(), {"A": 4000 + 6000 + 12000})
+        self.assertEqual([p.pago for p in cuenta.resultado()[1]], [10000, 12000])
+        self.assertTrue(cuenta.verificar())
+
+    def test_eventos_invalidos_no_cambian_nada(self):
+        cuenta = CuentaEnVivo(18, 20, 900)
+        cuenta.entrar("A", 19)
+        for evento in [
+            (ENTRADA, "A", 19.5),
+            (SALIDA, "B", 19.5),
+            (SALIDA, "A", 18.5),
+            ("pasó", "A", 19.5),
+            (ENTRADA, "", 19.5),
+        ]:
+            with self.assertRaises(ValueError):
+                cuenta.registrar(*evento)
+        self.assertEqual(cuenta.eventos, 1)
+        self.assertEqual(cuenta.foto(), {"A": 0})
+        with self.assertRaises(ValueError):
+            cuenta.resultado()
+
+    def test_igual_que_calcular_pagos_por_intervalos(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            jugadores = []
+            for i in range(rng.randint(1, 10)):
+                llegada = rng.randint(68, 88) / 4
+                jugadores.append(
+                    {
+                        "nombre": f"J{i}",
+                        "llegada": llegada,
+                        "salida": llegada + rng.randint(0, 12) / 4,
+                    }
+                )
+            monto = rng.randint(1000, 30000)
+            eventos = sorted(
+                [(j["llegada"], 0, j["nombre"]) for j in jugadores]
+                + [(j["salida"], 1, j["nombre"]) for j in jugadores]
+            )
+            cuenta = CuentaEnVivo(18, 21, monto)
+            for hora, tipo, nombre in eventos:
+                cuenta.registrar(ENTRADA if tipo == 0 else SALIDA, nombre, hora)
+            cuenta.cerrar()
+            _, esperados = calcular_pagos_por_intervalos(jugadores, monto, 18, 21)
+            foto = cuenta.foto()
+            for pago in esperados:
+                self.assertAlmostEqual(foto[pago.nombre], pago.pago, places=6)
+            self.assertTrue(cuenta.verificar())
+
+
+class TestTablero(unittest.IsolatedAsyncioTestCase):
+    async def test_consume_la_cola_y_rechaza_lo_raro(self):
+        tablero = Tablero(CuentaEnVivo(18, 20, 900))
+        tarea = asyncio.create_task(tablero.correr())
+        tablero.publicar(ENTRADA, "A", 18)
+        tablero.publicar(ENTRADA, "A", 18)  # doble lectura del molinete
+        tablero.publicar(ENTRADA, "B", 19)
+        await asyncio.sleep(0)
+        self.assertEqual(tablero.foto(19.5), {"A": 562.5, "B": 112.5})
+        tablero.publicar(SALIDA, "A", 19.5)
+        tablero.terminar()
+        redondeados, _ = await tarea
+        self.assertEqual(tablero.rechazados, 1)
+        self.assertEqual([p.pago for p in redondeados], [563, 337])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import itertools
+import json
+import unittest
+
+from split_paddle.flujo import (
+    escribir_resultados_jsonl,
+    leer_reservas_csv,
+    leer_reservas_jsonl,
+    liquidar_reservas,
+)
+
+CSV = """reserva,hora_inicio,hora_fin,monto_total,nombre,llegada,salida,forma_pago
+1,18,20,900,A,18,20,Efectivo
+1,18,20,900,B,19,20,Billetera
+2,18,19,1000,C,18,19,
+2,18,19,1000,D,18,tarde,
+3,18,19,1000,E,18,19,
+"""
+
+
+class TestFlujo(unittest.TestCase):
+    def test_csv_agrupa_filas_consecutivas(self):
+        reservas = list(leer_reservas_csv(io.StringIO(CSV)))
+        self.assertEqual([r["id"] for r in reservas], ["1", "2", "3"])
+        self.assertEqual(len(reservas[0]["jugadores"]), 2)
+        self.assertEqual(reservas[0]["jugadores"][1]["forma_pago"], "Billetera")
+        self.assertIn("error", reservas[1])
+        self.assertNotIn("forma_pago", reservas[2]["jugadores"][0])
+
+    def test_csv_sin_columnas(self):
+        with self.assertRaises(ValueError):
+            list(leer_reservas_csv(io.StringIO("reserva,nombre\n1,A\n")))
+
+    def test_liquida_y_escribe_jsonl(self):
+        salida = io.StringIO()
+        resultados = liquidar_reservas(leer_reservas_csv(io.StringIO(CSV)))
+        self.assertEqual(escribir_resultados_jsonl(resultados, salida), (2, 1))
+        lineas = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        self.assertEqual([p["pago"] for p in lineas[0]["pagos"]], [675, 225])
+        self.assertEqual(lineas[2]["pagos"][0]["pago"], 1000)
+
+    def test_todos_en_efectivo_informa_el_vuelto(self):
+        entrada = io.StringIO(
+            '{"id": 1, "hora_inicio": 18, "hora_fin": 19, "monto_total": 1050,'
+            ' "jugadores": [{"nombre": "A", "llegada": 18, "salida": 19,'
+            ' "forma_pago": "Efectivo"}, {"nombre": "B", "llegada": 18,'
+            ' "salida": 19, "forma_pago": "Efectivo"}]}\n'
+        )
+        (resultado,) = liquidar_reservas(leer_reservas_jsonl(entrada))
+        cobrado = sum(p.pago for p in resultado["detalle"])
+        self.assertEqual(cobrado, 1100)
+        self.assertEqual(resultado["vuelto"], 50)
+        # Si el efectivo cierra justo no hay vuelto.
+        resultados = list(liquidar_reservas(leer_reservas_csv(io.StringIO(CSV))))
+        self.assertNotIn("vuelto", resultados[0])
+
+    def test_avisa_cada_reserva_liquidada_con_su_fecha(self):
+        csv_con_fecha = CSV.replace(",forma_pago\n", ",forma_pago,fecha\n", 1).replace(
+            "1,18,20,900,A,18,20,Efectivo", "1,18,20,900,A,18,20,Efectivo,2026-10-01"
+        )
+        liquidadas = []
+        resultados = list(
+            liquidar_reservas(
+                leer_reservas_csv(io.StringIO(csv_con_fecha)),
+                lambda reserva, redondeados, _: liquidadas.append(
+                    (reserva["id"], reserva.get("fecha"), redondeados)
+                ),
+            )
+        )
+        self.assertEqual(len(resultados), 3)
+        self.assertEqual(
+            [(i, f) for i, f, _ in liquidadas], [("1", "2026-10-01"), ("3", None)]
+        )
+        self.assertEqual(liquidadas[0][2], resultados[0]["pagos"])
+
+    def test_jsonl_linea_invalida_no_corta_el_flujo(self):
+        entrada = io.StringIO(
+            '{"id": 1, "hora_inicio": 18, "hora_fin": 19, "monto_total": 100,'
+            ' "jugadores": [{"nombre": "A", "llegada": 18, "salida": 19}]}\n'
+            "\n"
+            "{roto\n"
+            '{"id": 3, "hora_inicio": 18}\n'
+        )
+        resultados = list(liquidar_reservas(leer_reservas_jsonl(entrada)))
+        self.assertEqual(resultados[0]["pagos"][0]["pago"], 100)
+        self.assertIn("error", resultados[1])
+        self.assertEqual(resultados[2]["id"], 3)
+        self.assertIn("error", resultados[2])
+
+    def test_jsonl_que_no_es_un_objeto_no_corta_el_flujo(self):
+        entrada = io.StringIO(
+            'null\n[1, 2]\n"texto"\n7\n'
+            '{"id": 5, "hora_inicio": 18, "hora_fin": 19, "monto_total": 100,'
+            ' "jugadores": [{"nombre": "A", "llegada": 18, "salida": 19}]}\n'
+        )
+        resultados = list(liquidar_reservas(leer_reservas_jsonl(entrada)))
+        self.assertEqual(
+            [r["id"] for r in resultados],
+            ["linea 1", "linea 2", "linea 3", "linea 4", 5],
+        )
+        for resultado in resultados[:4]:
+            self.assertIn("Se espera un objeto JSON", resultado["error"])
+        self.assertEqual(resultados[4]["pagos"][0]["pago"], 100)
+
+    def test_procesa_sin_leer_toda_la_entrada(self):
+        # Una entrada sin fin: si algo la cargara entera el test no terminaría.
+        linea = (
+            '{"hora_inicio": 18, "hora_fin": 19, "monto_total": 100,'
+            ' "jugadores": [{"nombre": "A", "llegada": 18, "salida": 19}]}\n'
+        )
+        resultados = liquidar_reservas(leer_reservas_jsonl(itertools.repeat(linea)))
+        self.assertEqual(len(list(itertools.islice(resultados, 1000))), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import contextlib
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from split_paddle.cli import ejecutar
+from split_paddle.historial import Historial
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+from split_paddle.paralelo import liquidar_sesion
+
+
+def sesion(fecha, monto=900, forma_pago=True):
+    jugadores = [
+        {"nombre": "Dario", "llegada": 18, "salida": 20},
+        {"nombre": "Beto", "llegada": 19, "salida": 20},
+    ]
+    if forma_pago:
+        jugadores[0]["forma_pago"] = PAGO_BILLETERA
+        jugadores[1]["forma_pago"] = PAGO_EFECTIVO
+    return {
+        "id": f"r-{fecha}",
+        "fecha": fecha,
+        "hora_inicio": 18,
+        "hora_fin": 20,
+        "monto_total": monto,
+        "jugadores": jugadores,
+    }
+
+
+class TestHistorial(unittest.TestCase):
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta = os.path.join(directorio.name, "historial.db")
+        self.historial = Historial(self.ruta, tamano_lote=3)
+        self.addCleanup(lambda: self.historial.cerrar())
+
+    def guardar(self, s):
+        return self.historial.guardar(s, *liquidar_sesion(s)[:2])
+
+    def test_total_del_mes_por_jugador(self):
+        for fecha in ["2026-09-30", "2026-10-01", "2026-10-15", "2026-11-01"]:
+            self.guardar(sesion(fecha, forma_pago=False))
+        self.assertEqual(self.historial.total_del_mes("Dario", 2026, 10), 1350)
+        # El nombre no distingue mayúsculas.
+        self.assertEqual(self.historial.total_del_mes("DARIO", 2026, 10), 1350)
+        self.assertEqual(self.historial.total_del_mes("Beto", 2026, 12), 0)
+        self.assertEqual(
+            self.historial.total_de(
+                "Beto", datetime.date(2026, 9, 1), datetime.date(2026, 12, 31)
+            ),
+            900,
+        )
+
+    def test_guarda_pagos_forma_de_pago_e_intervalos(self):
+        s = sesion("2026-10-01")
+        redondeados, detallados, _ = liquidar_sesion(s)
+        self.historial.guardar(s, redondeados, detallados)
+        (sesion_id,) = self.historial.confirmar()
+        (guardada,) = self.historial.sesiones_del_dia(datetime.date(2026, 10, 1))
+        self.assertEqual(guardada["id"], sesion_id)
+        self.assertEqual(guardada["reserva"], "r-2026-10-01")
+        self.assertEqual(
+            [
+                (p["nombre"], p["pago"], p["pago_redondeado"], p["forma_pago"])
+                for p in guardada["pagos"]
+            ],
+            [
+                (d.nombre, d.pago, r.pago, d.forma_pago)
+                for r, d in zip(redondeados, detallados)
+            ],
+        )
+        self.assertEqual(
+            guardada["intervalos"],
+            [
+                {"inicio": 18, "fin": 19, "jugadores": ("Dario",)},
+                {"inicio": 19, "fin": 20, "jugadores": ("Dario", "Beto")},
+            ],
+        )
+
+    def test_escribe_por_lotes_y_las_consultas_ven_lo_pendiente(self):
+        otra = Historial(self.ruta)
+        self.addCleanup(otra.cerrar)
+        self.guardar(sesion("2026-10-01"))
+        self.guardar(sesion("2026-10-02"))
+        # Todavía no se grabó: otra conexión no lo ve, pero la propia sí.
+        self.assertEqual(otra.pagos_de("Dario"), [])
+        self.assertEqual(len(self.historial.pagos_de("Dario")), 2)
+        self.guardar(sesion("2026-10-03"))
+        self.guardar(sesion("2026-10-04"))
+        self.assertEqual(len(otra.pagos_de("Dario")), 2)
+        self.historial.confirmar()
+        self.assertEqual(
+            [p["fecha"] for p in otra.pagos_de("Dario", desde="2026-10-02")],
+            ["2026-10-02", "2026-10-03", "2026-10-04"],
+        )
+
+    def test_usa_wal_e_indices(self):
+        conexion = self.historial._conexion
+        self.assertEqual(conexion.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        plan = conexion.execute(
+            "EXPLAIN QUERY PLAN SELECT SUM(centavos) FROM pagos "
+            "WHERE nombre = 'Dario' AND fecha BETWEEN '2026-10-01' AND '2026-10-31'"
+        ).fetchall()
+        self.assertIn("pagos_nombre_fecha", plan[0][3])
+
+    def test_reabrir_sigue_numerando(self):
+        self.guardar(sesion("2026-10-01"))
+        (primera,) = self.historial.confirmar()
+        self.historial.cerrar()
+        self.historial = Historial(self.ruta)
+        self.guardar(sesion("2026-10-02"))
+        self.assertEqual(self.historial.confirmar(), [primera + 1])
+
+    def test_dos_escritores_en_la_misma_base(self):
+        # Como la consola y la página a la vez: los dos se abren antes de escribir.
+        otra = Historial(self.ruta)
+        self.addCleanup(otra.cerrar)
+        self.guardar(sesion("2026-10-01"))
+        otra.guardar(sesion("2026-10-02"), *liquidar_sesion(sesion("2026-10-02"))[:2])
+        self.assertEqual(otra.confirmar(), [1])
+        self.guardar(sesion("2026-10-03"))
+        self.assertEqual(self.historial.confirmar(), [2, 3])
+        self.assertEqual(
+            [
+                (p["fecha"], p["sesion_id"])
+                for p in self.historial.pagos_de("Beto", desde="2026-10-01")
+            ],
+            [("2026-10-01", 2), ("2026-10-02", 1), ("2026-10-03", 3)],
+        )
+
+    def test_fecha_por_defecto_es_hoy(self):
+        s = sesion("2026-10-01")
+        del s["fecha"]
+        self.guardar(s)
+        self.assertEqual(len(self.historial.sesiones_del_dia(datetime.date.today())), 1)
+
+    def test_sesion_con_tarifa_sin_monto(self):
+        s = sesion("2026-10-01", forma_pago=False)
+        del s["monto_total"]
+        s["tarifa"] = [(0, 8000), (19, 12000)]
+        self.guardar(s)
+        (guardada,) = self.historial.sesiones_del_dia("2026-10-01")
+        self.assertEqual(guardada["monto_total"], 20000)
+        self.assertEqual(self.historial.total_del_mes("Beto", 2026, 10), 6000)
+
+    def test_consola_con_tarifa_y_monto_null(self):
+        s = sesion("2026-10-01", forma_pago=False)
+        s["monto_total"] = None
+        s["tarifa"] = [[0, 8000], [19, 12000]]
+        entrada = io.StringIO(json.dumps(s) + "\n")
+        ruta = os.path.join(os.path.dirname(self.ruta), "consola.db")
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+            io.StringIO()
+        ):
+            with unittest.mock.patch("sys.stdin", entrada):
+                with self.assertRaises(SystemExit) as salida:
+                    ejecutar(
+                        ["--entrada", "-", "--formato", "jsonl", "--historial", ruta]
+                    )
+        self.assertEqual(salida.exception.code, 0)
+        with Historial(ruta) as historial:
+            (guardada,) = historial.sesiones_del_dia("2026-10-01")
+            self.assertEqual(guardada["monto_total"], 20000)
+            self.assertEqual(historial.total_del_mes("Beto", 2026, 10), 6000)
+
+
+if __name__ == "__main__":
+    unittest.main()
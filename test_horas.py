@@ -0,0 +1,58 @@
+import unittest
+
+from split_paddle.horas import FORMATO_DECIMAL, FORMATO_RELOJ, parsear_hora
+
+
+class TestParsearHora(unittest.TestCase):
+    def test_formato_reloj(self):
+        self.assertEqual(parsear_hora("18"), 18.0)
+        self.assertEqual(parsear_hora("18.00"), 18.0)
+        self.assertEqual(parsear_hora(" 18.15 "), 18.25)
+        self.assertEqual(parsear_hora("18.30"), 18.5)
+        self.assertEqual(parsear_hora("09.45"), 9.75)
+        self.assertEqual(parsear_hora("24"), 24.0)
+
+    def test_formato_reloj_rechaza_minutos_fuera_del_paso(self):
+        for valor in ("18.10", "18.3", "18.60", "24.15", "25", "18.", ""):
+            with self.assertRaises(ValueError):
+                parsear_hora(valor)
+
+    def test_paso_de_cinco_minutos(self):
+        self.assertAlmostEqual(parsear_hora("18.05", paso_minutos=5), 18 + 5 / 60)
+        self.assertAlmostEqual(parsear_hora("18.55", paso_minutos=5), 18 + 55 / 60)
+        with self.assertRaises(ValueError):
+            parsear_hora("18.07", paso_minutos=5)
+
+    def test_formato_decimal(self):
+        self.assertEqual(parsear_hora("18", FORMATO_DECIMAL), 18.0)
+        self.assertEqual(parsear_hora("18.25", FORMATO_DECIMAL), 18.25)
+        self.assertEqual(parsear_hora("18.5", FORMATO_DECIMAL), 18.5)
+        self.assertEqual(parsear_hora("18.50", FORMATO_DECIMAL), 18.5)
+        self.assertEqual(parsear_hora("18.75", FORMATO_DECIMAL), 18.75)
+        for valor in ("18.15", "18.3", "18.05"):
+            with self.assertRaises(ValueError):
+                parsear_hora(valor, FORMATO_DECIMAL)
+
+    def test_numeros_van_directo(self):
+        self.assertEqual(parsear_hora(18), 18.0)
+        self.assertEqual(parsear_hora(18.4, FORMATO_RELOJ), 18.4)
+        with self.assertRaises(ValueError):
+            parsear_hora(-1)
+        with self.assertRaises(ValueError):
+            parsear_hora(None)
+        with self.assertRaises(ValueError):
+            parsear_hora(True)
+
+    def test_mensajes(self):
+        with self.assertRaisesRegex(ValueError, "punto"):
+            parsear_hora("18:30")
+        with self.assertRaisesRegex(ValueError, "18.15"):
+            parsear_hora("18.20")
+        with self.assertRaisesRegex(ValueError, "desconocido"):
+            parsear_hora("18", formato="otro")
+        with self.assertRaisesRegex(ValueError, "dividir"):
+            parsear_hora("18", paso_minutos=7)
+
+
+if __name__ == "__main__":
+    unittest.main()
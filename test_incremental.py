@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from split_paddle.incremental import LiquidacionIncremental
+from split_paddle.pagos import calcular_pagos_por_intervalos
+
+
+def jugadores_base():
+    return [
+        {"nombre": "A", "llegada": 18, "salida": 20},
+        {"nombre": "B", "llegada": 18, "salida": 20},
+        {"nombre": "C", "llegada": 18, "salida": 19},
+        {"nombre": "D", "llegada": 18, "salida": 20},
+    ]
+
+
+class TestLiquidacionIncremental(unittest.TestCase):
+    def test_igual_al_calculo_completo(self):
+        liquidacion = LiquidacionIncremental(jugadores_base(), 10000, 18, 20)
+        self.assertEqual(
+            liquidacion.resultado()[0],
+            calcular_pagos_por_intervalos(jugadores_base(), 10000, 18, 20)[0],
+        )
+        self.assertTrue(liquidacion.verificar())
+
+    def test_agregar_modificar_quitar(self):
+        liquidacion = LiquidacionIncremental(jugadores_base(), 10000, 18, 20)
+        liquidacion.agregar({"nombre": "E", "llegada": 19, "salida": 20})
+        self.assertAlmostEqual(liquidacion.pago("E"), 5000 / 4)
+        liquidacion.modificar("C", salida=20)
+        self.assertAlmostEqual(liquidacion.pago("C"), 1250 + 1000)
+        liquidacion.quitar("E")
+        self.assertAlmostEqual(liquidacion.pago("C"), 2500)
+        self.assertTrue(liquidacion.verificar())
+        self.assertEqual(liquidacion._cortes, [18, 20])
+
+    def test_renombrar_y_repetidos(self):
+        liquidacion = LiquidacionIncremental(jugadores_base(), 10000, 18, 20)
+        liquidacion.renombrar("C", "Claudio")
+        self.assertEqual(
+            [p.nombre for p in liquidacion.resultado()[1]], ["A", "B", "Claudio", "D"]
+        )
+        with self.assertRaises(ValueError):
+            liquidacion.agregar({"nombre": "A", "llegada": 18, "salida": 19})
+        with self.assertRaises(ValueError):
+            liquidacion.renombrar("A", "B")
+        self.assertTrue(liquidacion.verificar())
+
+    def test_operaciones_al_azar(self):
+        rng = random.Random(3)
+        liquidacion = LiquidacionIncremental([], 12345, 17, 22)
+        nombres = []
+        for paso in range(2000):
+            accion = rng.random()
+            llegada = 16.5 + rng.randint(0, 24) * 0.25
+            salida = llegada + rng.randint(-2, 12) * 0.25
+            if accion < 0.4 or len(nombres) < 3:
+                nombre = f"J{paso}"
+                nombres.append(nombre)
+                liquidacion.agregar(
+                    {"nombre": nombre, "llegada": llegada, "salida": salida}
+                )
+            elif accion < 0.6:
+                liquidacion.quitar(nombres.pop(rng.randrange(len(nombres))))
+            else:
+                liquidacion.modificar(rng.choice(nombres), llegada, salida)
+            if paso % 100 == 0:
+                self.assertTrue(liquidacion.verificar())
+        self.assertTrue(liquidacion.verificar())
+
+    def test_jugador_sin_horario(self):
+        jugadores = jugadores_base() + [{"nombre": "E", "llegada": None, "salida": 19}]
+        liquidacion = LiquidacionIncremental(jugadores, 10000, 18, 20)
+        self.assertEqual(liquidacion.pago("E"), 0)
+        liquidacion.modificar("E", llegada=18.5)
+        self.assertGreater(liquidacion.pago("E"), 0)
+        self.assertTrue(liquidacion.verificar())
+
+
+if __name__ == "__main__":
+    unittest.main()
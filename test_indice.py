@@ -0,0 +1,143 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional para el resto del proyecto
+    np = None
+
+from split_paddle.flujo import leer_reservas_csv
+from split_paddle.historial import Historial
+from split_paddle.paralelo import liquidar_sesion
+
+if np is not None:
+    from split_paddle.indice import IndiceTramos, desde_historial, desde_reservas
+
+CSV = """reserva,hora_inicio,hora_fin,monto_total,nombre,llegada,salida,fecha,cancha
+1,19,21,900,Ana,19,20,2026-10-13,3
+1,19,21,900,Beto,19.25,21,2026-10-13,3
+2,19,21,900,Caro,19.5,20.5,2026-10-13,1
+3,19,21,900,Dani,19,21,2026-10-14,3
+4,19,21,900,Eli,19,21,,3
+"""
+
+
+def nombres(tramos):
+    return [t.nombre for t in tramos]
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestIndiceTramos(unittest.TestCase):
+    def setUp(self):
+        self.indice, self.con_error = desde_reservas(
+            leer_reservas_csv(io.StringIO(CSV))
+        )
+
+    def test_en_cancha(self):
+        self.assertEqual(self.con_error, 1)  # la reserva sin fecha
+        self.assertEqual(
+            nombres(self.indice.en_cancha("2026-10-13", 19.5, 3)), ["Ana", "Beto"]
+        )
+        self.assertEqual(nombres(self.indice.en_cancha("2026-10-13", 20, 3)), ["Beto"])
+        self.assertEqual(
+            nombres(self.indice.en_cancha("2026-10-13", 19.5)), ["Caro", "Ana", "Beto"]
+        )
+        self.assertEqual(self.indice.en_cancha("2026-10-13", 19.5, 7), [])
+        tramo = self.indice.en_cancha("2026-10-14", 20)[0]
+        self.assertEqual(
+            tramo.a_dict(),
+            {
+                "nombre": "Dani",
+                "fecha": "2026-10-14",
+                "llegada": 19.0,
+                "salida": 21.0,
+                "cancha": "3",
+                "sesion": "3",
+            },
+        )
+
+    def test_entre(self):
+        self.assertEqual(
+            nombres(self.indice.entre("2026-10-13", 20.25, 20.75, 3)), ["Beto"]
+        )
+        # Los extremos no cuentan: Ana se fue a las 20 y Caro llegó a las 19.5.
+        self.assertEqual(
+            nombres(self.indice.entre("2026-10-13", 20, 20.25, 3)), ["Beto"]
+        )
+        self.assertEqual(
+            nombres(self.indice.entre("2026-10-13", 18, 19.5)), ["Ana", "Beto"]
+        )
+        with self.assertRaises(ValueError):
+            self.indice.entre("2026-10-13", 20, 20)
+
+    def test_guardar_y_cargar(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "tramos.npz")
+            self.indice.guardar(ruta)
+            cargado = IndiceTramos.cargar(ruta)
+        self.assertEqual(len(cargado), 4)
+        self.assertEqual(
+            cargado.entre("2026-10-13", 19, 21), self.indice.entre("2026-10-13", 19, 21)
+        )
+
+    def test_desde_historial(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            with Historial(os.path.join(directorio, "h.db")) as historial:
+                for reserva in leer_reservas_csv(io.StringIO(CSV)):
+                    historial.guardar(
+                        reserva, *liquidar_sesion(reserva)[:2], "2026-10-13"
+                    )
+                indice = desde_historial(historial, "2026-10-13", "2026-10-13")
+        self.assertEqual(
+            nombres(indice.en_cancha("2026-10-13", 19.75)),
+            ["Ana", "Dani", "Eli", "Beto", "Caro"],
+        )
+        self.assertIsNone(indice.en_cancha("2026-10-13", 19.75)[0].cancha)
+
+    def test_igual_que_recorrer_todos(self):
+        rng = random.Random(11)
+        tramos = []
+        for i in range(2000):
+            llegada = rng.randint(64, 92) / 4
+            tramos.append(
+                (
+                    f"2026-10-{rng.randint(1, 5):02d}",
+                    rng.choice(["1", "2", None]),
+                    str(i),
+                    f"J{rng.randint(0, 40)}",
+                    llegada,
+                    llegada + rng.randint(0, 10) / 4,
+                )
+            )
+        indice = IndiceTramos.construir(tramos)
+        for _ in range(300):
+            fecha = f"2026-10-{rng.randint(1, 5):02d}"
+            cancha = rng.choice(["1", "2", None])
+            desde = rng.randint(60, 100) / 4
+            hasta = desde + rng.randint(1, 8) / 4
+
+            def esperado(choca):
+                return sorted(
+                    t[2]
+                    for t in tramos
+                    if t[0] == fecha
+                    and (cancha is None or t[1] == cancha)
+                    and t[5] > t[4]
+                    and choca(t[4], t[5])
+                )
+
+            self.assertEqual(
+                sorted(t.sesion for t in indice.en_cancha(fecha, desde, cancha)),
+                esperado(lambda llegada, salida: llegada <= desde < salida),
+            )
+            self.assertEqual(
+                sorted(t.sesion for t in indice.entre(fecha, desde, hasta, cancha)),
+                esperado(lambda llegada, salida: llegada < hasta and salida > desde),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
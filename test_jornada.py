@@ -0,0 +1,108 @@
+import unittest
+
+from split_paddle.jornada import liquidar_jornada
+from split_paddle.pagos import (
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    calcular_pagos_por_intervalos,
+)
+
+CANCHAS = {
+    1: {"hora_inicio": 18, "hora_fin": 20, "monto_total": 10000},
+    2: {"hora_inicio": 19, "hora_fin": 21, "monto_total": 8001},
+}
+
+
+class TestJornada(unittest.TestCase):
+    def test_una_cancha_igual_que_el_calculo_de_siempre(self):
+        jugadores = [
+            {"nombre": "A", "llegada": 18, "salida": 20},
+            {"nombre": "B", "llegada": 18.5, "salida": 19.75},
+            {"nombre": "C", "llegada": 17, "salida": 20},
+        ]
+        tramos = [dict(j, cancha=1) for j in jugadores]
+        redondeados, detallados, _ = liquidar_jornada({1: CANCHAS[1]}, tramos)
+        esperado = calcular_pagos_por_intervalos(jugadores, 10000, 18, 20)
+        self.assertEqual((redondeados, detallados), esperado)
+
+    def test_suma_los_tramos_de_cada_jugador(self):
+        tramos = [
+            {"nombre": "A", "cancha": 1, "llegada": 18, "salida": 19},
+            {"nombre": "A", "cancha": 2, "llegada": 19, "salida": 21},
+            {"nombre": "B", "cancha": 1, "llegada": 18, "salida": 20},
+            {"nombre": "C", "cancha": 1, "llegada": 19, "salida": 20},
+            {"nombre": "C", "cancha": 2, "llegada": 20, "salida": 21},
+            {"nombre": "D", "cancha": 2, "llegada": 19, "salida": 21},
+            {"nombre": "", "cancha": 2, "llegada": 19, "salida": 21},
+        ]
+        redondeados, detallados, por_cancha = liquidar_jornada(CANCHAS, tramos)
+        self.assertEqual([p.nombre for p in redondeados], ["A", "B", "C", "D"])
+        self.assertEqual(sum(p.pago for p in redondeados), 18001)
+        self.assertAlmostEqual(sum(p.pago for p in detallados), 18001)
+        # A: media hora de la cancha 1, media de 19 a 20 y un tercio de 20 a 21.
+        self.assertAlmostEqual(detallados[0].pago, 2500 + 2000.25 + 1333.5)
+        self.assertEqual(detallados[0].tiempo, 3)
+        self.assertEqual(len(por_cancha[1][0]), 3)
+        self.assertEqual(sum(p.pago for p in por_cancha[2][0]), 8001)
+
+    def test_formas_de_pago_sobre_el_total_de_la_jornada(self):
+        tramos = [
+            {"nombre": "A", "cancha": 1, "llegada": 18, "salida": 20},
+            {
+                "nombre": "B",
+                "cancha": 1,
+                "llegada": 18,
+                "salida": 20,
+                "forma_pago": PAGO_BILLETERA,
+            },
+            {
+                "nombre": "A",
+                "cancha": 2,
+                "llegada": 20,
+                "salida": 21,
+                "forma_pago": PAGO_EFECTIVO,
+            },
+        ]
+        _, detallados, _ = liquidar_jornada(CANCHAS, tramos)
+        self.assertEqual(detallados[0].forma_pago, PAGO_EFECTIVO)
+        self.assertEqual(detallados[0].pago % 100, 0)
+        self.assertAlmostEqual(sum(p.pago for p in detallados), 18001)
+
+    def test_cancha_sin_jugadores(self):
+        tramos = [{"nombre": "A", "cancha": 1, "llegada": 18, "salida": 20}]
+        redondeados, _, por_cancha = liquidar_jornada(CANCHAS, tramos)
+        self.assertEqual(redondeados[0].pago, 10000)
+        self.assertEqual(por_cancha[2], ([], []))
+
+    def test_cancha_sin_jugadores_con_formas_de_pago(self):
+        tramos = [
+            {
+                "nombre": "A",
+                "cancha": 1,
+                "llegada": 18,
+                "salida": 20,
+                "forma_pago": PAGO_BILLETERA,
+            },
+            {"nombre": "B", "cancha": 1, "llegada": 18, "salida": 20},
+        ]
+        redondeados, detallados, _ = liquidar_jornada(CANCHAS, tramos)
+        self.assertEqual([p.pago for p in redondeados], [5000, 5000])
+        self.assertEqual([p.pago for p in detallados], [5000, 5000])
+
+    def test_errores(self):
+        with self.assertRaises(ValueError):
+            liquidar_jornada(
+                CANCHAS, [{"nombre": "A", "cancha": 9, "llegada": 18, "salida": 19}]
+            )
+        with self.assertRaises(ValueError):
+            liquidar_jornada(
+                CANCHAS,
+                [
+                    {"nombre": "A", "cancha": 1, "llegada": 18, "salida": 19.5},
+                    {"nombre": "A", "cancha": 2, "llegada": 19, "salida": 21},
+                ],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from split_paddle.flujo import liquidar_reservas
+from split_paddle.libreta import Libreta
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+from split_paddle.paralelo import liquidar_sesion
+
+
+def sesion(efectivo, billetera, monto=1000):
+    jugadores = [
+        {"nombre": n, "llegada": 18, "salida": 20, "forma_pago": PAGO_EFECTIVO}
+        for n in efectivo
+    ] + [
+        {"nombre": n, "llegada": 18, "salida": 20, "forma_pago": PAGO_BILLETERA}
+        for n in billetera
+    ]
+    return {
+        "hora_inicio": 18,
+        "hora_fin": 20,
+        "monto_total": monto,
+        "jugadores": jugadores,
+    }
+
+
+class TestLibreta(unittest.TestCase):
+    def test_efectivo_le_debe_a_billetera(self):
+        libreta = Libreta()
+        s = sesion(["A", "B"], ["C"], 960)
+        libreta.registrar_sesion(s, *liquidar_sesion(s)[:2])
+        # A y B pagan 300 en vez de 320; C pone los 40 que faltan.
+        self.assertEqual(libreta.saldos(), {"A": -20, "B": -20, "C": 40})
+        self.assertEqual(
+            [t.a_dict() for t in libreta.transferencias()],
+            [
+                {"deudor": "A", "acreedor": "C", "monto": 20},
+                {"deudor": "B", "acreedor": "C", "monto": 20},
+            ],
+        )
+
+    def test_se_acumula_entre_sesiones_y_se_compensa(self):
+        libreta = Libreta()
+        for s in [sesion(["A"], ["B"], 250), sesion(["B"], ["A"], 250)]:
+            libreta.registrar_sesion(s, *liquidar_sesion(s)[:2])
+        self.assertEqual(libreta.saldos(), {})
+        self.assertEqual(libreta.transferencias(), [])
+
+    def test_sin_forma_de_pago_no_anota_nada(self):
+        libreta = Libreta()
+        s = sesion(["A", "B", "C"], [])
+        for j in s["jugadores"]:
+            del j["forma_pago"]
+        libreta.registrar_sesion(s, *liquidar_sesion(s)[:2])
+        self.assertEqual(libreta.movimientos, 0)
+
+    def test_como_al_liquidar_y_transferencias_que_saldan_todo(self):
+        rng = random.Random(5)
+        nombres = [f"J{i}" for i in range(40)]
+        reservas = []
+        for _ in range(300):
+            elegidos = rng.sample(nombres, rng.randint(2, 8))
+            corte = rng.randint(1, len(elegidos) - 1)
+            reservas.append(
+                sesion(elegidos[:corte], elegidos[corte:], rng.randint(1000, 20000))
+            )
+        libreta = Libreta()
+        for _ in liquidar_reservas(reservas, al_liquidar=libreta.registrar_sesion):
+            pass
+        saldos = libreta.saldos()
+        self.assertAlmostEqual(sum(saldos.values()), 0)
+        transferencias = libreta.transferencias()
+        self.assertLess(len(transferencias), len(saldos))
+        for t in transferencias:
+            libreta.registrar_transferencia(t.deudor, t.acreedor, t.monto)
+        self.assertEqual(libreta.saldos(), {})
+
+    def test_pares_exactos_se_juntan_primero(self):
+        libreta = Libreta()
+        libreta.registrar_transferencia("A", "X", 10)
+        libreta.registrar_transferencia("B", "Y", 7)
+        libreta.registrar_transferencia("C", "Z", 3)
+        transferencias = libreta.transferencias()
+        self.assertEqual(len(transferencias), 3)
+        self.assertEqual(
+            {(t.deudor, t.acreedor) for t in transferencias},
+            {("X", "A"), ("Y", "B"), ("Z", "C")},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
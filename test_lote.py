@@ -0,0 +1,104 @@
+import json
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:  # numpy es opcional para el resto del proyecto
+    np = None
+
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO, calcular_pagos_por_intervalos
+from split_paddle.paralelo import liquidar_sesion
+from split_paddle.registros import TablaJugadores, a_json
+
+if np is not None:
+    from split_paddle.lote import (
+        calcular_pagos_en_lote,
+        columnas_desde_sesiones,
+        liquidar_sesiones_en_lote,
+    )
+
+
+def sesion_aleatoria(rng):
+    inicio = rng.choice([17, 17.5, 18, 18.25, 19])
+    fin = inicio + rng.choice([1, 1.5, 2, 3])
+    jugadores = []
+    for i in range(rng.randint(1, 14)):
+        llegada = inicio + rng.randint(-2, 12) * 0.25
+        salida = llegada + rng.randint(-1, 12) * 0.25
+        jugadores.append({"nombre": f"J{i}", "llegada": llegada, "salida": salida})
+    return {
+        "hora_inicio": inicio,
+        "hora_fin": fin,
+        "monto_total": rng.choice([10000, 12345.5, 999]),
+        "jugadores": jugadores,
+    }
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestCalcularPagosEnLote(unittest.TestCase):
+    def test_coincide_exactamente_con_la_funcion_escalar(self):
+        rng = random.Random(7)
+        sesiones = [sesion_aleatoria(rng) for _ in range(500)]
+        pagos, tiempos = calcular_pagos_en_lote(*columnas_desde_sesiones(sesiones))
+        fila = 0
+        for sesion in sesiones:
+            _, detalle = calcular_pagos_por_intervalos(
+                sesion["jugadores"],
+                sesion["monto_total"],
+                sesion["hora_inicio"],
+                sesion["hora_fin"],
+            )
+            for info in detalle:
+                self.assertEqual(pagos[fila], info["pago"])
+                self.assertEqual(tiempos[fila], info["tiempo"])
+                fila += 1
+        self.assertEqual(fila, len(pagos))
+
+    def test_ids_de_sesion_arbitrarios_y_jugadores_desordenados(self):
+        pagos, tiempos = calcular_pagos_en_lote(
+            sesion_ids=[30, 10],
+            inicios=[18, 20],
+            fines=[20, 21],
+            montos=[900, 500],
+            jugador_sesion=[10, 30, 10, 30],
+            llegadas=[20, 18, 20, 19],
+            salidas=[21, 20, 21, 20],
+        )
+        np.testing.assert_allclose(pagos, [250, 675, 250, 225])
+        np.testing.assert_allclose(tiempos, [1, 2, 1, 1])
+
+    def test_acepta_columnas_de_tabla_jugadores(self):
+        tabla = TablaJugadores()
+        tabla.agregar(0, "A", 18, 20)
+        tabla.agregar(0, "B", 19, 20)
+        pagos, _ = calcular_pagos_en_lote(
+            [0], [18], [20], [900], tabla.sesion, tabla.llegadas, tabla.salidas
+        )
+        np.testing.assert_allclose(pagos, [675, 225])
+
+    def test_sesion_desconocida(self):
+        with self.assertRaises(ValueError):
+            calcular_pagos_en_lote([1], [18], [20], [100], [2], [18], [20])
+
+    def test_sin_jugadores(self):
+        pagos, tiempos = calcular_pagos_en_lote([1], [18], [20], [100], [], [], [])
+        self.assertEqual(len(pagos), 0)
+        self.assertEqual(len(tiempos), 0)
+
+    def test_liquidar_sesiones_igual_que_de_a_una(self):
+        rng = random.Random(11)
+        sesiones = [sesion_aleatoria(rng) for _ in range(300)]
+        for i, sesion in enumerate(sesiones[:100]):
+            for j in sesion["jugadores"]:
+                j["forma_pago"] = PAGO_EFECTIVO if i % 2 else PAGO_BILLETERA
+        sesiones[0]["jugadores"].append({"nombre": "", "llegada": 18, "salida": 19})
+        sesiones[1]["jugadores"].append({"nombre": "X", "llegada": None, "salida": 19})
+        self.assertEqual(
+            json.dumps(liquidar_sesiones_en_lote(sesiones), default=a_json),
+            json.dumps([liquidar_sesion(s) for s in sesiones], default=a_json),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import contextlib
+import io
+import json
+import unittest
+import unittest.mock
+
+from split_paddle import medicion
+from split_paddle.cli import ejecutar
+from split_paddle.horas import parsear_hora
+from split_paddle.pagos import ajustar_pagos_y_redondear, calcular_pagos_por_intervalos
+
+JUGADORES = [
+    {"nombre": "A", "llegada": 18, "salida": 20},
+    {"nombre": "B", "llegada": 19, "salida": 20},
+]
+
+
+class TestMedicion(unittest.TestCase):
+    def setUp(self):
+        medicion.reiniciar()
+        self.addCleanup(medicion.desactivar)
+        self.addCleanup(medicion.reiniciar)
+
+    def test_apagada_no_registra_nada(self):
+        medicion.desactivar()
+        parsear_hora("18.30")
+        calcular_pagos_por_intervalos(JUGADORES, 900, 18, 20)
+        self.assertEqual(medicion.resumen(), {"etapas": {}, "contadores": {}})
+
+    def test_etapas_y_contadores(self):
+        medicion.activar()
+        parsear_hora("18.30")
+        parsear_hora(19)
+        _, detallados = calcular_pagos_por_intervalos(JUGADORES, 900, 18, 20)
+        ajustar_pagos_y_redondear(detallados, {"A": "Efectivo"}, 900)
+        resumen = medicion.resumen()
+        self.assertEqual(
+            set(resumen["etapas"]),
+            {
+                "parsear_hora",
+                "calcular",
+                "calcular.eventos",
+                "calcular.costo",
+                "calcular.orden",
+                "calcular.barrido",
+                "calcular.redondeo",
+                "calcular.salida",
+                "ajustar",
+            },
+        )
+        self.assertEqual(resumen["etapas"]["parsear_hora"]["llamadas"], 2)
+        etapa = resumen["etapas"]["calcular"]
+        self.assertGreaterEqual(etapa["segundos"], etapa["maximo"])
+        self.assertEqual(
+            resumen["contadores"], {"calcular.eventos": 4, "calcular.jugadores": 2}
+        )
+
+    def test_prometheus(self):
+        medicion.activar()
+        calcular_pagos_por_intervalos(JUGADORES, 900, 18, 20)
+        texto = medicion.a_prometheus()
+        self.assertIn("# TYPE split_paddle_etapa_segundos_total counter\n", texto)
+        self.assertIn(
+            'split_paddle_etapa_llamadas_total{etapa="calcular.barrido"} 1\n', texto
+        )
+        self.assertIn(
+            'split_paddle_contador_total{nombre="calcular.jugadores"} 2\n', texto
+        )
+
+    def test_cli_escribe_la_medicion_en_stderr(self):
+        entrada = io.StringIO(
+            json.dumps(
+                {
+                    "id": 1,
+                    "hora_inicio": 18,
+                    "hora_fin": 20,
+                    "monto_total": 900,
+                    "jugadores": JUGADORES,
+                }
+            )
+            + "\n"
+        )
+        salida, errores = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(salida), contextlib.redirect_stderr(errores):
+            with unittest.mock.patch("sys.stdin", entrada):
+                with self.assertRaises(SystemExit):
+                    ejecutar(["--entrada", "-", "--formato", "jsonl", "--medir"])
+        medido = json.loads(errores.getvalue().splitlines()[-1])
+        self.assertEqual(medido["etapas"]["calcular"]["llamadas"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+import unittest
+
+PESADOS = ["numpy", "streamlit", "concurrent.futures", "multiprocessing", "asyncio"]
+
+
+class TestPaquete(unittest.TestCase):
+    def test_importar_el_nucleo_y_la_cli_no_trae_dependencias_pesadas(self):
+        codigo = (
+            "import json, sys\n"
+            "import split_paddle, split_paddle.cli, split_paddle.cache_pagos\n"
+            f"print(json.dumps([m for m in {PESADOS!r} if m in sys.modules]))\n"
+        )
+        salida = subprocess.run(
+            [sys.executable, "-c", codigo], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(json.loads(salida.stdout), [])
+
+    def test_las_apps_se_importan_sin_streamlit(self):
+        import split_paddle_app_v2
+        import split_paddle_app_v3g
+
+        self.assertEqual(split_paddle_app_v3g.MIN_JUGADORES, 4)
+        self.assertTrue(callable(split_paddle_app_v2.main))
+
+    def test_reexporta_el_calculo(self):
+        from split_paddle import calcular_pagos_por_intervalos
+
+        pagos, _ = calcular_pagos_por_intervalos(
+            [
+                {"nombre": "A", "llegada": 18, "salida": 20},
+                {"nombre": "B", "llegada": 19, "salida": 20},
+            ],
+            900,
+            18,
+            20,
+        )
+        self.assertEqual([p.pago for p in pagos], [675, 225])
+
+
+if __name__ == "__main__":
+    unittest.main()
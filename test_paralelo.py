@@ -0,0 +1,95 @@
+import json
+import unittest
+
+from split_paddle.pagos import (
+    PAGO_BILLETERA,
+    PAGO_EFECTIVO,
+    calcular_pagos_por_intervalos,
+)
+from split_paddle.paralelo import (
+    ajustar_formas_de_pago,
+    liquidar_sesion,
+    liquidar_sesiones,
+)
+from split_paddle.registros import a_json
+
+
+def sesiones_de_prueba(cantidad):
+    sesiones = []
+    for i in range(cantidad):
+        jugadores = [
+            {"nombre": "A", "llegada": 18, "salida": 20, "forma_pago": PAGO_EFECTIVO},
+            {
+                "nombre": "B",
+                "llegada": 18,
+                "salida": 19.5,
+                "forma_pago": PAGO_BILLETERA,
+            },
+            {"nombre": "C", "llegada": 18, "salida": 20, "forma_pago": PAGO_EFECTIVO},
+            {"nombre": "D", "llegada": 18, "salida": 20, "forma_pago": PAGO_BILLETERA},
+            {"nombre": "E", "llegada": 18 + (i % 8) * 0.25, "salida": 20},
+        ]
+        sesiones.append(
+            {
+                "hora_inicio": 18,
+                "hora_fin": 20,
+                "monto_total": 10000 + i,
+                "jugadores": jugadores,
+            }
+        )
+    return sesiones
+
+
+class TestLiquidarSesiones(unittest.TestCase):
+    def test_paralelo_identico_al_serial(self):
+        sesiones = sesiones_de_prueba(50)
+        serial = [liquidar_sesion(s) for s in sesiones]
+        paralelo = liquidar_sesiones(sesiones, procesos=2, tamano_bloque=7)
+        self.assertEqual(
+            json.dumps(paralelo, default=a_json), json.dumps(serial, default=a_json)
+        )
+
+    def test_un_proceso_no_usa_pool(self):
+        sesiones = sesiones_de_prueba(3)
+        self.assertEqual(
+            liquidar_sesiones(iter(sesiones), procesos=1),
+            [liquidar_sesion(s) for s in sesiones],
+        )
+
+    def test_aplica_forma_de_pago(self):
+        redondeados, detallados, vuelto = liquidar_sesion(sesiones_de_prueba(1)[0])
+        self.assertEqual(sum(p["pago"] for p in redondeados), 10000)
+        self.assertEqual(detallados[0]["forma_pago"], PAGO_EFECTIVO)
+        self.assertEqual(detallados[0]["pago"] % 100, 0)
+        self.assertEqual(round(sum(p["pago"] for p in detallados), 2), 10000)
+        self.assertEqual(vuelto, 0)
+
+    def test_devuelve_el_vuelto(self):
+        sesiones = sesiones_de_prueba(20)
+        for sesion in sesiones[::2]:
+            for jugador in sesion["jugadores"]:
+                jugador["forma_pago"] = PAGO_EFECTIVO
+            sesion["monto_total"] = 10050
+        _, detallados, vuelto = liquidar_sesion(sesiones[0])
+        self.assertEqual(vuelto, 50)
+        self.assertEqual(sum(p["pago"] for p in detallados), 10100)
+        self.assertNotIn("vuelto", sesiones[0])
+        # En otros procesos también: el vuelto vuelve con el resultado.
+        paralelo = liquidar_sesiones(sesiones, procesos=2, tamano_bloque=3)
+        self.assertEqual([v for _, _, v in paralelo], [50, 0] * 10)
+        self.assertEqual(
+            json.dumps(paralelo, default=a_json),
+            json.dumps([liquidar_sesion(s) for s in sesiones], default=a_json),
+        )
+        _, detallados = calcular_pagos_por_intervalos(
+            sesion["jugadores"], 10050, 18, 20
+        )
+        self.assertEqual(ajustar_formas_de_pago({"jugadores": []}, detallados), 0)
+
+    def test_tamano_bloque_invalido(self):
+        with self.assertRaises(ValueError):
+            liquidar_sesiones([], tamano_bloque=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import unittest
+
+from split_paddle.pagos import calcular_pagos_por_intervalos, recorrer_intervalos
+from split_paddle.registros import Jugador, Pago, TablaJugadores, a_json, como_jugador
+
+
+class TestRegistros(unittest.TestCase):
+    def test_acceso_como_dict(self):
+        pago = Pago("A", 100, 1.5)
+        self.assertEqual(pago["pago"], 100)
+        self.assertEqual(pago.get("forma_pago", "Efectivo"), "Efectivo")
+        self.assertNotIn("forma_pago", pago)
+        pago["forma_pago"] = "Billetera"
+        self.assertEqual(pago.forma_pago, "Billetera")
+        self.assertIn("forma_pago", pago)
+        with self.assertRaises(KeyError):
+            pago["otro"] = 1
+        with self.assertRaises(KeyError):
+            pago["otro"]
+
+    def test_sin_dict_por_instancia(self):
+        self.assertFalse(hasattr(Jugador("A", 18, 20), "__dict__"))
+        with self.assertRaises(AttributeError):
+            Jugador("A", 18, 20).extra = 1
+
+    def test_igualdad_y_json(self):
+        pago = Pago("A", 100, 1.5)
+        self.assertEqual(pago, {"nombre": "A", "pago": 100, "tiempo": 1.5})
+        self.assertEqual(pago, Pago("A", 100, 1.5))
+        self.assertNotEqual(pago, Pago("A", 101, 1.5))
+        self.assertEqual(
+            json.loads(json.dumps([pago], default=a_json)),
+            [{"nombre": "A", "pago": 100, "tiempo": 1.5}],
+        )
+
+    def test_como_jugador(self):
+        jugador = Jugador("A", 18, 20)
+        self.assertIs(como_jugador(jugador), jugador)
+        desde_dict = como_jugador({"nombre": "B", "llegada": 18, "salida": 19})
+        self.assertEqual(desde_dict, Jugador("B", 18, 19))
+
+    def test_motor_acepta_registros_y_dicts(self):
+        con_registros = calcular_pagos_por_intervalos(
+            [Jugador("A", 18, 20), Jugador("B", 19, 20)], 900, 18, 20
+        )
+        con_dicts = calcular_pagos_por_intervalos(
+            [
+                {"nombre": "A", "llegada": 18, "salida": 20},
+                {"nombre": "B", "llegada": 19, "salida": 20},
+            ],
+            900,
+            18,
+            20,
+        )
+        self.assertEqual(con_registros, con_dicts)
+        self.assertIsInstance(con_registros[0][0], Pago)
+
+    def test_recorrer_intervalos(self):
+        intervalos = list(
+            recorrer_intervalos([Jugador("A", 17, 20), Jugador("B", 19, 19.5)], 18, 20)
+        )
+        self.assertEqual(
+            [(i.inicio, i.fin, i.jugadores) for i in intervalos],
+            [(18, 19, ("A",)), (19, 19.5, ("A", "B")), (19.5, 20, ("A",))],
+        )
+        self.assertEqual(intervalos[1].duracion, 0.5)
+
+    def test_tabla_jugadores(self):
+        tabla = TablaJugadores()
+        tabla.agregar(0, "A", 18, 20)
+        tabla.agregar(0, "B", 19, 20)
+        tabla.agregar(1, "C", 20, 21)
+        self.assertEqual(len(tabla), 3)
+        self.assertEqual(
+            list(tabla.jugadores(1)), [Jugador("B", 19, 20), Jugador("C", 20, 21)]
+        )
+        self.assertEqual(tabla.llegadas.itemsize, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
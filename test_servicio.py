@@ -0,0 +1,187 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from split_paddle import medicion, servicio
+from split_paddle.pagos import PAGO_EFECTIVO
+from split_paddle.paralelo import liquidar_sesion
+from split_paddle.registros import a_json
+from split_paddle.servicio import Servicio, iniciar, liquidar_lote, percentil
+from test_paralelo import sesiones_de_prueba
+
+
+async def pedir(puerto, metodo, ruta, cuerpo=b""):
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    escritor.write(
+        f"{metodo} {ruta} HTTP/1.1\r\nContent-Length: {len(cuerpo)}\r\n"
+        "Connection: close\r\n\r\n".encode() + cuerpo
+    )
+    await escritor.drain()
+    respuesta = await lector.read()
+    escritor.close()
+    encabezado, _, cuerpo = respuesta.partition(b"\r\n\r\n")
+    return int(encabezado.split()[1]), json.loads(cuerpo)
+
+
+class TestPercentil(unittest.TestCase):
+    def test_rango_mas_cercano(self):
+        valores = list(range(1, 101))
+        self.assertEqual(percentil(valores, 50), 50)
+        self.assertEqual(percentil(valores, 99), 99)
+        self.assertEqual(percentil([7], 99), 7)
+        self.assertIsNone(percentil([], 50))
+
+
+class TestLiquidarLote(unittest.TestCase):
+    def test_igual_a_liquidar_de_a_una(self):
+        sesiones = sesiones_de_prueba(20)
+        esperado = [
+            {"id": None, "pagos": redondeados, "detalle": detallados}
+            for redondeados, detallados, _ in map(liquidar_sesion, sesiones)
+        ]
+        self.assertEqual(
+            json.dumps(liquidar_lote(sesiones_de_prueba(20)), default=a_json),
+            json.dumps(esperado, default=a_json),
+        )
+
+    def test_sesion_invalida_no_arrastra_al_lote(self):
+        sesiones = sesiones_de_prueba(3)
+        del sesiones[1]["monto_total"]
+        respuestas = liquidar_lote(sesiones)
+        self.assertIn("pagos", respuestas[0])
+        self.assertIn("error", respuestas[1])
+        self.assertIn("pagos", respuestas[2])
+
+    def test_vuelto_en_la_respuesta(self):
+        sesiones = sesiones_de_prueba(3)
+        for sesion in sesiones:
+            sesion["monto_total"] = 10050
+            for jugador in sesion["jugadores"]:
+                jugador["forma_pago"] = PAGO_EFECTIVO
+        for respuesta in liquidar_lote(sesiones):
+            self.assertEqual(respuesta["vuelto"], 50)
+            self.assertEqual(sum(p.pago for p in respuesta["detalle"]), 10100)
+        # Con billetera cierra justo y no se informa vuelto.
+        self.assertNotIn("vuelto", liquidar_lote(sesiones_de_prueba(1))[0])
+
+    def test_desborde_no_arrastra_al_lote(self):
+        sesiones = sesiones_de_prueba(3)
+        sesiones[0]["monto_total"] = float("inf")
+        sesiones[2]["monto_total"] = 10**400
+        respuestas = liquidar_lote(sesiones)
+        self.assertIn("OverflowError", respuestas[0]["error"])
+        self.assertIn("pagos", respuestas[1])
+        self.assertIn("error", respuestas[2])
+
+    def test_avisa_si_se_liquido_de_a_una(self):
+        sesiones = sesiones_de_prueba(3)
+        self.assertFalse(servicio._liquidar_lote(sesiones)[1])
+        del sesiones[1]["monto_total"]
+        self.assertTrue(servicio._liquidar_lote(sesiones)[1])
+
+    def test_un_error_del_programa_no_se_tapa(self):
+        with mock.patch.object(
+            servicio, "liquidar_sesiones_en_lote", side_effect=RuntimeError("bug")
+        ):
+            with self.assertRaises(RuntimeError):
+                liquidar_lote(sesiones_de_prueba(3))
+
+
+class TestServicio(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.servidor, self.servicio = await iniciar(
+            puerto=0, servicio=Servicio(ventana=0.05)
+        )
+        self.puerto = self.servidor.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.servidor.close()
+        await self.servidor.wait_closed()
+
+    async def test_pedidos_concurrentes_se_agrupan(self):
+        sesiones = sesiones_de_prueba(10)
+        respuestas = await asyncio.gather(
+            *(
+                pedir(self.puerto, "POST", "/liquidar", json.dumps(s).encode())
+                for s in sesiones
+            )
+        )
+        for sesion, (codigo, cuerpo) in zip(sesiones, respuestas):
+            redondeados, detallados, _ = liquidar_sesion(sesion)
+            self.assertEqual(codigo, 200)
+            self.assertEqual(cuerpo["pagos"], [p.a_dict() for p in redondeados])
+            self.assertEqual(cuerpo["detalle"], [p.a_dict() for p in detallados])
+
+        codigo, metricas = await pedir(self.puerto, "GET", "/metricas")
+        self.assertEqual(codigo, 200)
+        self.assertEqual(metricas["pedidos"], 10)
+        self.assertLess(metricas["lotes"], 10)
+        self.assertLessEqual(metricas["p50_ms"], metricas["p99_ms"])
+        self.assertEqual(metricas["lotes_de_a_uno"], 0)
+
+    async def test_un_pedido_malo_no_tira_a_los_del_mismo_lote(self):
+        buena, mala = sesiones_de_prueba(2)
+        cuerpo_malo = json.dumps(mala).encode()
+        infinito = cuerpo_malo.replace(
+            f'"monto_total": {json.dumps(mala["monto_total"])}'.encode(),
+            b'"monto_total": 1e400',
+        )
+        self.assertIn(b"1e400", infinito)
+        mala["monto_total"] = 10**400  # pasa el JSON pero desborda al calcular
+        (bien, cuerpo), (mal, error), (desborde, error_calculo) = await asyncio.gather(
+            pedir(self.puerto, "POST", "/liquidar", json.dumps(buena).encode()),
+            pedir(self.puerto, "POST", "/liquidar", infinito),
+            pedir(self.puerto, "POST", "/liquidar", json.dumps(mala).encode()),
+        )
+        self.assertEqual(bien, 200)
+        self.assertEqual(
+            cuerpo["pagos"], [p.a_dict() for p in liquidar_sesion(buena)[0]]
+        )
+        self.assertEqual(mal, 400)
+        self.assertIn("fuera de rango", error["error"])
+        self.assertEqual(desborde, 400)
+        self.assertIn("Sesión inválida", error_calculo["error"])
+        _, metricas = await pedir(self.puerto, "GET", "/metricas")
+        self.assertEqual(metricas["lotes_de_a_uno"], 1)
+
+    async def test_metricas_prometheus(self):
+        medicion.activar()
+        self.addCleanup(medicion.desactivar)
+        await pedir(
+            self.puerto,
+            "POST",
+            "/liquidar",
+            json.dumps(sesiones_de_prueba(1)[0]).encode(),
+        )
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        escritor.write(
+            b"GET /metricas/prometheus HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        await escritor.drain()
+        respuesta = (await lector.read()).decode()
+        escritor.close()
+        self.assertIn("Content-Type: text/plain; version=0.0.4", respuesta)
+        self.assertIn("split_paddle_pedidos_total 1", respuesta)
+        self.assertIn("split_paddle_lotes_de_a_uno_total 0", respuesta)
+        self.assertIn('split_paddle_etapa_llamadas_total{etapa="calcular"}', respuesta)
+
+    async def test_errores(self):
+        codigo, cuerpo = await pedir(self.puerto, "POST", "/liquidar", b"{no")
+        self.assertEqual(codigo, 400)
+        self.assertIn("JSON inválido", cuerpo["error"])
+        codigo, _ = await pedir(self.puerto, "POST", "/liquidar", b'{"id": 1}')
+        self.assertEqual(codigo, 400)
+        codigo, cuerpo = await pedir(
+            self.puerto, "POST", "/liquidar", b'{"id": 1, "jugadores": []}'
+        )
+        self.assertEqual(codigo, 400)
+        self.assertEqual(cuerpo["id"], 1)
+        codigo, _ = await pedir(self.puerto, "GET", "/liquidar")
+        self.assertEqual(codigo, 405)
+        codigo, _ = await pedir(self.puerto, "GET", "/otra")
+        self.assertEqual(codigo, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 #Ejecutar con: python -m unittest test_split_paddle.py
 import unittest
-from split_paddle import calcular_pagos
+from split_paddle import calcular_pagos_por_intervalos
 
 
 class TestCalcularPagos(unittest.TestCase):
@@ -9,7 +9,7 @@ class TestCalcularPagos(unittest.TestCase):
         total = 1000
         inicio = 18
         fin = 20
-        pagos = calcular_pagos(jugadores, total, inicio, fin)
+        pagos, _ = calcular_pagos_por_intervalos(jugadores, total, inicio, fin)
         self.assertEqual(len(pagos), 1)
         self.assertEqual(pagos[0]["pago"], 1000)
         self.assertAlmostEqual(pagos[0]["tiempo"], 2.0)
@@ -22,7 +22,7 @@ class TestCalcularPagos(unittest.TestCase):
         total = 1000
         inicio = 18
         fin = 20
-        pagos = calcular_pagos(jugadores, total, inicio, fin)
+        pagos, _ = calcular_pagos_por_intervalos(jugadores, total, inicio, fin)
         self.assertEqual(pagos[0]["pago"] + pagos[1]["pago"], 1000)
         self.assertEqual(pagos[0]["pago"], 500)
         self.assertEqual(pagos[1]["pago"], 500)
@@ -35,11 +35,11 @@ class TestCalcularPagos(unittest.TestCase):
         total = 900
         inicio = 18
         fin = 20
-        pagos = calcular_pagos(jugadores, total, inicio, fin)
-        # A juega 2h, B juega 1h. Total 3h. A paga 2/3, B paga 1/3.
+        pagos, _ = calcular_pagos_por_intervalos(jugadores, total, inicio, fin)
+        # La primera hora (450) la paga A solo; la segunda se divide entre los dos.
         self.assertEqual(pagos[0]["pago"] + pagos[1]["pago"], 900)
-        self.assertEqual(pagos[0]["pago"], 600)
-        self.assertEqual(pagos[1]["pago"], 300)
+        self.assertEqual(pagos[0]["pago"], 675)
+        self.assertEqual(pagos[1]["pago"], 225)
 
     def test_jugador_fuera_de_rango(self):
         jugadores = [
@@ -49,11 +49,44 @@ class TestCalcularPagos(unittest.TestCase):
         total = 1000
         inicio = 18
         fin = 20
-        pagos = calcular_pagos(jugadores, total, inicio, fin)
+        pagos, _ = calcular_pagos_por_intervalos(jugadores, total, inicio, fin)
         # A no juega nada, B juega todo
         self.assertEqual(pagos[0]["pago"], 0)
         self.assertEqual(pagos[1]["pago"], 1000)
 
+    def test_redondeo_reparte_el_resto_sin_cargarlo_al_ultimo(self):
+        jugadores = [
+            {"nombre": n, "llegada": 18, "salida": 20} for n in ("A", "B", "C")
+        ]
+        pagos, _ = calcular_pagos_por_intervalos(jugadores, 1000, 18, 20)
+        self.assertEqual([p["pago"] for p in pagos], [334, 333, 333])
+
+    def test_llegada_mayor_que_salida_no_queda_en_cancha(self):
+        jugadores = [
+            {"nombre": "A", "llegada": 18, "salida": 20},
+            {"nombre": "B", "llegada": 19, "salida": 18.5},
+        ]
+        pagos, detalle = calcular_pagos_por_intervalos(jugadores, 1000, 18, 20)
+        self.assertEqual(pagos[0]["pago"], 1000)
+        self.assertEqual(pagos[1]["pago"], 0)
+        self.assertEqual(detalle[1]["tiempo"], 0)
+
+    def test_muchos_jugadores_rotando(self):
+        # Cada jugador entra media hora después del anterior y se queda 2 horas.
+        jugadores = [
+            {"nombre": f"J{i}", "llegada": 18 + i * 0.5, "salida": 20 + i * 0.5}
+            for i in range(200)
+        ]
+        inicio, fin = 18, 20 + 199 * 0.5
+        pagos, detalle = calcular_pagos_por_intervalos(jugadores, 100000, inicio, fin)
+        self.assertEqual(sum(p["pago"] for p in pagos), 100000)
+        self.assertAlmostEqual(sum(d["pago"] for d in detalle), 100000)
+        for d in detalle:
+            self.assertAlmostEqual(d["tiempo"], 2.0)
+        # Los del medio siempre comparten con otros 3, los de las puntas menos.
+        self.assertAlmostEqual(detalle[100]["pago"], 100000 / (fin - inicio) * 2 / 4)
+        self.assertGreater(detalle[0]["pago"], detalle[100]["pago"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import json
+import unittest
+
+from split_paddle.pagos import calcular_pagos_por_intervalos
+from split_paddle.paralelo import liquidar_sesion
+from split_paddle.registros import a_json
+from split_paddle.tarifas import costo_de_tarifa, franjas, tarifa_del_dia
+
+try:
+    from split_paddle.lote import liquidar_sesiones_en_lote
+except ImportError:  # numpy es opcional
+    liquidar_sesiones_en_lote = None
+
+PICO = [(0, 8000), (19, 12000)]
+JUGADORES = [
+    {"nombre": "A", "llegada": 18, "salida": 20},
+    {"nombre": "B", "llegada": 18, "salida": 19},
+    {"nombre": "C", "llegada": 19, "salida": 20},
+]
+
+
+class TestTarifas(unittest.TestCase):
+    def test_franjas_cortadas_al_horario(self):
+        self.assertEqual(franjas(PICO, 18, 20), [(18, 19, 8000), (19, 20, 12000)])
+        self.assertEqual(franjas(PICO, 19.5, 21), [(19.5, 21, 12000)])
+        self.assertEqual(franjas([(19, 12000), (21, 9000)], 18, 19), [(18, 19, 12000)])
+        self.assertEqual(costo_de_tarifa(PICO, 18, 20.5), 8000 + 1.5 * 12000)
+
+    def test_tarifas_invalidas(self):
+        for tarifa in ([], [(19, 1), (18, 1)], [(18, -1)]):
+            with self.assertRaises(ValueError):
+                franjas(tarifa, 18, 20)
+
+    def test_fin_de_semana(self):
+        tarifa = {"semana": PICO, "fin_de_semana": [(0, 15000)]}
+        self.assertEqual(tarifa_del_dia(tarifa, "2026-10-16"), PICO)  # viernes
+        self.assertEqual(tarifa_del_dia(tarifa, "2026-10-17"), [(0, 15000)])
+        self.assertIs(tarifa_del_dia(PICO), PICO)
+
+    def test_fin_de_semana_sin_fecha(self):
+        tarifa = {"semana": PICO, "fin_de_semana": [(0, 15000)]}
+        with self.assertRaises(ValueError):
+            tarifa_del_dia(tarifa)
+
+    def test_cada_tramo_a_su_precio(self):
+        redondeados, detallados = calcular_pagos_por_intervalos(
+            JUGADORES, None, 18, 20, PICO
+        )
+        self.assertEqual([p.pago for p in detallados], [10000, 4000, 6000])
+        self.assertEqual([p.pago for p in redondeados], [10000, 4000, 6000])
+
+    def test_con_monto_total_se_escalan_los_precios(self):
+        redondeados, detallados = calcular_pagos_por_intervalos(
+            JUGADORES, 10000, 18, 20, PICO
+        )
+        self.assertEqual([p.pago for p in detallados], [5000, 2000, 3000])
+        self.assertEqual(sum(p.pago for p in redondeados), 10000)
+
+    def test_tarifa_plana_igual_que_sin_tarifa(self):
+        jugadores = JUGADORES + [{"nombre": "D", "llegada": 18.25, "salida": 19.75}]
+        self.assertEqual(
+            calcular_pagos_por_intervalos(jugadores, None, 18, 20, [(0, 5000)]),
+            calcular_pagos_por_intervalos(jugadores, 10000, 18, 20),
+        )
+
+    def test_sin_monto_ni_tarifa(self):
+        with self.assertRaises(ValueError):
+            calcular_pagos_por_intervalos(JUGADORES, None, 18, 20)
+        with self.assertRaises(ValueError):
+            calcular_pagos_por_intervalos(JUGADORES, 1000, 18, 20, [(0, 0)])
+
+    def test_liquidar_sesion_elige_la_tarifa_por_fecha(self):
+        sesion = {
+            "hora_inicio": 18,
+            "hora_fin": 20,
+            "fecha": "2026-10-17",
+            "tarifa": {"semana": PICO, "fin_de_semana": [(0, 15000)]},
+            "jugadores": JUGADORES,
+        }
+        redondeados, _, _ = liquidar_sesion(sesion)
+        self.assertEqual([p.pago for p in redondeados], [15000, 7500, 7500])
+
+    @unittest.skipIf(liquidar_sesiones_en_lote is None, "numpy no está instalado")
+    def test_lote_con_y_sin_tarifa(self):
+        sesiones = [
+            {
+                "hora_inicio": 18,
+                "hora_fin": 20,
+                "monto_total": 900,
+                "jugadores": JUGADORES,
+            },
+            {"hora_inicio": 18, "hora_fin": 20, "tarifa": PICO, "jugadores": JUGADORES},
+            {
+                "hora_inicio": 17,
+                "hora_fin": 20,
+                "monto_total": 700,
+                "jugadores": JUGADORES,
+            },
+        ]
+        self.assertEqual(
+            json.dumps(liquidar_sesiones_en_lote(sesiones), default=a_json),
+            json.dumps([liquidar_sesion(s) for s in sesiones], default=a_json),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from split_paddle.pagos import PAGO_BILLETERA, PAGO_EFECTIVO
+from split_paddle.registros import Pago
+from split_paddle.tarjetas import encabezado_jugador, html_tarjetas, tarjetas_pagos
+
+
+class TestTarjetas(unittest.TestCase):
+    def test_sin_pagos(self):
+        self.assertEqual(tarjetas_pagos([]), [])
+
+    def test_una_tarjeta_por_jugador_con_marcas(self):
+        pagos = [
+            Pago("Ana", 4000, 2.0, PAGO_EFECTIVO),
+            Pago("Beto", 1234.567, 0.75, PAGO_BILLETERA),
+        ]
+        ana, beto = tarjetas_pagos(pagos)
+        self.assertIn("Ana", ana)
+        self.assertIn("(más tiempo)", ana)
+        self.assertIn("<b>$4,000</b>", ana)
+        self.assertIn("2h 00m", ana)
+        self.assertIn("border:2.5px solid var(--primary-color)", ana)
+        self.assertIn("(menos tiempo)", beto)
+        self.assertIn("<b>$1,234.57</b>", beto)
+        self.assertIn("0h 45m", beto)
+
+    def test_forma_de_pago_por_defecto(self):
+        pagos = [{"nombre": "Ana", "pago": 100, "tiempo": 1.0}]
+        self.assertIn("💵", tarjetas_pagos(pagos)[0])
+        self.assertIn("📲", tarjetas_pagos(pagos, forma_pago_defecto=PAGO_BILLETERA)[0])
+
+    def test_solo_los_cuatro_primeros_son_iniciales(self):
+        pagos = [Pago(f"J{i}", 100, 1.0, PAGO_EFECTIVO) for i in range(6)]
+        tarjetas = tarjetas_pagos(pagos)
+        self.assertTrue(all("2.5px solid" in t for t in tarjetas[:4]))
+        self.assertTrue(all("1.5px solid" in t for t in tarjetas[4:]))
+
+    def test_todas_las_tarjetas_en_un_solo_bloque(self):
+        pagos = [Pago(f"J{i}", 100 * i, 1.0 + i / 4, PAGO_EFECTIVO) for i in range(12)]
+        html = html_tarjetas(pagos)
+        self.assertEqual(html, "".join(tarjetas_pagos(pagos)))
+        # Sin saltos de línea: markdown no corta el bloque HTML a la mitad.
+        self.assertNotIn("\n", html)
+        self.assertEqual(html.count("Tiempo:"), 12)
+
+    def test_el_nombre_se_escapa(self):
+        html = html_tarjetas([Pago("<b>Ana</b> & Co", 100, 1.0, PAGO_EFECTIVO)])
+        self.assertIn("&lt;b&gt;Ana&lt;/b&gt; &amp; Co", html)
+
+    def test_encabezado_jugador(self):
+        inicial = encabezado_jugador(1, True)
+        self.assertIn("⭐️ Jugador #1", inicial)
+        self.assertIn("2.5px solid", inicial)
+        self.assertIs(encabezado_jugador(1, True), inicial)
+        self.assertIn("1.5px solid", encabezado_jugador(5, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
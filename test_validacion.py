@@ -0,0 +1,165 @@
+import io
+import unittest
+
+from split_paddle.flujo import leer_reservas_csv
+from split_paddle.registros import Jugador
+from split_paddle.validacion import (
+    AVISO,
+    ERROR,
+    hay_errores,
+    validar_jugadores,
+    validar_sesiones,
+)
+
+
+def jugador(nombre, llegada=18, salida=20):
+    return {"nombre": nombre, "llegada": llegada, "salida": salida}
+
+
+def codigos(problemas):
+    return [(p.nivel, p.codigo, p.jugador) for p in problemas]
+
+
+class TestValidarJugadores(unittest.TestCase):
+    def test_todo_bien(self):
+        jugadores = [jugador("A"), jugador("B"), jugador("", None, None)]
+        validos, problemas = validar_jugadores(jugadores, 18, 20, minimo=2)
+        self.assertEqual(problemas, [])
+        self.assertEqual(validos, [jugador("A"), jugador("B")])
+
+    def test_junta_todos_los_problemas(self):
+        jugadores = [
+            jugador("Ana"),
+            jugador(" ana "),
+            jugador("Beto", 18.5),
+            jugador("Caro", None),
+            jugador("Dani", 19, 19),
+            jugador("Eli", 17, 21),
+            jugador("Fede", 20.5, 21),
+            Jugador("Gabi", 18, 20),
+        ]
+        validos, problemas = validar_jugadores(jugadores, 18, 20, 10, iniciales=3)
+        self.assertEqual(
+            codigos(problemas),
+            [
+                (ERROR, "pocos_jugadores", None),
+                (ERROR, "nombre_repetido", "Ana"),
+                (ERROR, "inicial_tarde", "Beto"),
+                (ERROR, "hora_invalida", "Caro"),
+                (ERROR, "llegada_despues_de_salida", "Dani"),
+                (AVISO, "llegada_ajustada", "Eli"),
+                (AVISO, "salida_ajustada", "Eli"),
+                (AVISO, "salida_ajustada", "Fede"),
+                (ERROR, "fuera_de_horario", "Fede"),
+            ],
+        )
+        self.assertEqual(problemas[1].mensaje, "No se permiten nombres repetidos: Ana.")
+        self.assertTrue(hay_errores(problemas))
+        self.assertEqual((validos[5]["llegada"], validos[5]["salida"]), (18, 20))
+        self.assertEqual(jugadores[5]["llegada"], 17)  # no toca los originales
+        self.assertEqual(validos[7]["nombre"], "Gabi")
+
+    def test_horario_de_cancha_invalido(self):
+        _, problemas = validar_jugadores([jugador("A", 17, 21)], 20, 18)
+        self.assertEqual(codigos(problemas), [(ERROR, "horario_cancha", None)])
+
+    def test_solo_avisos_no_son_errores(self):
+        _, problemas = validar_jugadores([jugador("A", 17, 19)], 18, 20)
+        self.assertEqual(codigos(problemas), [(AVISO, "llegada_ajustada", "A")])
+        self.assertFalse(hay_errores(problemas))
+
+    def test_muchos_nombres_repetidos(self):
+        jugadores = [jugador(f"J{i % 5000}") for i in range(20000)]
+        _, problemas = validar_jugadores(jugadores, 18, 20)
+        self.assertEqual(len(problemas), 5000)
+
+
+class TestValidarSesiones(unittest.TestCase):
+    def test_separa_las_buenas_de_las_malas(self):
+        csv = (
+            "reserva,hora_inicio,hora_fin,monto_total,nombre,llegada,salida\n"
+            "1,18,20,900,A,17,20\n"
+            "1,18,20,900,B,18,20\n"
+            "2,18,20,-5,C,18,20\n"
+            "3,18,20,900,D,18,tarde\n"
+            "4,18,20,900,E,19,18\n"
+        )
+        sesiones = list(leer_reservas_csv(io.StringIO(csv)))
+        sesiones.append({**sesiones[0]})
+        sesiones.append({"hora_inicio": 18, "hora_fin": 20, "jugadores": []})
+        validas, problemas = validar_sesiones(sesiones)
+        self.assertEqual([s["id"] for s in validas], ["1"])
+        self.assertEqual(validas[0]["jugadores"][0]["llegada"], 18)
+        self.assertEqual(sesiones[0]["jugadores"][0]["llegada"], 17)
+        self.assertEqual(
+            [(p.sesion, p.nivel, p.codigo) for p in problemas],
+            [
+                ("1", AVISO, "llegada_ajustada"),
+                ("2", ERROR, "monto_negativo"),
+                ("3", ERROR, "lectura"),
+                ("4", ERROR, "llegada_despues_de_salida"),
+                ("1", ERROR, "sesion_repetida"),
+                ("1", AVISO, "llegada_ajustada"),
+                (6, ERROR, "sin_monto"),
+            ],
+        )
+
+    def test_tarifa_de_fin_de_semana_sin_fecha(self):
+        sesion = {
+            "hora_inicio": 18,
+            "hora_fin": 20,
+            "tarifa": {"semana": [(0, 8000)], "fin_de_semana": [(0, 12000)]},
+            "jugadores": [jugador("A")],
+        }
+        validas, problemas = validar_sesiones(
+            [sesion, {**sesion, "id": 2, "fecha": "2026-10-17"}]
+        )
+        self.assertEqual([s["id"] for s in validas], [2])
+        self.assertEqual(codigos(problemas), [(ERROR, "sin_fecha", None)])
+
+    def test_lo_mal_armado_no_corta_la_validacion(self):
+        buena = {
+            "id": "ok",
+            "hora_inicio": 18,
+            "hora_fin": 20,
+            "monto_total": 900,
+            "jugadores": [jugador("A")],
+        }
+        sesiones = [
+            {**buena, "id": "sin_nombre", "jugadores": [{"llegada": 18, "salida": 20}]},
+            {**buena, "id": "hora_texto", "jugadores": [jugador("B", "18:00")]},
+            {**buena, "id": "inicio_texto", "hora_inicio": "18"},
+            {**buena, "id": ["no", "hasheable"]},
+            {**buena, "id": "jugador_raro", "jugadores": [None, jugador("C")]},
+            {**buena, "id": "jugadores_raros", "jugadores": "A, B"},
+            {**buena, "id": "monto_texto", "monto_total": "900"},
+            {**buena, "id": "nombre_numero", "jugadores": [jugador(7)]},
+            None,
+            [1, 2],
+            buena,
+        ]
+        validas, problemas = validar_sesiones(sesiones)
+        self.assertEqual([s["id"] for s in validas], ["ok"])
+        self.assertEqual(
+            [(p.sesion, p.codigo, p.jugador) for p in problemas],
+            [
+                ("sin_nombre", "formato", None),
+                ("hora_texto", "formato", "B"),
+                ("inicio_texto", "formato", None),
+                (4, "formato", None),
+                ("jugador_raro", "formato", None),
+                ("jugadores_raros", "formato", None),
+                ("monto_texto", "formato", None),
+                ("nombre_numero", "formato", None),
+                (9, "formato", None),
+                (10, "formato", None),
+            ],
+        )
+        self.assertTrue(all(p.nivel == ERROR for p in problemas))
+        self.assertEqual(
+            problemas[1].mensaje, "La llegada de B no es un número ('18:00')."
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()